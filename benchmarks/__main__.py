@@ -0,0 +1,117 @@
+"""
+Run the benchmarks from the command line.
+
+Run the benchmarks and write the results to a file::
+
+    python -m benchmarks --output results.json
+
+Run the benchmarks and compare them against the stored baseline, exiting
+with a non-zero status if any regressed::
+
+    python -m benchmarks --compare benchmarks/baseline.json
+
+Results from a different Python version or platform than the baseline are
+not compared, as timings do not carry over between them. Record a baseline
+on the machine to compare on first::
+
+    python -m benchmarks --output baseline.json
+
+Measure the memory of a million lines, bare and with their derived values
+cached, and the cost of the first and later reads of their slope and
+length::
+
+    python -m benchmarks line_construct line_construct_cached line_slope \
+        line_slope_cached line_length line_length_cached --sizes 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks import suite
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help=f"the benchmarks to run, from: {', '.join(suite.BENCHMARKS)}"
+        " (default: all)",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=suite.SIZES,
+        help="the input sizes to measure at",
+    )
+    parser.add_argument("--repeats", type=int, default=suite.REPEATS)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="the JSON file to write the results to",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        metavar="BASELINE",
+        help="the JSON file of results to check for regressions against",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=suite.THRESHOLD,
+        help="the fractional slowdown or memory growth that counts as a "
+        "regression",
+    )
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(suite.BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = suite.run(tuple(args.sizes), args.names, args.repeats)
+    for name, sizes in results["results"].items():
+        for size, metrics in sizes.items():
+            print(
+                f"{name:<20} {size:>10}"
+                f" {metrics['seconds'] * 1e3:>12.3f} ms"
+                f" {metrics['peak_bytes'] / 1024:>12.1f} KiB"
+                + (
+                    f" {metrics['output_bytes'] / 1024:>12.1f} KiB out"
+                    if "output_bytes" in metrics
+                    else ""
+                )
+            )
+    if args.output:
+        suite.save(results, args.output)
+
+    if args.compare:
+        baseline = suite.load(args.compare)
+        differences = suite.environment_differences(results, baseline)
+        for difference in differences.values():
+            print(f"NOT COMPARED {difference}", file=sys.stderr)
+        if differences:
+            print(
+                "Record a baseline in this environment with --output to"
+                " compare against.",
+                file=sys.stderr,
+            )
+            return 2
+
+        regressions = suite.compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression.name} at {regression.size}:"
+                f" {regression.metric} {regression.baseline:.6g}"
+                f" -> {regression.current:.6g} ({regression.ratio:.2f}x)"
+            )
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
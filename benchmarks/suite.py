@@ -0,0 +1,438 @@
+"""
+Time and memory benchmarks for the hot paths of the library.
+
+Each benchmark has a setup, which builds its input outside of the
+measurements, and a body, which is measured. The body is timed over several
+repeats, keeping the fastest, and run once more under ``tracemalloc`` to
+record its peak memory. A body that serialises its input also records the
+size of what it returns.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import math
+import platform
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from geometry.encoding import decode_points, encode_points
+from geometry.lazy import lazy
+from geometry.line import Line
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.predicates import incircle, orient2d
+
+SIZES = (1_000, 10_000, 100_000)
+REPEATS = 5
+THRESHOLD = 0.25
+
+
+class Benchmark(NamedTuple):
+    """
+    A benchmark: a setup that builds an input of a given size, and a body
+    that is measured against that input.
+    """
+
+    setup: Callable[[int], Any]
+    body: Callable[[Any], Any]
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    setup: Callable[[int], Any],
+) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
+    """
+    Register a function as the body of a benchmark.
+
+    :param name: The name to record the benchmark under.
+    :param setup: The function that builds the input for a given size.
+
+    :return: A decorator that registers the body.
+    """
+
+    def register(body: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        BENCHMARKS[name] = Benchmark(setup, body)
+        return body
+
+    return register
+
+
+def _points(size: int, seed: int = 0) -> list[Point]:
+    rng = random.Random(seed)  # noqa: S311
+    return [
+        Point(rng.uniform(-1e3, 1e3), rng.uniform(-1e3, 1e3))
+        for _ in range(size)
+    ]
+
+
+def _point_array(size: int) -> PointArray:
+    return PointArray.from_points(_points(size))
+
+
+def _route(size: int) -> list[Point]:
+    # A random walk with about a metre between points, at 5 decimal places
+    rng = random.Random(0)  # noqa: S311
+    x, y, route = -0.1, 51.5, []
+    for _ in range(size):
+        x += rng.uniform(-1e-4, 1e-4)
+        y += rng.uniform(-1e-4, 1e-4)
+        route.append(Point(round(x, 5), round(y, 5)))
+    return route
+
+
+def _encoded_route(size: int) -> bytes:
+    return encode_points(_route(size))
+
+
+def _json_route(size: int) -> str:
+    return json.dumps(_route(size))
+
+
+def _point_pairs(size: int) -> list[tuple[Point, Point]]:
+    return list(zip(_points(size), _points(size, seed=1), strict=True))
+
+
+def _point_triples(size: int) -> list[tuple[Point, Point, Point]]:
+    return list(
+        zip(
+            _points(size),
+            _points(size, seed=1),
+            _points(size, seed=2),
+            strict=True,
+        )
+    )
+
+
+def _collinear_triples(size: int) -> list[tuple[Point, Point, Point]]:
+    # The third point is rounded onto the line, so most triples are too close
+    # to collinear for floating point to decide
+    return [
+        (a, b, Point(a.x + (b.x - a.x) / 3, a.y + (b.y - a.y) / 3))
+        for a, b in _point_pairs(size)
+    ]
+
+
+def _point_quadruples(size: int) -> list[tuple[Point, Point, Point, Point]]:
+    return [
+        (*triple, point)
+        for triple, point in zip(
+            _point_triples(size), _points(size, seed=3), strict=True
+        )
+    ]
+
+
+def _lines(size: int) -> list[Line]:
+    return [Line(start, end) for start, end in _point_pairs(size)]
+
+
+def _cached_lines(size: int) -> list[Line]:
+    lines = _lines(size)
+    for line in lines:
+        line.bounding_box  # noqa: B018
+        line.intercept  # noqa: B018
+        line.length  # noqa: B018
+    return lines
+
+
+@benchmark("point_add", _point_pairs)
+def _point_add(pairs: list[tuple[Point, Point]]) -> list[Point]:
+    return [point + other for point, other in pairs]
+
+
+@benchmark("point_multiply", _points)
+def _point_multiply(points: list[Point]) -> list[Point]:
+    return [point * 2.5 for point in points]
+
+
+@benchmark("point_rotate", _points)
+def _point_rotate(points: list[Point]) -> list[Point]:
+    around = Point(1, 2)
+    return [point.rotate(by=0.5, around=around) for point in points]
+
+
+@benchmark("point_chain", _points)
+def _point_chain(points: list[Point]) -> list[Point]:
+    centre, around, scale, shift = Point(1, 2), Point(3, 4), Point(2, 0.5), 7
+    return [
+        ((point - centre).rotate(by=0.5, around=around) * scale) + shift
+        for point in points
+    ]
+
+
+@benchmark("point_chain_lazy", _point_array)
+def _point_chain_lazy(points: PointArray) -> PointArray:
+    centre, around, scale, shift = Point(1, 2), Point(3, 4), Point(2, 0.5), 7
+    expression = (
+        (lazy(points) - centre).rotate(by=0.5, around=around) * scale
+    ) + shift
+    return expression.compute()
+
+
+@benchmark("line_construct", _point_pairs)
+def _line_construct(pairs: list[tuple[Point, Point]]) -> list[Line]:
+    return [Line(start, end) for start, end in pairs]
+
+
+@benchmark("line_construct_cached", _point_pairs)
+def _line_construct_cached(pairs: list[tuple[Point, Point]]) -> list[Line]:
+    # The peak memory divided by the size is the memory of a line with every
+    # derived value cached, against ``line_construct`` for a bare line
+    lines = [Line(start, end) for start, end in pairs]
+    for line in lines:
+        line.bounding_box  # noqa: B018
+        line.intercept  # noqa: B018
+        line.length  # noqa: B018
+    return lines
+
+
+@benchmark("line_length", _lines)
+def _line_length(lines: list[Line]) -> list[float]:
+    return [line.length for line in lines]
+
+
+@benchmark("line_length_cached", _cached_lines)
+def _line_length_cached(lines: list[Line]) -> list[float]:
+    return [line.length for line in lines]
+
+
+@benchmark("line_slope", _lines)
+def _line_slope(lines: list[Line]) -> list[float]:
+    return [line.slope for line in lines]
+
+
+@benchmark("line_slope_cached", _cached_lines)
+def _line_slope_cached(lines: list[Line]) -> list[float]:
+    return [line.slope for line in lines]
+
+
+@benchmark("line_intercept", _lines)
+def _line_intercept(lines: list[Line]) -> list[float | None]:
+    return [line.intercept for line in lines]
+
+
+@benchmark("line_contains", _lines)
+def _line_contains(lines: list[Line]) -> list[bool]:
+    point = Point(0, 0)
+    return [line.contains(point) for line in lines]
+
+
+@benchmark("line_rotate", _lines)
+def _line_rotate(lines: list[Line]) -> list[Line]:
+    return [line.rotate(0.5) for line in lines]
+
+
+@benchmark("orient2d_float", _point_triples)
+def _orient2d_float(triples: list[tuple[Point, Point, Point]]) -> list[bool]:
+    # The unfiltered floating point determinant, to compare orient2d against
+    return [
+        (a.x - c.x) * (b.y - c.y) - (a.y - c.y) * (b.x - c.x) > 0
+        for a, b, c in triples
+    ]
+
+
+@benchmark("orient2d", _point_triples)
+def _orient2d(triples: list[tuple[Point, Point, Point]]) -> list[int]:
+    return [orient2d(a, b, c) for a, b, c in triples]
+
+
+@benchmark("orient2d_degenerate", _collinear_triples)
+def _orient2d_degenerate(
+    triples: list[tuple[Point, Point, Point]],
+) -> list[int]:
+    return [orient2d(a, b, c) for a, b, c in triples]
+
+
+@benchmark("incircle", _point_quadruples)
+def _incircle(quadruples: list[tuple[Point, Point, Point, Point]]) -> list[int]:
+    return [incircle(a, b, c, d) for a, b, c, d in quadruples]
+
+
+@benchmark("encode_points", _route)
+def _encode_points(route: list[Point]) -> bytes:
+    return encode_points(route)
+
+
+@benchmark("encode_points_json", _route)
+def _encode_points_json(route: list[Point]) -> str:
+    # The naive serialisation to compare the encoding against
+    return json.dumps(route)
+
+
+@benchmark("decode_points", _encoded_route)
+def _decode_points(data: bytes) -> PointArray:
+    return decode_points(data)
+
+
+@benchmark("decode_points_json", _json_route)
+def _decode_points_json(data: str) -> PointArray:
+    return PointArray.from_points(json.loads(data))
+
+
+def measure(bench: Benchmark, size: int, repeats: int = REPEATS) -> dict:
+    """
+    Measure a benchmark at a size.
+
+    The setup runs before every repeat so that nothing cached by one repeat
+    (such as a line's slope) speeds up the next.
+
+    :param bench: The benchmark to measure.
+    :param size: The size of the input to build.
+    :param repeats: The number of times to time the body.
+
+    :return: The fastest time in seconds and the peak memory in bytes, and
+        the size in bytes of the output if the body returns bytes or text.
+    """
+    timings = []
+    for _ in range(repeats):
+        data = bench.setup(size)
+        gc.collect()
+        start = time.perf_counter()
+        output = bench.body(data)
+        timings.append(time.perf_counter() - start)
+
+    data = bench.setup(size)
+    gc.collect()
+    tracemalloc.start()
+    bench.body(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    metrics = {"seconds": min(timings), "peak_bytes": peak}
+    if isinstance(output, str):
+        metrics["output_bytes"] = len(output.encode("utf-8"))
+    elif isinstance(output, bytes):
+        metrics["output_bytes"] = len(output)
+
+    return metrics
+
+
+def run(
+    sizes: tuple[int, ...] = SIZES,
+    names: list[str] | None = None,
+    repeats: int = REPEATS,
+) -> dict:
+    """
+    Run the benchmarks.
+
+    :param sizes: The sizes of input to measure each benchmark at.
+    :param names: The benchmarks to run. Defaults to all of them.
+    :param repeats: The number of times to time each benchmark.
+
+    :return: The results, keyed by benchmark name and then by size.
+    """
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {
+            name: {
+                str(size): measure(BENCHMARKS[name], size, repeats)
+                for size in sizes
+            }
+            for name in names or BENCHMARKS
+        },
+    }
+
+
+def environment_differences(current: dict, baseline: dict) -> dict[str, str]:
+    """
+    Describe how the environments that two sets of results were measured in
+    differ.
+
+    Python versions are compared by their major and minor versions, as
+    patch releases do not change performance enough to matter.
+
+    :param current: The results to check.
+    :param baseline: The results to check against.
+
+    :return: A message for each of ``"python"`` and ``"platform"`` that
+        differ.
+    """
+    differences = {}
+    if _minor_version(current["python"]) != _minor_version(baseline["python"]):
+        differences["python"] = (
+            f"measured on Python {current['python']}, but the baseline was"
+            f" measured on Python {baseline['python']}"
+        )
+    if current["platform"] != baseline["platform"]:
+        differences["platform"] = (
+            f"measured on {current['platform']}, but the baseline was"
+            f" measured on {baseline['platform']}"
+        )
+
+    return differences
+
+
+def _minor_version(version: str) -> str:
+    return ".".join(version.split(".")[:2])
+
+
+class Regression(NamedTuple):
+    """
+    A measurement that got worse than its baseline by more than the threshold.
+    """
+
+    name: str
+    size: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else math.inf
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    threshold: float = THRESHOLD,
+) -> list[Regression]:
+    """
+    Compare results against a baseline.
+
+    Only the benchmarks and sizes that appear in both are compared.
+
+    :param current: The results to check.
+    :param baseline: The results to check against.
+    :param threshold: The fraction by which a measurement can exceed its
+        baseline before it counts as a regression.
+
+    :return: The measurements that regressed.
+    """
+    regressions = []
+    for name, sizes in current["results"].items():
+        for size, metrics in sizes.items():
+            expected = baseline["results"].get(name, {}).get(size)
+            if expected is None:
+                continue
+            regressions.extend(
+                Regression(name, size, metric, expected[metric], value)
+                for metric, value in metrics.items()
+                if metric in expected
+                and value > expected[metric] * (1 + threshold)
+            )
+
+    return regressions
+
+
+def load(path: Path) -> dict:
+    """
+    Load results from a JSON file.
+    """
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save(results: dict, path: Path) -> None:
+    """
+    Save results to a JSON file.
+    """
+    path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
@@ -2,10 +2,125 @@
 Two-dimensional geometry library.
 """
 
+from geometry.affine import Affine2D
+from geometry.binary import (
+    MappedLines,
+    MappedPoints,
+    read_lines,
+    read_points,
+    write_lines,
+    write_points,
+)
+from geometry.box import BoundingBox, clip_interval
+from geometry.bvh import BVH
+from geometry.clip import clip
+from geometry.curves import (
+    hilbert_key,
+    hilbert_keys,
+    morton_key,
+    morton_keys,
+    partition,
+    spatial_sort,
+)
+from geometry.encoding import (
+    decode_point_batches,
+    decode_points,
+    decode_points_stream,
+    encode_points,
+)
+from geometry.hull import convex_hull, merge_hulls, streaming_convex_hull
+from geometry.interning import PointPool, PoolStats
+from geometry.intersection import Intersection, intersections
+from geometry.kdtree import KDTree, Neighbour
+from geometry.lazy import Expression, lazy
 from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.parallel import ParallelExecutor
 from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.polygon import Polygon
+from geometry.polyline import Polyline
+from geometry.predicates import incircle, orient2d
+from geometry.profiling import Stats, profile
+from geometry.proximity import Pair, closest_pair, pairs_within
+from geometry.quantised import Grid, QuantisedArray, QuantisedPoint
+from geometry.rtree import RTree
+from geometry.simplify import (
+    douglas_peucker,
+    simplify_stream,
+    visvalingam_whyatt,
+)
+from geometry.text import (
+    line_batches,
+    point_batches,
+    read_csv_lines,
+    read_csv_points,
+    read_wkt,
+    write_csv_lines,
+    write_csv_points,
+    write_wkt,
+)
 
 __all__ = [
+    "BVH",
+    "Affine2D",
+    "BoundingBox",
+    "Expression",
+    "Grid",
+    "Intersection",
+    "KDTree",
     "Line",
+    "LineArray",
+    "MappedLines",
+    "MappedPoints",
+    "Neighbour",
+    "Pair",
+    "ParallelExecutor",
     "Point",
+    "PointArray",
+    "PointPool",
+    "Polygon",
+    "Polyline",
+    "PoolStats",
+    "QuantisedArray",
+    "QuantisedPoint",
+    "RTree",
+    "Stats",
+    "clip",
+    "clip_interval",
+    "closest_pair",
+    "convex_hull",
+    "decode_point_batches",
+    "decode_points",
+    "decode_points_stream",
+    "douglas_peucker",
+    "encode_points",
+    "hilbert_key",
+    "hilbert_keys",
+    "incircle",
+    "intersections",
+    "lazy",
+    "line_batches",
+    "merge_hulls",
+    "morton_key",
+    "morton_keys",
+    "orient2d",
+    "pairs_within",
+    "partition",
+    "point_batches",
+    "profile",
+    "read_csv_lines",
+    "read_csv_points",
+    "read_lines",
+    "read_points",
+    "read_wkt",
+    "simplify_stream",
+    "spatial_sort",
+    "streaming_convex_hull",
+    "visvalingam_whyatt",
+    "write_csv_lines",
+    "write_csv_points",
+    "write_lines",
+    "write_points",
+    "write_wkt",
 ]
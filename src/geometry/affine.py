@@ -0,0 +1,143 @@
+"""
+An affine transformation maps points onto points while preserving lines.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from geometry.point import Number, Point
+
+
+class Affine2D(NamedTuple):
+    """
+    An affine transformation in 2-dimensional space.
+
+    The transformation maps the point ``(x, y)`` onto the point
+    ``(a*x + b*y + c, d*x + e*y + f)``, which is the matrix::
+
+        | a  b  c |
+        | d  e  f |
+        | 0  0  1 |
+
+    Transformations are composed with ``@``, where ``first @ second`` applies
+    ``second`` and then ``first``. Composing transformations before applying
+    them means that each point is only visited once, however many steps there
+    are.
+    """
+
+    a: Number = 1
+    b: Number = 0
+    c: Number = 0
+    d: Number = 0
+    e: Number = 1
+    f: Number = 0
+
+    @classmethod
+    def identity(cls) -> Affine2D:
+        """
+        Return the transformation that leaves points unchanged.
+        """
+        return cls()
+
+    @classmethod
+    def translation(cls, by: Number | Point) -> Affine2D:
+        """
+        Return the transformation that moves points by an offset.
+
+        :param by: The point or number to add to each point.
+
+        :return: A new transformation.
+        """
+        by_x, by_y = by if isinstance(by, tuple) else (by, by)
+
+        return cls(1, 0, by_x, 0, 1, by_y)
+
+    @classmethod
+    def rotation(cls, angle: Number, around: Point = (0, 0)) -> Affine2D:
+        """
+        Return the transformation that rotates points anticlockwise around a
+        point, ``around``, by an angle, ``angle``.
+
+        :param angle: The angle to rotate by, in radians.
+        :param around: The point to rotate around. Defaults to the origin.
+
+        :return: A new transformation.
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        around_x, around_y = around
+
+        return cls(
+            cos,
+            -sin,
+            around_x - cos * around_x + sin * around_y,
+            sin,
+            cos,
+            around_y - sin * around_x - cos * around_y,
+        )
+
+    @classmethod
+    def scale(cls, by: Number | Point, around: Point = (0, 0)) -> Affine2D:
+        """
+        Return the transformation that scales points away from a point,
+        ``around``.
+
+        :param by: The point or number to multiply each point by.
+        :param around: The point to scale away from. Defaults to the origin.
+
+        :return: A new transformation.
+        """
+        by_x, by_y = by if isinstance(by, tuple) else (by, by)
+        around_x, around_y = around
+
+        return cls(
+            by_x,
+            0,
+            around_x - by_x * around_x,
+            0,
+            by_y,
+            around_y - by_y * around_y,
+        )
+
+    def __matmul__(self, other: Affine2D) -> Affine2D:
+        """
+        Compose two transformations.
+
+        :param other: The transformation to apply first.
+
+        :return: A new transformation that applies ``other`` and then this
+            transformation.
+        """
+        if isinstance(other, Affine2D):
+            a, b, c, d, e, f = self
+            return Affine2D(
+                a * other.a + b * other.d,
+                a * other.b + b * other.e,
+                a * other.c + b * other.f + c,
+                d * other.a + e * other.d,
+                d * other.b + e * other.e,
+                d * other.c + e * other.f + f,
+            )
+
+        return NotImplemented
+
+    def apply(self, other: Any, *, ndigits: int | None = None) -> Any:
+        """
+        Apply the transformation to a point, a line, or a collection of them.
+
+        Anything with a ``transform`` method -- such as a ``Point``, ``Line``,
+        ``PointArray``, or ``LineArray`` -- is transformed with that method,
+        and any other iterable is transformed into a list.
+
+        :param other: The object to transform.
+        :param ndigits: The number of decimal places to round the transformed
+            coordinates to. Defaults to no rounding.
+
+        :return: A new transformed object.
+        """
+        if hasattr(other, "transform"):
+            return other.transform(self, ndigits=ndigits)
+
+        return [item.transform(self, ndigits=ndigits) for item in other]
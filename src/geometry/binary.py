@@ -0,0 +1,378 @@
+"""
+Read and write points and lines in a compact binary format.
+
+A file is a 16-byte header followed by the coordinates as packed
+little-endian doubles:
+
+- bytes 0-3: the magic bytes ``b"GEOM"``
+- byte 4: the format version, currently 1
+- byte 5: what the file holds, 1 for points or 2 for lines
+- bytes 6-7: reserved, always zero
+- bytes 8-15: the number of points or lines, as a little-endian unsigned
+  64-bit integer
+
+Points are stored as ``x, y`` and lines as ``start x, start y, end x, end y``.
+Files are read by memory-mapping them, so opening a file does not read it
+and the coordinates are only copied when asked for.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+MAGIC = b"GEOM"
+VERSION = 1
+POINTS = 1
+LINES = 2
+
+_HEADER = struct.Struct("<4sBBxxQ")
+_CHUNK_SIZE = 65_536
+_WIDTHS = {POINTS: 2, LINES: 4}
+_SHAPES = {
+    POINTS: "Every point must have exactly two coordinates.",
+    LINES: "Every line must have exactly two points of two coordinates.",
+}
+
+
+def write_points(path: str | os.PathLike, points: Iterable[Point]) -> int:
+    """
+    Write points to a binary file.
+
+    The points are written in chunks, so they can come from a generator
+    without being held in memory all at once.
+
+    :param path: The file to write.
+    :param points: The points to write.
+
+    :return: The number of points written.
+    """
+    if isinstance(points, PointArray):
+        coordinates = array("d", bytes(16 * len(points)))
+        coordinates[0::2] = points.xs
+        coordinates[1::2] = points.ys
+        return _write(path, POINTS, [coordinates])
+
+    return _write(path, POINTS, _point_chunks(points))
+
+
+def write_lines(path: str | os.PathLike, lines: Iterable[Line]) -> int:
+    """
+    Write lines to a binary file.
+
+    The lines are written in chunks, so they can come from a generator
+    without being held in memory all at once.
+
+    :param path: The file to write.
+    :param lines: The lines to write.
+
+    :return: The number of lines written.
+    """
+    flat = itertools.chain.from_iterable(map(_line_values, lines))
+    return _write(path, LINES, _chunks(flat))
+
+
+def _point_chunks(points: Iterable[Point]) -> Iterator[array]:
+    """
+    Split the coordinates of points into arrays of doubles, checking each
+    point has two of them.
+    """
+    points = iter(points)
+    while batch := list(itertools.islice(points, _CHUNK_SIZE // 2)):
+        if set(map(len, batch)) != {2}:
+            raise ValueError(_SHAPES[POINTS])
+        yield array("d", itertools.chain.from_iterable(batch))
+
+
+def _line_values(line: Line) -> tuple[float, float, float, float]:
+    """
+    Return the coordinates of a line's ends, checking there are two of
+    each.
+    """
+    try:
+        (start_x, start_y), (end_x, end_y) = line.start, line.end
+    except ValueError:
+        raise ValueError(_SHAPES[LINES]) from None
+
+    return start_x, start_y, end_x, end_y
+
+
+def _chunks(values: Iterator[float]) -> Iterator[array]:
+    """
+    Split values into arrays of doubles.
+    """
+    while chunk := array("d", itertools.islice(values, _CHUNK_SIZE)):
+        yield chunk
+
+
+def _write(
+    path: str | os.PathLike,
+    kind: int,
+    chunks: Iterable[array],
+) -> int:
+    """
+    Write a header and chunks of coordinates to a file, then go back and
+    fill in the number of items.
+
+    If the chunks raise part of the way through, the partly written file
+    is removed, so no file is left whose header does not match its data.
+    """
+    try:
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, kind, 0))
+            values = 0
+            for chunk in chunks:
+                if sys.byteorder != "little":
+                    chunk.byteswap()
+                chunk.tofile(file)
+                values += len(chunk)
+
+            count = values // _WIDTHS[kind]
+            file.seek(0)
+            file.write(_HEADER.pack(MAGIC, VERSION, kind, count))
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        raise
+
+    return count
+
+
+class _MappedFile:
+    """
+    A memory-mapped binary file of points or lines.
+    """
+
+    __slots__ = ("_coordinates", "_count", "_file", "_mmap")
+
+    kind: int
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """
+        Open a file without reading its coordinates.
+
+        :param path: The file to open.
+
+        :raises ValueError: If the file is not a binary file of the expected
+            kind, or is shorter than its header says.
+        """
+        self._file: BinaryIO = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:  # Empty files cannot be mapped
+            self._file.close()
+            raise ValueError(f"{path} is not a geometry file.") from None
+
+        try:
+            self._coordinates = self._read(path)
+        except ValueError:
+            self._mmap.close()
+            self._file.close()
+            raise
+
+    def _read(self, path: str | os.PathLike) -> memoryview | array:
+        """
+        Check the header and return the coordinates.
+        """
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{path} is not a geometry file.")
+        magic, version, kind, count = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a geometry file.")
+        if version != VERSION:
+            raise ValueError(f"{path} has unsupported version {version}.")
+        if kind != self.kind:
+            raise ValueError(f"{path} does not hold {type(self).__name__}.")
+
+        end = _HEADER.size + 8 * _WIDTHS[kind] * count
+        if len(self._mmap) < end:
+            raise ValueError(f"{path} is shorter than its header says.")
+        self._count = count
+
+        coordinates = memoryview(self._mmap)[_HEADER.size : end].cast("d")
+        if sys.byteorder != "little":
+            # The file is little-endian, so it has to be copied to swap it
+            coordinates = array("d", coordinates)
+            coordinates.byteswap()
+
+        return coordinates
+
+    def close(self) -> None:
+        """
+        Close the file.
+
+        Views of the coordinates must be released before closing.
+        """
+        if isinstance(self._coordinates, memoryview):
+            self._coordinates.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> _MappedFile:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _column(self, offset: int) -> memoryview | array:
+        return self._coordinates[offset :: _WIDTHS[self.kind]]
+
+
+class MappedPoints(_MappedFile):
+    """
+    The points in a memory-mapped binary file.
+
+    The x and y coordinates are views of the file rather than copies, and a
+    ``Point`` is only created when one is accessed. Slicing copies the
+    points in the slice into a ``PointArray``.
+    """
+
+    __slots__ = ()
+    kind = POINTS
+
+    @property
+    def xs(self) -> memoryview:
+        """
+        Return a view of the x coordinates.
+        """
+        return self._column(0)
+
+    @property
+    def ys(self) -> memoryview:
+        """
+        Return a view of the y coordinates.
+        """
+        return self._column(1)
+
+    def __getitem__(self, index: int | slice) -> Point | PointArray:
+        if isinstance(index, slice):
+            return PointArray._from_buffers(
+                array("d", self.xs[index]), array("d", self.ys[index])
+            )
+
+        index = range(self._count)[index]
+        return Point(
+            self._coordinates[2 * index], self._coordinates[2 * index + 1]
+        )
+
+    def __iter__(self) -> Iterator[Point]:
+        return map(Point, self.xs, self.ys)
+
+    def to_point_array(self) -> PointArray:
+        """
+        Copy the points into a point array.
+        """
+        return PointArray(self.xs, self.ys)
+
+
+class MappedLines(_MappedFile):
+    """
+    The lines in a memory-mapped binary file.
+
+    The coordinates are views of the file rather than copies, and a ``Line``
+    is only created when one is accessed. Slicing copies the lines in the
+    slice into a ``LineArray``.
+    """
+
+    __slots__ = ()
+    kind = LINES
+
+    @property
+    def start_xs(self) -> memoryview:
+        """
+        Return a view of the x coordinates of the start points.
+        """
+        return self._column(0)
+
+    @property
+    def start_ys(self) -> memoryview:
+        """
+        Return a view of the y coordinates of the start points.
+        """
+        return self._column(1)
+
+    @property
+    def end_xs(self) -> memoryview:
+        """
+        Return a view of the x coordinates of the end points.
+        """
+        return self._column(2)
+
+    @property
+    def end_ys(self) -> memoryview:
+        """
+        Return a view of the y coordinates of the end points.
+        """
+        return self._column(3)
+
+    def __getitem__(self, index: int | slice) -> Line | LineArray:
+        if isinstance(index, slice):
+            return LineArray._from_buffers(
+                array("d", self.start_xs[index]),
+                array("d", self.start_ys[index]),
+                array("d", self.end_xs[index]),
+                array("d", self.end_ys[index]),
+            )
+
+        index = range(self._count)[index]
+        start_x, start_y, end_x, end_y = self._coordinates[
+            4 * index : 4 * index + 4
+        ]
+        return Line(Point(start_x, start_y), Point(end_x, end_y))
+
+    def __iter__(self) -> Iterator[Line]:
+        return map(
+            Line,
+            map(Point, self.start_xs, self.start_ys),
+            map(Point, self.end_xs, self.end_ys),
+        )
+
+    def to_line_array(self) -> LineArray:
+        """
+        Copy the lines into a line array.
+        """
+        return LineArray._from_buffers(
+            array("d", self.start_xs),
+            array("d", self.start_ys),
+            array("d", self.end_xs),
+            array("d", self.end_ys),
+        )
+
+
+def read_points(path: str | os.PathLike) -> MappedPoints:
+    """
+    Open a binary file of points.
+
+    :param path: The file to open.
+
+    :return: The points in the file, which should be closed after use.
+    """
+    return MappedPoints(path)
+
+
+def read_lines(path: str | os.PathLike) -> MappedLines:
+    """
+    Open a binary file of lines.
+
+    :param path: The file to open.
+
+    :return: The lines in the file, which should be closed after use.
+    """
+    return MappedLines(path)
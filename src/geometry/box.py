@@ -0,0 +1,165 @@
+"""
+A bounding box is an axis-aligned rectangle.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from geometry.point import Number, Point
+
+# The ends of a segment, as its start x, start y, end x, and end y
+Segment = tuple[Number, Number, Number, Number]
+
+
+class BoundingBox(NamedTuple):
+    """
+    An axis-aligned rectangle between its bottom-left and top-right corners.
+
+    A bounding box unpacks into its two corners, so it can be passed to
+    anything that takes a box as ``min_point`` and ``max_point``, such as
+    ``line.crosses_box(*box)`` or ``rtree.within_box(*box)``.
+    """
+
+    min_point: Point
+    max_point: Point
+
+    @classmethod
+    def around(cls, points: Iterable[Point]) -> BoundingBox:
+        """
+        Create the smallest bounding box around some points.
+
+        :param points: The points to surround.
+
+        :return: A new bounding box.
+
+        :raises ValueError: If there are no points.
+        """
+        points = iter(points)
+        first = next(points, None)
+        if first is None:
+            raise ValueError("A bounding box needs at least one point.")
+
+        min_x, min_y = max_x, max_y = first
+        for x, y in points:
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+
+        return cls(Point(min_x, min_y), Point(max_x, max_y))
+
+    @property
+    def width(self) -> Number:
+        """
+        Return the width of the box.
+        """
+        return self.max_point.x - self.min_point.x
+
+    @property
+    def height(self) -> Number:
+        """
+        Return the height of the box.
+        """
+        return self.max_point.y - self.min_point.y
+
+    @property
+    def area(self) -> Number:
+        """
+        Return the area of the box.
+        """
+        return self.width * self.height
+
+    def contains(self, point: Point) -> bool:
+        """
+        Return whether a point is inside the box or on its edges.
+
+        :param point: The point to check.
+
+        :return: Whether the box contains the point.
+        """
+        (min_x, min_y), (max_x, max_y) = self
+        x, y = point
+        return min_x <= x <= max_x and min_y <= y <= max_y
+
+    def overlaps(self, other: BoundingBox) -> bool:
+        """
+        Return whether the box shares any area or edge with another box.
+
+        :param other: The box to check.
+
+        :return: Whether the boxes overlap.
+        """
+        (min_x, min_y), (max_x, max_y) = self
+        (other_min_x, other_min_y), (other_max_x, other_max_y) = other
+        return (
+            min_x <= other_max_x
+            and other_min_x <= max_x
+            and min_y <= other_max_y
+            and other_min_y <= max_y
+        )
+
+    def union(self, other: BoundingBox) -> BoundingBox:
+        """
+        Return the smallest box around this box and another box.
+
+        :param other: The box to include.
+
+        :return: A new bounding box.
+        """
+        (min_x, min_y), (max_x, max_y) = self
+        (other_min_x, other_min_y), (other_max_x, other_max_y) = other
+        return BoundingBox(
+            Point(min(min_x, other_min_x), min(min_y, other_min_y)),
+            Point(max(max_x, other_max_x), max(max_y, other_max_y)),
+        )
+
+
+def clip_interval(
+    segment: Segment,
+    min_point: Point,
+    max_point: Point,
+) -> tuple[float, float] | None:
+    """
+    Return how far along a segment it enters and leaves a box, with
+    Liang-Barsky.
+
+    Each pair of sides cuts the line through the segment at two distances
+    along it, and the part inside the box is between the furthest entry and
+    the nearest exit. A segment parallel to a pair of sides is only inside
+    the box if it is between them.
+
+    :param segment: The segment, as its start x, start y, end x, and end y.
+    :param min_point: The bottom-left corner of the box.
+    :param max_point: The top-right corner of the box.
+
+    :return: The fractions of the way along the segment between which it is
+        inside the box, or ``None`` if none of it is.
+    """
+    start_x, start_y, end_x, end_y = segment
+    (min_x, min_y), (max_x, max_y) = min_point, max_point
+    d_x, d_y = end_x - start_x, end_y - start_y
+    low, high = 0.0, 1.0
+    if d_x:
+        enter, leave = (min_x - start_x) / d_x, (max_x - start_x) / d_x
+        if d_x < 0:
+            enter, leave = leave, enter
+        low, high = max(low, enter), min(high, leave)
+    elif not min_x <= start_x <= max_x:
+        return None
+    if d_y:
+        enter, leave = (min_y - start_y) / d_y, (max_y - start_y) / d_y
+        if d_y < 0:
+            enter, leave = leave, enter
+        low, high = max(low, enter), min(high, leave)
+    elif not min_y <= start_y <= max_y:
+        return None
+    if low > high:
+        return None
+
+    return low, high
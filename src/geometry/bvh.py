@@ -0,0 +1,251 @@
+"""
+A bounding volume hierarchy is a spatial index for finding lines near points.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from collections.abc import Iterable
+
+from geometry.kdtree import Neighbour
+from geometry.line import Line
+from geometry.point import Point
+
+
+class BVH:
+    """
+    A static spatial index over lines.
+
+    Each level of the hierarchy is a list of bounding boxes. The bottom level
+    holds a box around each line and every level above it holds a box around
+    up to ``node_capacity`` consecutive boxes from the level below. The boxes
+    on each level are ordered with Sort-Tile-Recursive (STR) packing, which
+    groups boxes that are close together so that the boxes above them are
+    small.
+    """
+
+    __slots__ = ("_capacity", "_indices", "_levels", "_lines")
+
+    def __init__(
+        self,
+        lines: Iterable[Line],
+        *,
+        node_capacity: int = 16,
+    ) -> None:
+        """
+        Build the index with STR packing in ``O(n log n)`` time.
+
+        :param lines: The lines to index.
+        :param node_capacity: The most children to keep in each box.
+        """
+        lines = list(lines)
+        boxes = _Level(
+            array("d", [min(line.start.x, line.end.x) for line in lines]),
+            array("d", [min(line.start.y, line.end.y) for line in lines]),
+            array("d", [max(line.start.x, line.end.x) for line in lines]),
+            array("d", [max(line.start.y, line.end.y) for line in lines]),
+        )
+        order = _str_order(boxes, node_capacity)
+        self._lines = [lines[i] for i in order]
+        self._indices = array("q", order)
+        self._capacity = node_capacity
+        self._levels = [boxes.reorder(order)]
+        while len(self._levels) == 1 or len(self._levels[-1]) > 1:
+            parents = self._levels[-1].parents(node_capacity)
+            self._levels.append(
+                parents.reorder(_str_order(parents, node_capacity))
+            )
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def _children(self, level: int, node: int) -> range:
+        """
+        Return the positions of a node's children on the level below it.
+        """
+        first = self._levels[level].firsts[node]
+        return range(
+            first,
+            min(first + self._capacity, len(self._levels[level - 1])),
+        )
+
+    def nearest(self, point: Point, k: int = 1) -> list[Neighbour]:
+        """
+        Return the lines nearest to a point.
+
+        The boxes are visited nearest first and a line is only measured once
+        its box is the nearest thing left, so the search stops as soon as
+        ``k`` lines are closer than every remaining box.
+
+        :param point: The point to search around.
+        :param k: The number of lines to return.
+
+        :return: The ``k`` nearest lines, nearest first, with the closest
+            point on each line.
+        """
+        x, y = point
+        top = len(self._levels) - 1
+        # Entries are (squared distance, level, position); level 0 entries
+        # are lines whose exact distance is known
+        heap = [
+            (self._levels[top].squared_distance(node, x, y), top, node)
+            for node in range(len(self._levels[top]))
+        ]
+        heapq.heapify(heap)
+
+        found = []
+        while heap and len(found) < k:
+            squared_distance, level, node = heapq.heappop(heap)
+            if level == 0:
+                line = self._lines[node]
+                found.append(
+                    Neighbour(
+                        self._indices[node],
+                        line.closest_point(point),
+                        math.sqrt(squared_distance),
+                    )
+                )
+            elif level == 1:
+                for child in self._children(level, node):
+                    distance = self._lines[child].distance_to(point)
+                    heapq.heappush(heap, (distance * distance, 0, child))
+            else:
+                below = self._levels[level - 1]
+                for child in self._children(level, node):
+                    heapq.heappush(
+                        heap,
+                        (below.squared_distance(child, x, y), level - 1, child),
+                    )
+
+        return found
+
+    def intersecting_box(
+        self,
+        min_point: Point,
+        max_point: Point,
+    ) -> list[int]:
+        """
+        Return the lines that pass through a box.
+
+        :param min_point: The bottom-left corner of the box.
+        :param max_point: The top-right corner of the box.
+
+        :return: The indices of the lines found, in ascending order.
+        """
+        top = len(self._levels) - 1
+        stack = [(top, node) for node in range(len(self._levels[top]))]
+        found = []
+        while stack:
+            level, node = stack.pop()
+            if not self._levels[level].overlaps(node, min_point, max_point):
+                continue
+            if level > 0:
+                stack.extend(
+                    (level - 1, child) for child in self._children(level, node)
+                )
+            elif self._lines[node].crosses_box(min_point, max_point):
+                found.append(self._indices[node])
+
+        return sorted(found)
+
+
+class _Level:
+    """
+    The bounding boxes on one level of a hierarchy.
+
+    ``firsts`` holds the position of each box's first child on the level
+    below, and is empty for the bottom level.
+    """
+
+    __slots__ = ("firsts", "max_xs", "max_ys", "min_xs", "min_ys")
+
+    def __init__(
+        self,
+        min_xs: array,
+        min_ys: array,
+        max_xs: array,
+        max_ys: array,
+        firsts: array | None = None,
+    ) -> None:
+        self.min_xs = min_xs
+        self.min_ys = min_ys
+        self.max_xs = max_xs
+        self.max_ys = max_ys
+        self.firsts = array("q") if firsts is None else firsts
+
+    def __len__(self) -> int:
+        return len(self.min_xs)
+
+    def reorder(self, order: list[int]) -> _Level:
+        """
+        Return the level with its boxes rearranged.
+        """
+        return _Level(
+            array("d", map(self.min_xs.__getitem__, order)),
+            array("d", map(self.min_ys.__getitem__, order)),
+            array("d", map(self.max_xs.__getitem__, order)),
+            array("d", map(self.max_ys.__getitem__, order)),
+            array("q", map(self.firsts.__getitem__, order))
+            if self.firsts
+            else None,
+        )
+
+    def parents(self, capacity: int) -> _Level:
+        """
+        Return the level of boxes around each group of consecutive boxes.
+        """
+        groups = range(0, len(self), capacity)
+        return _Level(
+            array("d", [min(self.min_xs[i : i + capacity]) for i in groups]),
+            array("d", [min(self.min_ys[i : i + capacity]) for i in groups]),
+            array("d", [max(self.max_xs[i : i + capacity]) for i in groups]),
+            array("d", [max(self.max_ys[i : i + capacity]) for i in groups]),
+            array("q", groups),
+        )
+
+    def squared_distance(self, node: int, x: float, y: float) -> float:
+        """
+        Return the squared distance from a point to a box.
+        """
+        dx = max(self.min_xs[node] - x, 0, x - self.max_xs[node])
+        dy = max(self.min_ys[node] - y, 0, y - self.max_ys[node])
+        return dx * dx + dy * dy
+
+    def overlaps(self, node: int, min_point: Point, max_point: Point) -> bool:
+        """
+        Return whether a box overlaps another box.
+        """
+        return (
+            self.min_xs[node] <= max_point.x
+            and min_point.x <= self.max_xs[node]
+            and self.min_ys[node] <= max_point.y
+            and min_point.y <= self.max_ys[node]
+        )
+
+
+def _str_order(level: _Level, capacity: int) -> list[int]:
+    """
+    Return the Sort-Tile-Recursive order of the boxes on a level.
+
+    The boxes are sorted by the x coordinates of their centres and cut into
+    vertical slices, then each slice is sorted by the y coordinates of the
+    centres, so that each run of ``capacity`` boxes forms a compact tile.
+    """
+    size = len(level)
+    if size == 0:
+        return []
+
+    centre_xs = [a + b for a, b in zip(level.min_xs, level.max_xs, strict=True)]
+    centre_ys = [a + b for a, b in zip(level.min_ys, level.max_ys, strict=True)]
+    by_x = sorted(range(size), key=centre_xs.__getitem__)
+    slice_size = capacity * math.ceil(math.sqrt(math.ceil(size / capacity)))
+
+    return [
+        i
+        for start in range(0, size, slice_size)
+        for i in sorted(
+            by_x[start : start + slice_size], key=centre_ys.__getitem__
+        )
+    ]
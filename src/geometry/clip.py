@@ -0,0 +1,134 @@
+"""
+Clipping cuts lines down to the parts of them inside a box.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+
+from geometry.box import BoundingBox, Segment, clip_interval
+from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.point import Point
+
+
+def clip(
+    lines: Iterable[Line] | LineArray,
+    box: BoundingBox,
+) -> list[Line] | LineArray:
+    """
+    Cut lines down to the parts of them inside a box.
+
+    Each line's ends are first given outcodes, the sides of the box they are
+    beyond. A line whose ends are both inside is kept whole and a line whose
+    ends are both beyond the same side is dropped, without any arithmetic.
+    Only the lines left are clipped, with Liang-Barsky, which cuts a line by
+    how far along it each side of the box is. Vertical and horizontal lines
+    need no special handling, and lines that only touch the box are kept as
+    the points where they touch it.
+
+    :param lines: The lines to clip.
+    :param box: The box to clip them to.
+
+    :return: The parts of the lines inside the box, in order, skipping the
+        lines outside it. A line array is clipped into a new line array,
+        and any other lines into a list, where lines inside the box are the
+        same objects.
+
+    :raises ValueError: If the box's minimum corner is above or to the right
+        of its maximum corner.
+    """
+    (min_x, min_y), (max_x, max_y) = box
+    if min_x > max_x or min_y > max_y:
+        raise ValueError(
+            "The box's minimum corner must not exceed its maximum."
+        )
+
+    if isinstance(lines, LineArray):
+        columns = [array("d") for _ in range(4)]
+        appends = [column.append for column in columns]
+        segments = zip(
+            lines._start_xs,
+            lines._start_ys,
+            lines._end_xs,
+            lines._end_ys,
+            strict=True,
+        )
+        for clipped in _clip(segments, box):
+            if clipped is not None:
+                for append, value in zip(appends, clipped, strict=True):
+                    append(value)
+        return LineArray._from_buffers(*columns)
+
+    lines = list(lines)
+    segments = [(*line.start, *line.end) for line in lines]
+    return [
+        line
+        if clipped is segment
+        else Line(Point(clipped[0], clipped[1]), Point(clipped[2], clipped[3]))
+        for line, segment, clipped in zip(
+            lines, segments, _clip(segments, box), strict=True
+        )
+        if clipped is not None
+    ]
+
+
+def _clip(
+    segments: Iterable[Segment],
+    box: BoundingBox,
+) -> Iterator[Segment | None]:
+    """
+    Clip segments to a box.
+
+    :return: For each segment, the segment itself if it is inside the box,
+        ``None`` if it is outside it, or the ends of the part of it inside
+        the box.
+    """
+    (min_x, min_y), (max_x, max_y) = box
+    for segment in segments:
+        start_x, start_y, end_x, end_y = segment
+        start_code = (
+            (start_x < min_x)
+            | (start_x > max_x) << 1
+            | (start_y < min_y) << 2
+            | (start_y > max_y) << 3
+        )
+        end_code = (
+            (end_x < min_x)
+            | (end_x > max_x) << 1
+            | (end_y < min_y) << 2
+            | (end_y > max_y) << 3
+        )
+        if not start_code | end_code:
+            yield segment
+        elif start_code & end_code:
+            yield None
+        else:
+            yield _cut(segment, box)
+
+
+def _cut(segment: Segment, box: BoundingBox) -> Segment | None:
+    """
+    Cut a segment to a box, using the same Liang-Barsky interval as
+    ``Line.crosses_box``.
+
+    :return: The ends of the part of the segment inside the box, or
+        ``None`` if none of it is.
+    """
+    interval = clip_interval(segment, *box)
+    if interval is None:
+        return None
+
+    low, high = interval
+    start_x, start_y, end_x, end_y = segment
+    (min_x, min_y), (max_x, max_y) = box
+    d_x, d_y = end_x - start_x, end_y - start_y
+    # The cut ends are rounded, so they are clamped to stay in the box
+    if high < 1:
+        end_x = min(max(start_x + high * d_x, min_x), max_x)
+        end_y = min(max(start_y + high * d_y, min_y), max_y)
+    if low > 0:
+        start_x = min(max(start_x + low * d_x, min_x), max_x)
+        start_y = min(max(start_y + low * d_y, min_y), max_y)
+    return (start_x, start_y, end_x, end_y)
@@ -0,0 +1,294 @@
+"""
+A space-filling curve orders points so that points near each other along it
+are near each other in space.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+from array import array
+from collections.abc import Callable, Iterable
+
+from geometry.box import BoundingBox
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+_MAX_BITS = 16
+_MASK = (1 << _MAX_BITS) - 1
+
+
+@functools.cache
+def _spread_table() -> list[int]:
+    """
+    Return each 16-bit number with a zero bit inserted above each of its
+    bits, so that ``table[x] | table[y] << 1`` interleaves ``x`` and ``y``.
+
+    The table is built the first time it is needed, rather than on import.
+    """
+    low = [
+        sum(((value >> bit) & 1) << (2 * bit) for bit in range(8))
+        for value in range(256)
+    ]
+    return [
+        low[value & 0xFF] | low[value >> 8] << 16 for value in range(1 << 16)
+    ]
+
+
+def morton_key(point: Point, box: BoundingBox, *, bits: int = 16) -> int:
+    """
+    Return the position of a point along the Z-order curve over a box.
+
+    :param point: The point to place.
+    :param box: The box the curve covers. Points outside it are placed on
+        its nearest edge.
+    :param bits: The number of bits to quantise each coordinate to, up to
+        16.
+
+    :return: The key of the point, with ``2 * bits`` bits.
+
+    :raises ValueError: If the number of bits is not between 1 and 16.
+    """
+    return morton_keys([point], box, bits=bits)[0]
+
+
+def hilbert_key(point: Point, box: BoundingBox, *, bits: int = 16) -> int:
+    """
+    Return the position of a point along the Hilbert curve over a box.
+
+    :param point: The point to place.
+    :param box: The box the curve covers. Points outside it are placed on
+        its nearest edge.
+    :param bits: The number of bits to quantise each coordinate to, up to
+        16.
+
+    :return: The key of the point, with ``2 * bits`` bits.
+
+    :raises ValueError: If the number of bits is not between 1 and 16.
+    """
+    return hilbert_keys([point], box, bits=bits)[0]
+
+
+def morton_keys(
+    points: Iterable[Point],
+    box: BoundingBox | None = None,
+    *,
+    bits: int = 16,
+) -> array:
+    """
+    Return the positions of some points along the Z-order curve over a box.
+
+    The coordinates are quantised to integers and their bits interleaved
+    with a lookup table, 16 bits at a time, rather than bit by bit.
+
+    :param points: The points to place, as a point array or an iterable of
+        points.
+    :param box: The box the curve covers. Defaults to the box around the
+        points. Points outside it are placed on its nearest edge.
+    :param bits: The number of bits to quantise each coordinate to, up to
+        16.
+
+    :return: An array of unsigned 64-bit keys, one for each point in order.
+
+    :raises ValueError: If the number of bits is not between 1 and 16.
+    """
+    xs, ys = _quantise(points, box, bits)
+    spread = _spread_table()
+    return array(
+        "Q", [spread[x] | spread[y] << 1 for x, y in zip(xs, ys, strict=True)]
+    )
+
+
+def hilbert_keys(
+    points: Iterable[Point],
+    box: BoundingBox | None = None,
+    *,
+    bits: int = 16,
+) -> array:
+    """
+    Return the positions of some points along the Hilbert curve over a box.
+
+    The Hilbert curve keeps points that are close along it closer in space
+    than the Z-order curve does, as it never jumps. Each key is worked out
+    with a fixed sequence of bitwise operations over all 16 bits of the
+    coordinates at once, as a parallel prefix scan of the curve's rotations,
+    rather than bit by bit.
+
+    :param points: The points to place, as a point array or an iterable of
+        points.
+    :param box: The box the curve covers. Defaults to the box around the
+        points. Points outside it are placed on its nearest edge.
+    :param bits: The number of bits to quantise each coordinate to, up to
+        16.
+
+    :return: An array of unsigned 64-bit keys, one for each point in order.
+
+    :raises ValueError: If the number of bits is not between 1 and 16.
+    """
+    xs, ys = _quantise(points, box, bits)
+    shift = _MAX_BITS - bits
+    spread = _spread_table()
+    return array(
+        "Q",
+        [
+            _hilbert(x << shift, y << shift, spread) >> 2 * shift
+            for x, y in zip(xs, ys, strict=True)
+        ],
+    )
+
+
+def spatial_sort(
+    points: Iterable[Point],
+    *,
+    curve: str = "hilbert",
+    box: BoundingBox | None = None,
+    bits: int = 16,
+) -> list[Point] | PointArray:
+    """
+    Sort points along a space-filling curve, so that points near each other
+    in the result are near each other in space.
+
+    :param points: The points to sort.
+    :param curve: The curve to sort along, ``"hilbert"`` or ``"morton"``.
+    :param box: The box the curve covers. Defaults to the box around the
+        points.
+    :param bits: The number of bits to quantise each coordinate to, up to
+        16.
+
+    :return: The points in order along the curve, keeping their original
+        order where they have the same key. A point array is sorted into a
+        new point array, and any other points into a list.
+
+    :raises ValueError: If the curve is unknown or the number of bits is
+        not between 1 and 16.
+    """
+    keys = _CURVES.get(curve)
+    if keys is None:
+        raise ValueError(f"Unknown curve: {curve!r}.")
+    if not isinstance(points, PointArray):
+        points = list(points)
+
+    order = sorted(
+        range(len(points)), key=keys(points, box, bits=bits).__getitem__
+    )
+    if isinstance(points, PointArray):
+        xs, ys = points._xs, points._ys
+        return PointArray._from_buffers(
+            array("d", [xs[i] for i in order]),
+            array("d", [ys[i] for i in order]),
+        )
+
+    return [points[i] for i in order]
+
+
+def partition(
+    points: Iterable[Point],
+    n: int,
+    *,
+    curve: str = "hilbert",
+    box: BoundingBox | None = None,
+    bits: int = 16,
+) -> list[list[Point]] | list[PointArray]:
+    """
+    Split points into chunks of points that are near each other.
+
+    The points are sorted along a space-filling curve and cut into
+    consecutive runs, so each chunk covers a compact area and the chunks'
+    sizes differ by at most one.
+
+    :param points: The points to split.
+    :param n: The number of chunks.
+    :param curve: The curve to sort along, ``"hilbert"`` or ``"morton"``.
+    :param box: The box the curve covers. Defaults to the box around the
+        points.
+    :param bits: The number of bits to quantise each coordinate to, up to
+        16.
+
+    :return: ``n`` chunks, in order along the curve. A point array is split
+        into point arrays, and any other points into lists.
+
+    :raises ValueError: If there are fewer than one chunk, the curve is
+        unknown, or the number of bits is not between 1 and 16.
+    """
+    if n < 1:
+        raise ValueError("There must be at least one chunk.")
+
+    ordered = spatial_sort(points, curve=curve, box=box, bits=bits)
+    size, extra = divmod(len(ordered), n)
+    bounds = [i * size + min(i, extra) for i in range(n + 1)]
+    return [ordered[start:end] for start, end in itertools.pairwise(bounds)]
+
+
+def _quantise(
+    points: Iterable[Point],
+    box: BoundingBox | None,
+    bits: int,
+) -> tuple[list[int], list[int]]:
+    """
+    Scale the coordinates of some points over a box to integers from 0 up
+    to ``2 ** bits - 1``.
+    """
+    if not 1 <= bits <= _MAX_BITS:
+        raise ValueError(
+            f"The number of bits must be between 1 and {_MAX_BITS}."
+        )
+
+    if isinstance(points, PointArray):
+        xs, ys = points._xs, points._ys
+    else:
+        points = list(points)
+        xs, ys = [x for x, _ in points], [y for _, y in points]
+    if not xs:
+        return [], []
+
+    (min_x, min_y), (max_x, max_y) = box or BoundingBox.around(
+        map(Point, xs, ys)
+    )
+    top = (1 << bits) - 1
+    scale_x = top / (max_x - min_x) if max_x > min_x else 0
+    scale_y = top / (max_y - min_y) if max_y > min_y else 0
+    return (
+        [min(max(int((x - min_x) * scale_x), 0), top) for x in xs],
+        [min(max(int((y - min_y) * scale_y), 0), top) for y in ys],
+    )
+
+
+def _hilbert(x: int, y: int, spread: list[int]) -> int:
+    """
+    Return the Hilbert index of a cell on a 65536 by 65536 grid.
+
+    This follows Fabian Giesen's branchless method: the orientation of the
+    curve at each bit is a prefix scan over the bits above it, which is done
+    in four doubling steps over all the bits at once.
+    """
+    a = x ^ y
+    b = _MASK ^ a
+    c = _MASK ^ (x | y)
+    d = x & (y ^ _MASK)
+    big_a = a | (b >> 1)
+    big_b = (a >> 1) ^ a
+    big_c = ((c >> 1) ^ (b & (d >> 1))) ^ c
+    big_d = ((a & (c >> 1)) ^ (d >> 1)) ^ d
+
+    for shift in (2, 4):
+        a, b, c, d = big_a, big_b, big_c, big_d
+        big_a = (a & (a >> shift)) ^ (b & (b >> shift))
+        big_b = (a & (b >> shift)) ^ (b & ((a ^ b) >> shift))
+        big_c ^= (a & (c >> shift)) ^ (b & (d >> shift))
+        big_d ^= (b & (c >> shift)) ^ ((a ^ b) & (d >> shift))
+
+    a, b, c, d = big_a, big_b, big_c, big_d
+    big_c ^= (a & (c >> 8)) ^ (b & (d >> 8))
+    big_d ^= (b & (c >> 8)) ^ ((a ^ b) & (d >> 8))
+
+    a = big_c ^ (big_c >> 1)
+    b = big_d ^ (big_d >> 1)
+    low = x ^ y
+    high = b | (_MASK ^ (low | a))
+    return spread[high] << 1 | spread[low]
+
+
+_CURVES: dict[str, Callable[..., array]] = {
+    "hilbert": hilbert_keys,
+    "morton": morton_keys,
+}
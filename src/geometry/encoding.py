@@ -0,0 +1,228 @@
+"""
+An encoded point sequence packs quantised points into compact bytes.
+
+Each point is snapped to a grid and stored as the difference from the point
+before it, so a path of nearby points stores small numbers. Each difference
+is zig-zag encoded, which maps small negative and positive numbers to small
+unsigned numbers (0, -1, 1, -2, ... to 0, 1, 2, 3, ...), and written as a
+variable-length integer of 7 bits per byte, with the top bit of each byte
+set on every byte but the last. This is the binary equivalent of the
+encoded polyline format. The differences are written x then y for each
+point, with no header, so the same grid step must be used to decode.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import operator
+import re
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO
+
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+from geometry.quantised import Grid, QuantisedArray
+
+# A varint is any number of bytes with the top bit set and one without, and
+# is a single byte without the top bit when the number is small
+_VARINT = re.compile(rb"[\x80-\xff]*[\x00-\x7f]")
+_LONG_VARINT = re.compile(rb"([\x80-\xff]+[\x00-\x7f])")
+_CONTINUATION = bytes(range(0x80, 0x100))
+# Differences up to this size fit in two bytes and are kept in lookup tables
+_TABLE_LIMIT = 1 << 13
+# Bytes are decoded a run at a time when fewer than one in this many of them
+# are part of a longer varint
+_SPARSE = 8
+
+
+class _Encodings(dict):
+    """
+    The varint encodings of differences, worked out for any that are missing.
+    """
+
+    def __missing__(self, value: int) -> bytes:
+        return _varint(_zigzag(value))
+
+
+class _Decodings(dict):
+    """
+    The differences of varint encodings, worked out for any that are missing.
+    """
+
+    def __missing__(self, token: bytes) -> int:
+        return _unzigzag(_read_varint(token))
+
+
+@functools.cache
+def _tables() -> tuple[_Encodings, _Decodings, list[int]]:
+    """
+    Return the encodings and decodings of the differences that fit in one or
+    two bytes, which are most of the differences along a path, and the
+    differences of each single byte encoding by its value.
+    """
+    encodings = _Encodings()
+    for value in range(-_TABLE_LIMIT, _TABLE_LIMIT):
+        encodings[value] = _varint(_zigzag(value))
+    decodings = _Decodings({token: value for value, token in encodings.items()})
+    return encodings, decodings, [_unzigzag(byte) for byte in range(0x80)]
+
+
+def encode_points(points: Iterable[Point], *, step: Number = 1e-5) -> bytes:
+    """
+    Encode a sequence of points as bytes.
+
+    :param points: The points to encode, in order, as a point array or any
+        iterable of points such as a polyline.
+    :param step: The grid step to snap the coordinates to. Defaults to
+        ``1e-5``, the precision of the encoded polyline format.
+
+    :return: The encoded points.
+    """
+    quantised = Grid(step).quantise_many(points)
+    xs, ys = quantised.xs, quantised.ys
+    encodings, _, _ = _tables()
+    differences = zip(
+        map(operator.sub, xs, itertools.chain((0,), xs)),
+        map(operator.sub, ys, itertools.chain((0,), ys)),
+        strict=False,
+    )
+    return b"".join(
+        map(
+            encodings.__getitem__,
+            itertools.chain.from_iterable(differences),
+        )
+    )
+
+
+def decode_points(data: bytes, *, step: Number = 1e-5) -> PointArray:
+    """
+    Decode a sequence of points from bytes.
+
+    :param data: The encoded points.
+    :param step: The grid step the points were encoded with.
+
+    :return: A point array of the decoded points.
+
+    :raises ValueError: If the data ends part of the way through a point.
+    """
+    batches = list(decode_point_batches([data], step=step))
+    return batches[0] if batches else PointArray()
+
+
+def decode_point_batches(
+    source: Iterable[bytes] | BinaryIO,
+    *,
+    step: Number = 1e-5,
+    chunk_size: int = 65_536,
+) -> Iterator[PointArray]:
+    """
+    Decode a stream of encoded points into point arrays as it is read.
+
+    The stream can be split anywhere, even in the middle of a point, and
+    only one chunk of it is held in memory at a time.
+
+    :param source: The encoded points, as an iterable of chunks of bytes or
+        a binary file.
+    :param step: The grid step the points were encoded with.
+    :param chunk_size: The number of bytes to read from a file at a time.
+
+    :return: An iterator of point arrays, one for each chunk that completes
+        at least one point.
+
+    :raises ValueError: If the stream ends part of the way through a point.
+    """
+    if hasattr(source, "read"):
+        source = iter(functools.partial(source.read, chunk_size), b"")
+
+    grid = Grid(step)
+    _, decodings, single_bytes = _tables()
+    carry = b""
+    pending = []
+    x = y = 0
+    for chunk in source:
+        data = carry + chunk
+        complete = data.rstrip(_CONTINUATION)
+        carry = data[len(complete) :]
+        values = pending
+        # Along a dense path most differences fit in a single byte, so only
+        # the longer varints are split out and the runs between them are
+        # decoded a byte at a time
+        long_bytes = len(complete) - len(
+            complete.translate(None, _CONTINUATION)
+        )
+        if long_bytes * _SPARSE < len(complete):
+            parts = _LONG_VARINT.split(complete)
+            values.extend(map(single_bytes.__getitem__, parts[0]))
+            for token, run in zip(parts[1::2], parts[2::2], strict=True):
+                values.append(decodings[token])
+                values.extend(map(single_bytes.__getitem__, run))
+        else:
+            values.extend(map(decodings.__getitem__, _VARINT.findall(complete)))
+        whole = len(values) // 2 * 2
+        values, pending = values[:whole], values[whole:]
+        if not values:
+            continue
+
+        xs = list(itertools.accumulate(values[0::2], initial=x))
+        ys = list(itertools.accumulate(values[1::2], initial=y))
+        x, y = xs[-1], ys[-1]
+        yield grid.restore_many(QuantisedArray(xs[1:], ys[1:]))
+
+    if carry or pending:
+        raise ValueError("The encoded points end part of the way through.")
+
+
+def decode_points_stream(
+    source: Iterable[bytes] | BinaryIO,
+    *,
+    step: Number = 1e-5,
+    chunk_size: int = 65_536,
+) -> Iterator[Point]:
+    """
+    Decode a stream of encoded points one point at a time as it is read.
+
+    :param source: The encoded points, as an iterable of chunks of bytes or
+        a binary file.
+    :param step: The grid step the points were encoded with.
+    :param chunk_size: The number of bytes to read from a file at a time.
+
+    :return: An iterator of the decoded points.
+
+    :raises ValueError: If the stream ends part of the way through a point.
+    """
+    for batch in decode_point_batches(source, step=step, chunk_size=chunk_size):
+        yield from batch
+
+
+def _zigzag(value: int) -> int:
+    """
+    Map a signed integer to an unsigned one, interleaving the negatives.
+    """
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    """
+    Undo ``_zigzag``.
+    """
+    return (value >> 1) ^ -(value & 1)
+
+
+def _varint(value: int) -> bytes:
+    """
+    Write an unsigned integer 7 bits at a time, lowest bits first.
+    """
+    encoded = bytearray()
+    while value >= 0x80:  # noqa: PLR2004
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _read_varint(token: bytes) -> int:
+    """
+    Undo ``_varint``.
+    """
+    return sum((byte & 0x7F) << (7 * i) for i, byte in enumerate(token))
@@ -0,0 +1,97 @@
+"""
+A convex hull is the smallest convex polygon around a set of points.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable
+
+from geometry.point import Point
+
+
+def convex_hull(points: Iterable[Point]) -> list[Point]:
+    """
+    Return the convex hull of some points with Andrew's monotone chain
+    algorithm, in ``O(n log n)`` time.
+
+    The points are sorted once, then the lower and upper halves of the hull
+    are each built in a single pass, dropping any point that does not make
+    an anticlockwise turn.
+
+    :param points: The points to surround, such as a list or a point array.
+
+    :return: The vertices of the hull in anticlockwise order, starting from
+        the bottom-most of the left-most points. Points on the edges of the
+        hull are not included, so the hull of collinear points is their two
+        ends.
+    """
+    # Plain tuples sort and hash much faster than points
+    coordinates = sorted(set(map(tuple, points)))
+    if len(coordinates) <= 2:  # noqa: PLR2004
+        return list(itertools.starmap(Point, coordinates))
+
+    lower = _half_hull(coordinates)
+    upper = _half_hull(reversed(coordinates))
+
+    return list(itertools.starmap(Point, lower[:-1] + upper[:-1]))
+
+
+def _half_hull(
+    coordinates: Iterable[tuple[float, float]],
+) -> list[tuple[float, float]]:
+    """
+    Return the coordinates that make anticlockwise turns, in order.
+    """
+    hull: list[tuple[float, float]] = []
+    for x, y in coordinates:
+        while len(hull) >= 2:  # noqa: PLR2004
+            (origin_x, origin_y), (first_x, first_y) = hull[-2], hull[-1]
+            # Keep the last point only if the turn through it is anticlockwise
+            if (first_x - origin_x) * (y - origin_y) - (first_y - origin_y) * (
+                x - origin_x
+            ) > 0:
+                break
+            hull.pop()
+        hull.append((x, y))
+
+    return hull
+
+
+def merge_hulls(*hulls: Iterable[Point]) -> list[Point]:
+    """
+    Return the convex hull around several convex hulls.
+
+    The hull of a set of points is the hull of the hulls of any split of
+    them, so hulls of separate chunks can be worked out independently, such
+    as in parallel, and then merged.
+
+    :param hulls: The hulls to merge.
+
+    :return: The vertices of the merged hull, as ``convex_hull`` returns
+        them.
+    """
+    return convex_hull(itertools.chain.from_iterable(hulls))
+
+
+def streaming_convex_hull(
+    points: Iterable[Point],
+    chunk_size: int = 65_536,
+) -> list[Point]:
+    """
+    Return the convex hull of some points, reading them a chunk at a time.
+
+    Only the current chunk and the hull so far are kept in memory, so the
+    points can come from a reader over a file too large to load at once.
+
+    :param points: The points to surround.
+    :param chunk_size: The number of points to read at a time.
+
+    :return: The vertices of the hull, as ``convex_hull`` returns them.
+    """
+    points = iter(points)
+    hull: list[Point] = []
+    while chunk := list(itertools.islice(points, chunk_size)):
+        hull = merge_hulls(hull, chunk)
+
+    return hull
@@ -0,0 +1,112 @@
+"""
+A point pool shares one instance between equal points.
+"""
+
+from __future__ import annotations
+
+import collections
+from typing import NamedTuple
+
+from geometry.point import Point
+
+
+class PoolStats(NamedTuple):
+    """
+    How well a pool has deduplicated the points passed through it.
+
+    ``hits`` counts points that were already in the pool, ``misses`` counts
+    points that were added to it, and ``evictions`` counts points that were
+    dropped to keep it within its size.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Return the fraction of lookups that found a point in the pool.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PointPool:
+    """
+    A bounded pool of canonical points.
+
+    Interning a point returns the instance already in the pool that is equal
+    to it, or adds it to the pool if there is none, so datasets that repeat
+    the same coordinates many times hold one point per coordinate. The pool
+    keeps the most recently used points and evicts the least recently used
+    once it is full. Points are tuples, which cannot be weakly referenced, so
+    the pool holds strong references and its size bounds its memory.
+    """
+
+    __slots__ = ("_evictions", "_hits", "_max_size", "_misses", "_points")
+
+    def __init__(self, max_size: int | None = 65_536) -> None:
+        """
+        Create an empty pool.
+
+        :param max_size: The most points to keep, or ``None`` to keep every
+            point.
+
+        :raises ValueError: If the size is less than 1.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("The pool must hold at least one point.")
+
+        self._max_size = max_size
+        self._points: collections.OrderedDict[Point, Point] = (
+            collections.OrderedDict()
+        )
+        self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, point: Point) -> bool:
+        return point in self._points
+
+    def intern(self, point: Point) -> Point:
+        """
+        Return the canonical instance of a point.
+
+        :param point: The point to look up.
+
+        :return: The equal point already in the pool, or ``point`` itself if
+            there was none.
+        """
+        points = self._points
+        canonical = points.get(point)
+        if canonical is not None:
+            self._hits += 1
+            points.move_to_end(point)
+            return canonical
+
+        self._misses += 1
+        points[point] = point
+        if self._max_size is not None and len(points) > self._max_size:
+            points.popitem(last=False)
+            self._evictions += 1
+
+        return point
+
+    def stats(self) -> PoolStats:
+        """
+        Return the number of hits, misses and evictions so far, and the
+        number of points in the pool.
+        """
+        return PoolStats(
+            self._hits, self._misses, self._evictions, len(self._points)
+        )
+
+    def clear(self) -> None:
+        """
+        Empty the pool and reset its statistics.
+        """
+        self._points.clear()
+        self._hits = self._misses = self._evictions = 0
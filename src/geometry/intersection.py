@@ -0,0 +1,147 @@
+"""
+Find where many lines meet using a sweep line.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+import math
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from geometry.line import Line
+from geometry.point import Point
+
+_TOLERANCE = 1e-9
+
+
+class Intersection(NamedTuple):
+    """
+    A pair of lines that meet, and where they meet.
+
+    The lines are identified by their positions in the input, with ``first``
+    always less than ``second``.
+    """
+
+    first: int
+    second: int
+    at: Point | Line
+
+
+class _Segment:
+    """
+    A line ordered from its leftmost (then lowest) endpoint to its other one.
+    """
+
+    __slots__ = ("index", "left", "line", "right", "slope")
+
+    def __init__(self, index: int, line: Line) -> None:
+        self.index = index
+        self.line = line
+        self.left, self.right = sorted(
+            [(line.start.x, line.start.y), (line.end.x, line.end.y)]
+        )
+        (left_x, left_y), (right_x, right_y) = self.left, self.right
+        self.slope = (
+            math.inf
+            if left_x == right_x
+            else (right_y - left_y) / (right_x - left_x)
+        )
+
+    def y_at(self, x: float, y: float) -> float:
+        """
+        Return the height of the segment where it crosses the sweep line.
+
+        A vertical segment lies along the sweep line, so its height is the
+        height of the current event, ``y``, limited to the segment.
+        """
+        (left_x, left_y), (right_x, right_y) = self.left, self.right
+        if self.slope == math.inf:
+            return min(max(y, left_y), right_y)
+        if x == right_x:
+            return right_y
+
+        return left_y + (x - left_x) * self.slope
+
+
+def intersections(lines: Iterable[Line]) -> list[Intersection]:
+    """
+    Return every pair of lines that meet, and where they meet.
+
+    This is the Bentley-Ottmann algorithm: a vertical line sweeps from left
+    to right, keeping the lines it crosses in order from bottom to top. Lines
+    can only meet once they are next to each other in this order, so only
+    neighbouring lines are compared. This takes ``O((n + k) log n)`` time for
+    ``n`` lines with ``k`` intersections, rather than comparing every pair.
+
+    Each pair is checked with ``Line.intersection``, so lines that touch at an
+    endpoint meet at a point and collinear lines that overlap meet along a
+    line.
+
+    :param lines: The lines to intersect.
+
+    :return: The pairs of lines that meet, ordered by their positions in the
+        input.
+    """
+    segments = [_Segment(index, line) for index, line in enumerate(lines)]
+    starts: dict[tuple[float, float], list[_Segment]] = {}
+    events: list[tuple[float, float]] = []
+    for segment in segments:
+        starts.setdefault(segment.left, []).append(segment)
+        events.extend([segment.left, segment.right])
+    scheduled = set(events)
+    heapq.heapify(events)
+
+    status: list[_Segment] = []
+    found: dict[tuple[int, int], Point | Line] = {}
+
+    def schedule(below: _Segment, above: _Segment, event: tuple) -> None:
+        at = below.line.intersection(above.line)
+        if isinstance(at, Point):
+            at = (at.x, at.y)
+            if at > event and at not in scheduled:
+                scheduled.add(at)
+                heapq.heappush(events, at)
+
+    while events:
+        event = heapq.heappop(events)
+        x, y = event
+        tolerance = _TOLERANCE * max(1.0, abs(y))
+
+        # The segments passing through the event are next to each other
+        low = bisect.bisect_left(
+            status, y - tolerance, key=lambda s: s.y_at(x, y)
+        )
+        high = bisect.bisect_right(
+            status, y + tolerance, key=lambda s: s.y_at(x, y)
+        )
+        passing = status[low:high]
+        starting = starts.pop(event, [])
+
+        meeting = sorted(passing + starting, key=lambda s: s.index)
+        for first, second in itertools.combinations(meeting, 2):
+            pair = (first.index, second.index)
+            if pair not in found:
+                at = first.line.intersection(second.line)
+                if at is not None:
+                    found[pair] = at
+
+        # Re-insert the segments that continue, in their order just after
+        # the event, so that segments which crossed here swap places
+        continuing = sorted(
+            (s for s in passing + starting if s.right != event),
+            key=lambda s: s.slope,
+        )
+        status[low:high] = continuing
+
+        if continuing:
+            if low > 0:
+                schedule(status[low - 1], continuing[0], event)
+            if low + len(continuing) < len(status):
+                schedule(continuing[-1], status[low + len(continuing)], event)
+        elif 0 < low < len(status):
+            schedule(status[low - 1], status[low], event)
+
+    return [Intersection(*pair, at) for pair, at in sorted(found.items())]
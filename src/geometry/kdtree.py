@@ -0,0 +1,318 @@
+"""
+A k-d tree is a spatial index for finding points near other points.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+
+
+class Neighbour(NamedTuple):
+    """
+    Something found near a point.
+
+    ``index`` identifies what was found: its position in the input to a
+    static index, or its id in a dynamic one. ``point`` is the point on it
+    nearest to the point searched around, and ``distance`` is the distance
+    between the two.
+    """
+
+    index: int
+    point: Point
+    distance: Number
+
+
+class KDTree:
+    """
+    A static spatial index over points.
+
+    The tree is stored implicitly: the points are reordered so that each
+    node's range of points has its splitting point in the middle, with the
+    points before it on one side of the split and the points after it on the
+    other. The axis of the split alternates between x and y at each level,
+    and small ranges are left as leaves that are scanned directly.
+    """
+
+    __slots__ = ("_indices", "_leaf_size", "_xs", "_ys")
+
+    def __init__(self, points: Iterable[Point], *, leaf_size: int = 8) -> None:
+        """
+        Build the index in ``O(n log n)`` time.
+
+        The points are sorted by x and by y once, and each split partitions
+        both orders in linear time rather than sorting again.
+
+        :param points: The points to index.
+        :param leaf_size: The most points to keep in a leaf.
+        """
+        points = PointArray.from_points(points)
+        xs, ys = points.xs, points.ys
+        size = len(points)
+        order = array("q", bytes(8 * size))
+        is_left = bytearray(size)
+
+        stack = [
+            (
+                0,
+                size,
+                0,
+                sorted(range(size), key=xs.__getitem__),
+                sorted(range(size), key=ys.__getitem__),
+            )
+        ]
+        while stack:
+            low, high, depth, by_x, by_y = stack.pop()
+            if high - low <= leaf_size:
+                order[low:high] = array("q", by_x)
+                continue
+
+            mid = (low + high) // 2
+            split = mid - low
+            by_axis, by_other = (by_x, by_y) if depth % 2 == 0 else (by_y, by_x)
+            order[mid] = median = by_axis[split]
+
+            left_axis, right_axis = by_axis[:split], by_axis[split + 1 :]
+            for i in left_axis:
+                is_left[i] = 1
+            left_other = [i for i in by_other if is_left[i]]
+            right_other = [
+                i for i in by_other if not is_left[i] and i != median
+            ]
+            for i in left_axis:
+                is_left[i] = 0
+
+            if depth % 2 == 0:
+                stack.append((low, mid, depth + 1, left_axis, left_other))
+                stack.append(
+                    (mid + 1, high, depth + 1, right_axis, right_other)
+                )
+            else:
+                stack.append((low, mid, depth + 1, left_other, left_axis))
+                stack.append(
+                    (mid + 1, high, depth + 1, right_other, right_axis)
+                )
+
+        self._indices = order
+        self._xs = array("d", map(xs.__getitem__, order))
+        self._ys = array("d", map(ys.__getitem__, order))
+        self._leaf_size = leaf_size
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def _neighbour(self, position: int, squared_distance: float) -> Neighbour:
+        """
+        Return the neighbour at a position in the tree.
+        """
+        return Neighbour(
+            self._indices[position],
+            Point(self._xs[position], self._ys[position]),
+            math.sqrt(squared_distance),
+        )
+
+    def _nearest(
+        self,
+        x: float,
+        y: float,
+        k: int,
+        hint: int | None = None,
+    ) -> list[tuple[float, int]]:
+        """
+        Return the squared distances and positions of the ``k`` nearest
+        points, nearest first.
+
+        A ``hint`` is the position of a point that is probably close; when
+        ``k`` is 1 it bounds the search before the tree is visited.
+        """
+        if k < 1:
+            return []
+
+        xs, ys, leaf_size = self._xs, self._ys, self._leaf_size
+        # Entries are negated so that the heap keeps the furthest point on
+        # top, and the later of two equally distant points. A point only
+        # replaces it if it is closer, or as close and earlier, so the result
+        # does not depend on the order the points are visited in
+        heap: list[tuple[float, int]] = []
+        worst = math.inf
+        if hint is not None and k == 1:
+            worst = (xs[hint] - x) ** 2 + (ys[hint] - y) ** 2
+            heap.append((-worst, -hint))
+
+        stack = [(0.0, 0, len(xs), 0)]
+        while stack:
+            bound, low, high, depth = stack.pop()
+            if bound > worst:
+                continue
+
+            if high - low <= leaf_size:
+                candidates = range(low, high)
+            else:
+                mid = (low + high) // 2
+                candidates = (mid,)
+                diff = x - xs[mid] if depth % 2 == 0 else y - ys[mid]
+                if diff < 0:
+                    stack.append((diff * diff, mid + 1, high, depth + 1))
+                    stack.append((bound, low, mid, depth + 1))
+                else:
+                    stack.append((diff * diff, low, mid, depth + 1))
+                    stack.append((bound, mid + 1, high, depth + 1))
+
+            for position in candidates:
+                dx, dy = xs[position] - x, ys[position] - y
+                squared_distance = dx * dx + dy * dy
+                if len(heap) < k:
+                    heapq.heappush(heap, (-squared_distance, -position))
+                    if len(heap) == k:
+                        worst = -heap[0][0]
+                elif squared_distance < worst or (
+                    squared_distance == worst and position < -heap[0][1]
+                ):
+                    heapq.heapreplace(heap, (-squared_distance, -position))
+                    worst = -heap[0][0]
+
+        return sorted((-distance, -position) for distance, position in heap)
+
+    def nearest(self, point: Point, k: int = 1) -> list[Neighbour]:
+        """
+        Return the points nearest to a point.
+
+        :param point: The point to search around.
+        :param k: The number of points to return.
+
+        :return: The ``k`` nearest points, nearest first.
+        """
+        return [
+            self._neighbour(position, squared_distance)
+            for squared_distance, position in self._nearest(*point, k)
+        ]
+
+    def nearest_many(
+        self,
+        points: Iterable[Point],
+        k: int = 1,
+    ) -> list[list[Neighbour]]:
+        """
+        Return the points nearest to each of several points.
+
+        Each search starts from the answer to the previous one, so queries
+        that arrive in spatial order (such as consecutive positions along a
+        route) are pruned much sooner.
+
+        :param points: The points to search around.
+        :param k: The number of points to return for each point.
+
+        :return: The ``k`` nearest points to each point, nearest first.
+        """
+        nearest, neighbour = self._nearest, self._neighbour
+        results = []
+        hint = None
+        for x, y in points:
+            found = nearest(x, y, k, hint)
+            results.append(
+                [neighbour(position, distance) for distance, position in found]
+            )
+            hint = found[0][1] if found else None
+
+        return results
+
+    def within_radius(self, point: Point, radius: Number) -> list[int]:
+        """
+        Return the points within a distance of a point.
+
+        :param point: The point to search around.
+        :param radius: The greatest distance from the point, inclusive.
+
+        :return: The indices of the points found, in ascending order.
+        """
+        x, y = point
+        xs, ys, indices = self._xs, self._ys, self._indices
+        leaf_size, squared_radius = self._leaf_size, radius * radius
+        found = []
+
+        stack = [(0, len(xs), 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if high - low <= leaf_size:
+                candidates = range(low, high)
+            else:
+                mid = (low + high) // 2
+                candidates = (mid,)
+                diff = x - xs[mid] if depth % 2 == 0 else y - ys[mid]
+                if diff <= radius:
+                    stack.append((low, mid, depth + 1))
+                if diff >= -radius:
+                    stack.append((mid + 1, high, depth + 1))
+
+            found.extend(
+                indices[position]
+                for position in candidates
+                if (xs[position] - x) ** 2 + (ys[position] - y) ** 2
+                <= squared_radius
+            )
+
+        return sorted(found)
+
+    def within_radius_many(
+        self,
+        points: Iterable[Point],
+        radius: Number,
+    ) -> list[list[int]]:
+        """
+        Return the points within a distance of each of several points.
+
+        :param points: The points to search around.
+        :param radius: The greatest distance from each point, inclusive.
+
+        :return: The indices of the points found for each point, in ascending
+            order.
+        """
+        within_radius = self.within_radius
+        return [within_radius(point, radius) for point in points]
+
+    def within_box(self, min_point: Point, max_point: Point) -> list[int]:
+        """
+        Return the points inside a box.
+
+        :param min_point: The bottom-left corner of the box.
+        :param max_point: The top-right corner of the box.
+
+        :return: The indices of the points found, in ascending order.
+        """
+        min_x, min_y = min_point
+        max_x, max_y = max_point
+        xs, ys, indices = self._xs, self._ys, self._indices
+        leaf_size = self._leaf_size
+        found = []
+
+        stack = [(0, len(xs), 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if high - low <= leaf_size:
+                candidates = range(low, high)
+            else:
+                mid = (low + high) // 2
+                candidates = (mid,)
+                if depth % 2 == 0:
+                    lower, upper, split = min_x, max_x, xs[mid]
+                else:
+                    lower, upper, split = min_y, max_y, ys[mid]
+                if lower <= split:
+                    stack.append((low, mid, depth + 1))
+                if upper >= split:
+                    stack.append((mid + 1, high, depth + 1))
+
+            found.extend(
+                indices[position]
+                for position in candidates
+                if min_x <= xs[position] <= max_x
+                and min_y <= ys[position] <= max_y
+            )
+
+        return sorted(found)
@@ -0,0 +1,342 @@
+"""
+A lazy expression defers arithmetic on points until its result is needed.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from geometry.affine import Affine2D
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+
+_SYMBOLS = {"add": "+", "sub": "-", "mul": "*"}
+
+
+class Expression:
+    """
+    A deferred computation on a point or a batch of points.
+
+    Arithmetic, ``transform`` and ``rotate`` on an expression return a new
+    expression instead of a result, so a chain such as
+    ``((p - c).rotate(by=a, around=o) * s) + t`` is recorded as a graph.
+    Nothing is worked out until the expression is computed or iterated
+    over. Then the whole graph is compiled into a single loop that carries
+    each point through every step, so no intermediate batch is built, and
+    steps that appear more than once in the graph are worked out once per
+    point. Steps that only involve single points are worked out once, before
+    the loop.
+
+    Each step does the same floating point operations, in the same order,
+    as the eager methods of ``Point``, so the results are equal to applying
+    those methods one at a time.
+    """
+
+    __slots__ = ("_args", "_batch", "_kernels", "_key", "_op")
+
+    def __init__(self, op: str, args: tuple[Any, ...], key: tuple) -> None:
+        self._op = op
+        self._args = args
+        self._key = key
+        self._batch = (op == "source" and isinstance(args[0], PointArray)) or (
+            any(isinstance(arg, Expression) and arg._batch for arg in args)
+        )
+        self._kernels: dict[str, tuple[Callable, list[Any]]] = {}
+
+    def __str__(self) -> str:
+        return f"Expression({self._describe()})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __add__(self, other: Expression | Number | Point) -> Expression:
+        return self._binary("add", other)
+
+    def __radd__(self, other: Number | Point) -> Expression:
+        return self._binary("add", other)
+
+    def __sub__(self, other: Expression | Number | Point) -> Expression:
+        return self._binary("sub", other)
+
+    def __rsub__(self, other: Number | Point) -> Expression:
+        return self._binary("rsub", other)
+
+    def __neg__(self) -> Expression:
+        return Expression("neg", (self,), ("neg", self._key))
+
+    def __mul__(self, other: Expression | Number | Point) -> Expression:
+        return self._binary("mul", other)
+
+    def __rmul__(self, other: Number | Point) -> Expression:
+        return self._binary("mul", other)
+
+    def transform(
+        self,
+        matrix: Affine2D,
+        *,
+        ndigits: int | None = None,
+    ) -> Expression:
+        """
+        Defer an affine transformation of the points.
+
+        :param matrix: The transformation to apply.
+        :param ndigits: The number of decimal places to round the coordinates
+            to. Defaults to no rounding.
+
+        :return: A new expression.
+
+        :raises TypeError: If the number of decimal places is not an integer
+            or ``None``.
+        """
+        if ndigits is not None and not isinstance(ndigits, int):
+            raise TypeError("The number of decimal places must be an integer.")
+
+        matrix = Affine2D(*matrix)
+        key = ("transform", self._key, tuple(map(repr, matrix)), ndigits)
+        return Expression("transform", (self, matrix, ndigits), key)
+
+    def rotate(self, *, by: Number, around: Point) -> Expression:
+        """
+        Defer a rotation of the points anticlockwise around a point,
+        ``around``, by an angle, ``by``.
+
+        The coordinates are rounded like ``Point.rotate``: the offset from
+        ``around`` is rotated and rounded to 8 decimal places before
+        ``around`` is added back.
+
+        :param by: The angle to rotate by, in radians.
+        :param around: The point to rotate around.
+
+        :return: A new expression.
+        """
+        offset = (self - around).transform(Affine2D.rotation(by), ndigits=8)
+        return offset + around
+
+    def compute(self) -> Point | PointArray:
+        """
+        Work out the expression.
+
+        :return: A point if every operand was a single point, or a point
+            array otherwise.
+
+        :raises ValueError: If the batches in the expression have different
+            lengths.
+        """
+        kernel, columns = self._kernel("compute")
+        if not self._batch:
+            return kernel()
+
+        xs, ys = kernel(*columns)
+        return PointArray._from_buffers(xs, ys)
+
+    def __iter__(self) -> Iterator[Point] | Iterator[Number]:
+        """
+        Work out the expression a point at a time.
+
+        A batch yields its points as they are worked out, without building
+        the whole result. A single point is computed and unpacked into its
+        coordinates, as a ``Point`` would be.
+        """
+        if not self._batch:
+            return iter(self.compute())
+
+        kernel, columns = self._kernel("iterate")
+        return kernel(*columns)
+
+    def _binary(self, op: str, other: Any) -> Expression:
+        """
+        Defer a binary operator between this expression and another operand.
+        """
+        if isinstance(other, Expression):
+            operand = other
+        elif isinstance(other, Point | PointArray):
+            operand = lazy(other)
+        elif isinstance(other, Number):
+            operand = Expression("number", (other,), ("number", repr(other)))
+        else:
+            return NotImplemented
+
+        return Expression(op, (self, operand), (op, self._key, operand._key))
+
+    def _describe(self) -> str:
+        """
+        Return a description of the expression as it would be written.
+        """
+        op, args = self._op, self._args
+        if op == "source" and self._batch:
+            return f"<{len(args[0])} points>"
+        if op in ("source", "number"):
+            return repr(args[0])
+        if op == "neg":
+            return f"-{args[0]._describe()}"
+        if op == "transform":
+            return (
+                f"{args[0]._describe()}.transform({args[1]}, ndigits={args[2]})"
+            )
+        if op == "rsub":
+            return f"({args[1]._describe()} - {args[0]._describe()})"
+
+        symbol = _SYMBOLS[op]
+        return f"({args[0]._describe()} {symbol} {args[1]._describe()})"
+
+    def _kernel(self, mode: str) -> tuple[Callable, list[Any]]:
+        """
+        Return the compiled function that works out the expression, and the
+        columns of the batches to call it with.
+        """
+        if mode not in self._kernels:
+            self._kernels[mode] = _compile(self, mode)
+
+        kernel, batches = self._kernels[mode]
+        lengths = {len(batch) for batch in batches}
+        if len(lengths) > 1:
+            raise ValueError("Point arrays must be the same length.")
+
+        columns = [
+            column for batch in batches for column in (batch._xs, batch._ys)
+        ]
+        return kernel, columns
+
+
+def lazy(points: Point | Iterable[Point] | Expression) -> Expression:
+    """
+    Start a lazy expression from a point or a batch of points.
+
+    :param points: A point, a point array, or an iterable of points, which
+        is read into a point array straight away.
+
+    :return: An expression of the points, to build on with arithmetic,
+        ``transform`` and ``rotate``.
+    """
+    if isinstance(points, Expression):
+        return points
+    if isinstance(points, Point):
+        key = ("point", repr(points.x), repr(points.y))
+        return Expression("source", (points,), key)
+    if not isinstance(points, PointArray):
+        points = PointArray.from_points(points)
+
+    return Expression("source", (points,), ("source", id(points)))
+
+
+def _compile(
+    root: Expression,
+    mode: str,
+) -> tuple[Callable, list[PointArray]]:
+    """
+    Generate and compile the function that works out an expression.
+
+    Each distinct step in the graph becomes a pair of assignments to local
+    variables, one for each coordinate. Steps that depend on a batch go in
+    the body of a loop over the batches, and the others go before it.
+
+    :return: The function, and the batches whose columns it takes as
+        arguments, in order.
+    """
+    names: dict[tuple, tuple[str, str]] = {}
+    constants: list[Any] = []
+    batches: list[PointArray] = []
+    before: list[str] = []
+    body: list[str] = []
+
+    def constant(value: Any) -> str:
+        constants.append(value)
+        return f"k{len(constants) - 1}"
+
+    def visit(node: Expression) -> tuple[str, str]:
+        if node._key in names:
+            return names[node._key]
+
+        op, args = node._op, node._args
+        lines = body if node._batch else before
+        operands = [visit(arg) for arg in args if isinstance(arg, Expression)]
+        x, y = f"x{len(names)}", f"y{len(names)}"
+        if op == "source" and node._batch:
+            batches.append(args[0])
+        elif op == "source":
+            lines.append(f"{x}, {y} = {constant(args[0])}")
+        elif op == "number":
+            x = y = constant(args[0])
+        else:
+            lines += _step(node, operands, (x, y), constant)
+
+        names[node._key] = (x, y)
+        return x, y
+
+    result_x, result_y = visit(root)
+    columns = ", ".join(f"xs{i}, ys{i}" for i in range(len(batches)))
+    variables = ", ".join(
+        ", ".join(names[("source", id(batch))]) for batch in batches
+    )
+
+    source = [f"def kernel({columns}):"]
+    if constants:
+        unpacked = "".join(f"k{i}, " for i in range(len(constants)))
+        source.append(f"    {unpacked}= constants")
+    source += [f"    {line}" for line in before]
+    if not root._batch:
+        source.append(f"    return Point({result_x}, {result_y})")
+    elif mode == "compute":
+        source += [
+            "    result_xs, result_ys = array('d'), array('d')",
+            "    append_x, append_y = result_xs.append, result_ys.append",
+            f"    for {variables} in zip({columns}):",
+            *(f"        {line}" for line in body),
+            f"        append_x({result_x})",
+            f"        append_y({result_y})",
+            "    return result_xs, result_ys",
+        ]
+    else:
+        source += [
+            f"    for {variables} in zip({columns}):",
+            *(f"        {line}" for line in body),
+            f"        yield Point({result_x}, {result_y})",
+        ]
+
+    namespace = {"Point": Point, "array": array, "constants": tuple(constants)}
+    code = compile("\n".join(source), "<lazy expression>", "exec")
+    exec(code, namespace)  # noqa: S102
+    return namespace["kernel"], batches
+
+
+def _step(
+    node: Expression,
+    operands: list[tuple[str, str]],
+    names: tuple[str, str],
+    constant: Callable[[Any], str],
+) -> list[str]:
+    """
+    Return the assignments that work out one step of an expression from the
+    variables that hold its operands.
+    """
+    op, args = node._op, node._args
+    x, y = names
+    if op == "neg":
+        ((ax, ay),) = operands
+        return [f"{x} = -{ax}", f"{y} = -{ay}"]
+    if op == "transform":
+        ((ax, ay),) = operands
+        a, b, c, d, e, f = map(constant, args[1])
+        lines = [
+            f"{x} = {a} * {ax} + {b} * {ay} + {c}",
+            f"{y} = {d} * {ax} + {e} * {ay} + {f}",
+        ]
+        if args[2] is not None:
+            ndigits = constant(args[2])
+            lines += [
+                f"{x} = round({x}, {ndigits})",
+                f"{y} = round({y}, {ndigits})",
+            ]
+        return lines
+
+    (ax, ay), (bx, by) = operands
+    if op == "rsub" and args[1]._op == "number":
+        # ``Point.__rsub__`` negates the difference taken the other way
+        return [f"{x} = -({ax} - {bx})", f"{y} = -({ay} - {by})"]
+    if op == "rsub":
+        return [f"{x} = {bx} - {ax}", f"{y} = {by} - {ay}"]
+
+    symbol = _SYMBOLS[op]
+    return [f"{x} = {ax} {symbol} {bx}", f"{y} = {ay} {symbol} {by}"]
@@ -5,21 +5,78 @@ A line is the space between two points.
 from __future__ import annotations
 
 import math
+from typing import TYPE_CHECKING
 
+from geometry.affine import Affine2D
+from geometry.box import BoundingBox, clip_interval
 from geometry.point import Number, Point
+from geometry.predicates import orient2d
+
+if TYPE_CHECKING:
+    from geometry.interning import PointPool
+
+# Marks a derived value that has not been worked out yet, since ``None`` is a
+# valid intercept
+_UNSET = object()
 
 
 class Line:
     """
     The space between two points.
+
+    Lines are immutable. The slope, intercept, length, and bounding box are
+    worked out the first time they are needed and then kept, so they are
+    never calculated more than once per line.
     """
 
-    start: Number | Point
-    end: Number | Point
+    __slots__ = (
+        "_bounding_box",
+        "_end",
+        "_intercept",
+        "_length",
+        "_slope",
+        "_start",
+    )
+
+    def __init__(
+        self,
+        start: Number | Point,
+        end: Number | Point,
+        *,
+        pool: PointPool | None = None,
+    ) -> None:
+        """
+        Create a line between two points.
+
+        :param start: The start point, or a number to use for both of its
+            coordinates.
+        :param end: The end point, or a number to use for both of its
+            coordinates.
+        :param pool: A pool to intern the points in, so that lines sharing
+            an end share one instance of it.
+        """
+        start = start if isinstance(start, Point) else Point(start, start)
+        end = end if isinstance(end, Point) else Point(end, end)
+        if pool is not None:
+            start, end = pool.intern(start), pool.intern(end)
+        self._start = start
+        self._end = end
+        self._slope = self._intercept = self._length = _UNSET
+        self._bounding_box = _UNSET
+
+    @property
+    def start(self) -> Point:
+        """
+        Return the start point of the line.
+        """
+        return self._start
 
-    def __init__(self, start: Number | Point, end: Number | Point) -> None:
-        self.start = start if isinstance(start, Point) else Point(start, start)
-        self.end = end if isinstance(end, Point) else Point(end, end)
+    @property
+    def end(self) -> Point:
+        """
+        Return the end point of the line.
+        """
+        return self._end
 
     def __hash__(self) -> int:
         return hash((self.start, self.end))
@@ -36,6 +93,11 @@ class Line:
 
         return NotImplemented
 
+    def __reduce__(self) -> tuple[type[Line], tuple[Point, Point]]:
+        # Only the points are kept, as the cached values are marked unset
+        # with a sentinel that is not the same object once unpickled
+        return Line, (self._start, self._end)
+
     def __add__(self, other: Number | Point) -> Line:
         """
         Add a line to a number or point.
@@ -86,9 +148,13 @@ class Line:
         """
         Return the length of the line.
         """
-        return math.sqrt(
-            (self.end.x - self.start.x) ** 2 + (self.end.y - self.start.y) ** 2
-        )
+        if self._length is _UNSET:
+            self._length = math.sqrt(
+                (self._end.x - self._start.x) ** 2
+                + (self._end.y - self._start.y) ** 2
+            )
+
+        return self._length
 
     @property
     def slope(self) -> Number:
@@ -97,10 +163,15 @@ class Line:
 
         If the line is vertical, return infinity.
         """
-        if self.end.x == self.start.x:
-            return math.inf
+        if self._slope is _UNSET:
+            start, end = self._start, self._end
+            self._slope = (
+                math.inf
+                if end.x == start.x
+                else (end.y - start.y) / (end.x - start.x)
+            )
 
-        return (self.end.y - self.start.y) / (self.end.x - self.start.x)
+        return self._slope
 
     @property
     def intercept(self) -> Number:
@@ -109,30 +180,147 @@ class Line:
 
         If the line is vertical, return ``None``.
         """
-        if self.slope == math.inf:
-            return None
+        if self._intercept is _UNSET:
+            slope = self.slope
+            self._intercept = (
+                None
+                if slope == math.inf
+                else self._start.y - slope * self._start.x
+            )
 
-        return self.start.y - self.slope * self.start.x
+        return self._intercept
+
+    @property
+    def bounding_box(self) -> BoundingBox:
+        """
+        Return the smallest axis-aligned box around the line.
+        """
+        if self._bounding_box is _UNSET:
+            start, end = self._start, self._end
+            self._bounding_box = BoundingBox(
+                Point(min(start.x, end.x), min(start.y, end.y)),
+                Point(max(start.x, end.x), max(start.y, end.y)),
+            )
+
+        return self._bounding_box
 
     def contains(self, point: Point) -> bool:
         """
         Return whether the line contains a point.
 
+        The check is exact: the point must be within the line's bounding box
+        and exactly collinear with its ends, as decided by ``orient2d``.
+
         :param point: The point to check.
 
         :return: Whether the line contains the point.
         """
-        if self.slope == math.inf:
-            return (
-                self.start.x == point.x
-                and self.start.y <= point.y <= self.end.y
-            )
-
+        (start_x, start_y), (end_x, end_y) = self._start, self._end
+        x, y = point
         return (
-            self.start.x <= point.x <= self.end.x
-            and self.start.y <= point.y <= self.end.y
-            # whether y = mx + c holds
-            and math.isclose(point.y, self.slope * point.x + self.intercept)
+            (start_x <= x <= end_x or end_x <= x <= start_x)
+            and (start_y <= y <= end_y or end_y <= y <= start_y)
+            and orient2d(self._start, self._end, point) == 0
+        )
+
+    def closest_point(self, point: Point) -> Point:
+        """
+        Return the point on the line closest to a point.
+
+        :param point: The point to get close to.
+
+        :return: The closest point on the line.
+        """
+        d_x, d_y = self.end.x - self.start.x, self.end.y - self.start.y
+        squared_length = d_x * d_x + d_y * d_y
+        if squared_length == 0:
+            return self.start
+
+        t = (
+            (point.x - self.start.x) * d_x + (point.y - self.start.y) * d_y
+        ) / squared_length
+        return _interpolate(self.start, self.end, min(max(t, 0), 1))
+
+    def distance_to(self, point: Point) -> Number:
+        """
+        Return the shortest distance from the line to a point.
+
+        :param point: The point to measure to.
+
+        :return: The distance to the closest point on the line.
+        """
+        closest = self.closest_point(point)
+        return math.sqrt(
+            (point.x - closest.x) ** 2 + (point.y - closest.y) ** 2
+        )
+
+    def crosses_box(self, min_point: Point, max_point: Point) -> bool:
+        """
+        Return whether the line passes through an axis-aligned box.
+
+        This clips the line to the box (Liang-Barsky) and checks whether any
+        of it is left, so vertical and horizontal lines need no special
+        handling.
+
+        :param min_point: The bottom-left corner of the box.
+        :param max_point: The top-right corner of the box.
+
+        :return: Whether any part of the line is inside the box.
+        """
+        segment = (*self._start, *self._end)
+        return clip_interval(segment, min_point, max_point) is not None
+
+    def intersection(self, other: Line) -> Point | Line | None:
+        """
+        Return where the line meets another line.
+
+        Lines that cross or touch meet at a point. Lines that are collinear
+        and overlap meet along the line they share. Vertical lines need no
+        special handling since the lines are compared as vectors rather than
+        by their slopes.
+
+        :param other: The line to intersect with.
+
+        :return: The point or line where the lines meet, or ``None`` if they
+            do not meet.
+        """
+        start, end = self.start, self.end
+        other_start, other_end = other.start, other.end
+        r_x, r_y = end.x - start.x, end.y - start.y
+        s_x, s_y = other_end.x - other_start.x, other_end.y - other_start.y
+        q_x, q_y = other_start.x - start.x, other_start.y - start.y
+
+        denominator = r_x * s_y - r_y * s_x
+        if denominator != 0:
+            t = (q_x * s_y - q_y * s_x) / denominator
+            u = (q_x * r_y - q_y * r_x) / denominator
+            if not (0 <= t <= 1 and 0 <= u <= 1):
+                return None
+            # Return endpoints exactly when the lines touch at them
+            if u in {0, 1}:
+                return _interpolate(other_start, other_end, u)
+            return _interpolate(start, end, t)
+
+        return _overlap(self, other)
+
+    def transform(
+        self,
+        matrix: Affine2D,
+        *,
+        ndigits: int | None = None,
+    ) -> Line:
+        """
+        Apply an affine transformation to the line.
+
+        :param matrix: The transformation to apply.
+        :param ndigits: The number of decimal places to round the coordinates
+            to. Defaults to no rounding.
+
+        :return: A new transformed line.
+        """
+        return Line(
+            self.start.transform(matrix, ndigits=ndigits),
+            self.end.transform(matrix, ndigits=ndigits),
         )
 
     def rotate(self, angle: Number) -> Line:
@@ -155,3 +343,71 @@ class Line:
         Return the line as a vector.
         """
         return self.end - self.start
+
+
+def _overlap(line: Line, other: Line) -> Point | Line | None:
+    """
+    Return where two parallel lines meet.
+
+    Parallel lines only meet when they are collinear, in which case they meet
+    along the part they share (which may be a single point).
+    """
+    start, end = line.start, line.end
+    other_start, other_end = other.start, other.end
+    r_x, r_y = end.x - start.x, end.y - start.y
+    s_x, s_y = other_end.x - other_start.x, other_end.y - other_start.y
+    q_x, q_y = other_start.x - start.x, other_start.y - start.y
+
+    if r_x == r_y == 0:
+        return start if _on_segment(start, other_start, other_end) else None
+    if s_x == s_y == 0:
+        return other_start if _on_segment(other_start, start, end) else None
+    if q_x * r_y - q_y * r_x != 0:
+        return None
+
+    # Order the other endpoints along the line and clamp them to the line
+    squared_length = r_x * r_x + r_y * r_y
+    other_start_t = (q_x * r_x + q_y * r_y) / squared_length
+    other_end_t = other_start_t + (s_x * r_x + s_y * r_y) / squared_length
+    (low_t, low), (high_t, high) = sorted(
+        [(other_start_t, other_start), (other_end_t, other_end)],
+        key=lambda pair: pair[0],
+    )
+    if low_t <= 0:
+        low_t, low = 0, start
+    if high_t >= 1:
+        high_t, high = 1, end
+    if low_t > high_t:
+        return None
+    if low_t == high_t:
+        return low
+
+    return Line(low, high)
+
+
+def _interpolate(start: Point, end: Point, t: Number) -> Point:
+    """
+    Return the point a proportion, ``t``, of the way from one point to another.
+    """
+    if t == 0:
+        return start
+    if t == 1:
+        return end
+
+    return Point(
+        start.x + t * (end.x - start.x), start.y + t * (end.y - start.y)
+    )
+
+
+def _on_segment(point: Point, start: Point, end: Point) -> bool:
+    """
+    Return whether a point lies on the segment between two points.
+    """
+    d_x, d_y = end.x - start.x, end.y - start.y
+    p_x, p_y = point.x - start.x, point.y - start.y
+    if d_x == d_y == 0:
+        return p_x == p_y == 0
+    if p_x * d_y - p_y * d_x != 0:
+        return False
+
+    return 0 <= p_x * d_x + p_y * d_y <= d_x * d_x + d_y * d_y
@@ -0,0 +1,267 @@
+"""
+A line array is a column-oriented collection of lines.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+
+from geometry.affine import Affine2D
+from geometry.line import Line
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+from geometry.predicates import orient2d
+
+
+class LineArray:
+    """
+    A collection of lines.
+
+    The lines are stored as four contiguous buffers of doubles -- the start x,
+    start y, end x, and end y coordinates -- so that properties of the whole
+    collection are computed in a single pass without creating a ``Line`` per
+    segment.
+    """
+
+    __slots__ = ("_end_xs", "_end_ys", "_start_xs", "_start_ys")
+
+    def __init__(
+        self,
+        starts: Iterable[Point] = (),
+        ends: Iterable[Point] = (),
+    ) -> None:
+        starts = PointArray.from_points(starts)
+        ends = PointArray.from_points(ends)
+        if len(starts) != len(ends):
+            raise ValueError(
+                "The start and end points must be the same length."
+            )
+
+        self._start_xs, self._start_ys = starts.xs, starts.ys
+        self._end_xs, self._end_ys = ends.xs, ends.ys
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Line]) -> LineArray:
+        """
+        Create a line array from an iterable of lines.
+
+        :param lines: The lines to collect.
+
+        :return: A new line array.
+        """
+        if isinstance(lines, LineArray):
+            return cls(lines.starts, lines.ends)
+
+        flat = array(
+            "d",
+            itertools.chain.from_iterable(
+                (*line.start, *line.end) for line in lines
+            ),
+        )
+        return cls._from_buffers(flat[0::4], flat[1::4], flat[2::4], flat[3::4])
+
+    @classmethod
+    def _from_buffers(
+        cls,
+        start_xs: array,
+        start_ys: array,
+        end_xs: array,
+        end_ys: array,
+    ) -> LineArray:
+        """
+        Create a line array that takes ownership of existing buffers.
+        """
+        line_array = cls.__new__(cls)
+        line_array._start_xs = start_xs
+        line_array._start_ys = start_ys
+        line_array._end_xs = end_xs
+        line_array._end_ys = end_ys
+
+        return line_array
+
+    @property
+    def starts(self) -> PointArray:
+        """
+        Return the start points of the lines.
+        """
+        return PointArray._from_buffers(self._start_xs, self._start_ys)
+
+    @property
+    def ends(self) -> PointArray:
+        """
+        Return the end points of the lines.
+        """
+        return PointArray._from_buffers(self._end_xs, self._end_ys)
+
+    def to_lines(self) -> list[Line]:
+        """
+        Return the line array as a list of lines.
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self._start_xs)
+
+    def __iter__(self) -> Iterator[Line]:
+        return map(Line, self.starts, self.ends)
+
+    def __getitem__(self, index: int | slice) -> Line | LineArray:
+        if isinstance(index, slice):
+            return self._from_buffers(
+                self._start_xs[index],
+                self._start_ys[index],
+                self._end_xs[index],
+                self._end_ys[index],
+            )
+
+        return Line(
+            Point(self._start_xs[index], self._start_ys[index]),
+            Point(self._end_xs[index], self._end_ys[index]),
+        )
+
+    def __str__(self) -> str:
+        return f"LineArray({self.to_lines()})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __eq__(self, other: LineArray) -> bool:
+        if isinstance(other, LineArray):
+            return (
+                self._start_xs == other._start_xs
+                and self._start_ys == other._start_ys
+                and self._end_xs == other._end_xs
+                and self._end_ys == other._end_ys
+            )
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def _columns(self) -> Iterator[tuple[float, float, float, float]]:
+        """
+        Iterate over the coordinates of each line.
+        """
+        return zip(
+            self._start_xs,
+            self._start_ys,
+            self._end_xs,
+            self._end_ys,
+            strict=True,
+        )
+
+    @property
+    def length(self) -> array:
+        """
+        Return the length of each line.
+        """
+        return array(
+            "d",
+            [
+                math.sqrt((end_x - start_x) ** 2 + (end_y - start_y) ** 2)
+                for start_x, start_y, end_x, end_y in self._columns()
+            ],
+        )
+
+    @property
+    def slope(self) -> array:
+        """
+        Return the slope of each line.
+
+        Vertical lines have a slope of infinity.
+        """
+        return array(
+            "d",
+            [
+                math.inf
+                if end_x == start_x
+                else (end_y - start_y) / (end_x - start_x)
+                for start_x, start_y, end_x, end_y in self._columns()
+            ],
+        )
+
+    @property
+    def intercept(self) -> list[Number | None]:
+        """
+        Return the y-intercept of each line.
+
+        Vertical lines have an intercept of ``None``.
+        """
+        return [
+            None
+            if end_x == start_x
+            else start_y - (end_y - start_y) / (end_x - start_x) * start_x
+            for start_x, start_y, end_x, end_y in self._columns()
+        ]
+
+    def transform(
+        self,
+        matrix: Affine2D,
+        *,
+        ndigits: int | None = None,
+    ) -> LineArray:
+        """
+        Apply an affine transformation to every line.
+
+        :param matrix: The transformation to apply.
+        :param ndigits: The number of decimal places to round the coordinates
+            to. Defaults to no rounding.
+
+        :return: A new line array of transformed lines.
+        """
+        starts = self.starts.transform(matrix, ndigits=ndigits)
+        ends = self.ends.transform(matrix, ndigits=ndigits)
+
+        return self._from_buffers(starts.xs, starts.ys, ends.xs, ends.ys)
+
+    def contains_many(self, points: Point | Iterable[Point]) -> list[bool]:
+        """
+        Return whether each line contains a point.
+
+        Passing a single point checks that point against every line. Passing
+        several points checks each point against the line at the same
+        position.
+
+        :param points: The point, or points, to check.
+
+        :return: Whether each line contains its point.
+
+        :raises ValueError: If the number of points and lines differ.
+        """
+        if isinstance(points, Point):
+            point_xs = itertools.repeat(points.x)
+            point_ys = itertools.repeat(points.y)
+        else:
+            points = PointArray.from_points(points)
+            if len(points) != len(self):
+                raise ValueError("There must be one point per line.")
+            point_xs, point_ys = points.xs, points.ys
+
+        return [
+            _contains(line, point_x, point_y)
+            for line, point_x, point_y in zip(
+                self._columns(), point_xs, point_ys, strict=False
+            )
+        ]
+
+
+def _contains(
+    line: tuple[float, float, float, float],
+    point_x: float,
+    point_y: float,
+) -> bool:
+    """
+    Return whether a line contains a point.
+
+    This mirrors ``Line.contains`` on unpacked coordinates.
+    """
+    start_x, start_y, end_x, end_y = line
+    return (
+        (start_x <= point_x <= end_x or end_x <= point_x <= start_x)
+        and (start_y <= point_y <= end_y or end_y <= point_y <= start_y)
+        and orient2d((start_x, start_y), (end_x, end_y), (point_x, point_y))
+        == 0
+    )
@@ -0,0 +1,396 @@
+"""
+Run operations on large batches of points and lines across several processes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import pickle
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, NamedTuple
+
+from geometry.affine import Affine2D
+from geometry.bvh import BVH
+from geometry.kdtree import KDTree, Neighbour
+from geometry.line_array import LineArray
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+
+# The index each worker process last unpickled, by the name of the shared
+# memory it was read from, so it is only unpickled once per call
+_INDEXES: dict[str, KDTree | BVH] = {}
+
+
+class ParallelExecutor:
+    """
+    Split batches of points and lines into chunks and process the chunks in
+    a pool of worker processes.
+
+    The coordinates are copied once into shared memory that every worker
+    reads its chunk from, so they are never pickled, and results that are
+    coordinates are written back the same way. An index being queried is
+    pickled once into shared memory and unpickled once by each worker,
+    rather than sent with every chunk. The workers run the same code
+    as the serial operations, so the results are identical to them. Batches
+    that fit in a single chunk are processed in the calling process.
+    """
+
+    __slots__ = ("_chunk_size", "_pool")
+
+    def __init__(
+        self,
+        *,
+        workers: int | None = None,
+        chunk_size: int = 65_536,
+    ) -> None:
+        """
+        Start the worker processes.
+
+        :param workers: The number of worker processes. Defaults to the
+            number of processors.
+        :param chunk_size: The most points or lines to send to a worker at
+            once.
+
+        :raises ValueError: If the chunk size is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
+
+        self._chunk_size = chunk_size
+        self._pool = ProcessPoolExecutor(max_workers=workers)
+
+    def close(self) -> None:
+        """
+        Stop the worker processes.
+        """
+        self._pool.shutdown()
+
+    def __enter__(self) -> ParallelExecutor:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def transform(
+        self,
+        batch: PointArray | LineArray,
+        matrix: Affine2D,
+        *,
+        ndigits: int | None = None,
+    ) -> PointArray | LineArray:
+        """
+        Apply an affine transformation to every point or line in a batch.
+
+        :param batch: The points or lines to transform.
+        :param matrix: The transformation to apply.
+        :param ndigits: The number of decimal places to round the coordinates
+            to. Defaults to no rounding.
+
+        :return: A new batch of transformed points or lines.
+        """
+        columns = _columns(batch)
+        transformed = self._map(
+            _transform, columns, (matrix, ndigits), outputs=len(columns)
+        )
+        return _batch(transformed)
+
+    def length(self, lines: LineArray) -> array:
+        """
+        Return the length of each line.
+
+        :param lines: The lines to measure.
+
+        :return: The length of each line.
+        """
+        (lengths,) = self._map(_length, _columns(lines), (), outputs=1)
+        return lengths
+
+    def contains_many(
+        self,
+        lines: LineArray,
+        points: Point | Iterable[Point],
+    ) -> list[bool]:
+        """
+        Return whether each line contains a point, as
+        ``LineArray.contains_many`` does.
+
+        :param lines: The lines to check.
+        :param points: The point, or points, to check.
+
+        :return: Whether each line contains its point.
+
+        :raises ValueError: If the number of points and lines differ.
+        """
+        if isinstance(points, Point):
+            return self._map(_contains, _columns(lines), (points,))
+
+        points = PointArray.from_points(points)
+        if len(points) != len(lines):
+            raise ValueError("There must be one point per line.")
+
+        return self._map(_contains, _columns(lines) + _columns(points), (None,))
+
+    def nearest_many(
+        self,
+        index: KDTree | BVH,
+        points: Iterable[Point],
+        k: int = 1,
+    ) -> list[list[Neighbour]]:
+        """
+        Return the points or lines in an index nearest to each of several
+        points.
+
+        The index is copied to each worker once, however many chunks it
+        searches.
+
+        :param index: The index to search.
+        :param points: The points to search around.
+        :param k: The number of neighbours to return for each point.
+
+        :return: The ``k`` nearest neighbours to each point, nearest first.
+        """
+        points = PointArray.from_points(points)
+        return self._map(_nearest, _columns(points), (k,), index=index)
+
+    def within_radius_many(
+        self,
+        index: KDTree,
+        points: Iterable[Point],
+        radius: Number,
+    ) -> list[list[int]]:
+        """
+        Return the points in an index within a distance of each of several
+        points.
+
+        The index is copied to each worker once, however many chunks it
+        searches.
+
+        :param index: The index to search.
+        :param points: The points to search around.
+        :param radius: The greatest distance from each point, inclusive.
+
+        :return: The indices of the points found for each point, in ascending
+            order.
+        """
+        points = PointArray.from_points(points)
+        return self._map(
+            _within_radius, _columns(points), (radius,), index=index
+        )
+
+    def _map(
+        self,
+        task: Callable[..., Any],
+        columns: Sequence[array],
+        arguments: tuple,
+        *,
+        outputs: int = 0,
+        index: KDTree | BVH | None = None,
+    ) -> Any:
+        """
+        Run a task over chunks of columns of coordinates.
+
+        Tasks with ``outputs`` return that many columns for each chunk, which
+        are written to shared memory and returned as arrays. Other tasks
+        return a list for each chunk, which are joined into one list. Tasks
+        given an ``index`` take it before their other arguments, and it is
+        pickled into shared memory once rather than sent with each chunk.
+        """
+        size = len(columns[0])
+        if size <= self._chunk_size:
+            if index is not None:
+                arguments = (index, *arguments)
+            return task(columns, *arguments)
+
+        with (
+            _shared_memory(8 * size * (len(columns) + outputs)) as memory,
+            _shared_index(index) as shared,
+        ):
+            with memory.buf.cast("d") as view:
+                for i, column in enumerate(columns):
+                    view[i * size : (i + 1) * size] = column
+
+            if shared is not None:
+                arguments = (shared, *arguments)
+            futures = [
+                self._pool.submit(
+                    _run,
+                    memory.name,
+                    (size, len(columns), outputs),
+                    range(start, min(start + self._chunk_size, size)),
+                    task,
+                    arguments,
+                )
+                for start in range(0, size, self._chunk_size)
+            ]
+            results = [future.result() for future in futures]
+
+            if not outputs:
+                return [item for result in results for item in result]
+
+            with memory.buf.cast("d") as view:
+                return [
+                    array("d", view[i * size : (i + 1) * size])
+                    for i in range(len(columns), len(columns) + outputs)
+                ]
+
+
+@contextlib.contextmanager
+def _shared_memory(size: int) -> Iterator[SharedMemory]:
+    """
+    Create a block of shared memory that is freed on exit.
+    """
+    memory = SharedMemory(create=True, size=size)
+    try:
+        yield memory
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+class _SharedIndex(NamedTuple):
+    """
+    An index pickled into a block of shared memory, which is sent to the
+    workers in place of the index.
+    """
+
+    name: str
+    length: int
+
+
+@contextlib.contextmanager
+def _shared_index(index: KDTree | BVH | None) -> Iterator[_SharedIndex | None]:
+    """
+    Pickle an index into a block of shared memory that is freed on exit.
+    """
+    if index is None:
+        yield None
+        return
+
+    data = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+    with _shared_memory(len(data)) as memory:
+        memory.buf[: len(data)] = data
+        yield _SharedIndex(memory.name, len(data))
+
+
+def _load_index(shared: _SharedIndex) -> KDTree | BVH:
+    """
+    Return the index in a block of shared memory, unpickling it only the
+    first time this worker sees the block.
+
+    This runs in a worker process.
+    """
+    name, length = shared
+    index = _INDEXES.get(name)
+    if index is None:
+        memory = SharedMemory(name=name)
+        try:
+            with memory.buf[:length] as data:
+                index = pickle.loads(data)  # noqa: S301
+        finally:
+            memory.close()
+        # Only the latest index is kept, as earlier ones are never reused
+        _INDEXES.clear()
+        _INDEXES[name] = index
+
+    return index
+
+
+def _run(
+    name: str,
+    shape: tuple[int, int, int],
+    chunk: range,
+    task: Callable[..., Any],
+    arguments: tuple,
+) -> list | None:
+    """
+    Run a task on one chunk of the columns in a block of shared memory.
+
+    This runs in a worker process.
+    """
+    arguments = tuple(
+        _load_index(argument)
+        if isinstance(argument, _SharedIndex)
+        else argument
+        for argument in arguments
+    )
+    size, inputs, outputs = shape
+    memory = SharedMemory(name=name)
+    try:
+        with memory.buf.cast("d") as view:
+            columns = [
+                array("d", view[i * size + chunk.start : i * size + chunk.stop])
+                for i in range(inputs)
+            ]
+            result = task(columns, *arguments)
+            if not outputs:
+                return result
+
+            for i, column in enumerate(result, inputs):
+                view[i * size + chunk.start : i * size + chunk.stop] = column
+            return None
+    finally:
+        memory.close()
+
+
+def _columns(batch: PointArray | LineArray) -> list[array]:
+    """
+    Return the coordinate buffers of a batch of points or lines.
+    """
+    if isinstance(batch, PointArray):
+        return [batch.xs, batch.ys]
+
+    starts, ends = batch.starts, batch.ends
+    return [starts.xs, starts.ys, ends.xs, ends.ys]
+
+
+def _batch(columns: Sequence[array]) -> PointArray | LineArray:
+    """
+    Return a batch of points or lines that owns some coordinate buffers.
+    """
+    if len(columns) == 2:  # noqa: PLR2004
+        return PointArray._from_buffers(*columns)
+
+    return LineArray._from_buffers(*columns)
+
+
+def _transform(
+    columns: Sequence[array],
+    matrix: Affine2D,
+    ndigits: int | None,
+) -> list[array]:
+    return _columns(_batch(columns).transform(matrix, ndigits=ndigits))
+
+
+def _length(columns: Sequence[array]) -> list[array]:
+    return [_batch(columns).length]
+
+
+def _contains(columns: Sequence[array], point: Point | None) -> list[bool]:
+    lines = _batch(columns[:4])
+    if point is None:
+        return lines.contains_many(_batch(columns[4:]))
+
+    return lines.contains_many(point)
+
+
+def _nearest(
+    columns: Sequence[array],
+    index: KDTree | BVH,
+    k: int,
+) -> list[list[Neighbour]]:
+    points = _batch(columns)
+    if isinstance(index, KDTree):
+        return index.nearest_many(points, k)
+
+    return [index.nearest(point, k) for point in points]
+
+
+def _within_radius(
+    columns: Sequence[array],
+    index: KDTree,
+    radius: Number,
+) -> list[list[int]]:
+    return index.within_radius_many(_batch(columns), radius)
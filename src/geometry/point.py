@@ -4,9 +4,10 @@ A point is a coordinate in 2-dimensional space.
 
 from __future__ import annotations
 
-import math
 from typing import NamedTuple
 
+from geometry.affine import Affine2D
+
 Number = int | float  # Consider using the `numbers` module
 
 
@@ -27,6 +28,12 @@ class Point(NamedTuple):
 
         return NotImplemented
 
+    def __ne__(self, other: Point) -> bool:
+        if isinstance(other, Point):
+            return self.x != other.x or self.y != other.y
+
+        return NotImplemented
+
     def __add__(self, other: Number | Point) -> Point:
         """
         Add a point to another point or a number.
@@ -98,29 +105,44 @@ class Point(NamedTuple):
     def __imul__(self, other: Number | Point) -> Point:
         return self.__mul__(other)
 
+    def transform(
+        self,
+        matrix: Affine2D,
+        *,
+        ndigits: int | None = None,
+    ) -> Point:
+        """
+        Apply an affine transformation to the point.
+
+        :param matrix: The transformation to apply.
+        :param ndigits: The number of decimal places to round the coordinates
+            to. Defaults to no rounding.
+
+        :return: A new transformed point.
+        """
+        a, b, c, d, e, f = matrix
+        x, y = self
+        if ndigits is None:
+            return Point(a * x + b * y + c, d * x + e * y + f)
+
+        return Point(
+            round(a * x + b * y + c, ndigits),
+            round(d * x + e * y + f, ndigits),
+        )
+
     def rotate(self, *, by: Number, around: Point) -> Point:
         """
         Rotate the point anticlockwise around a point, ``around``, by an angle,
         ``by``.
 
+        The offset from ``around`` is rotated and rounded to 8 decimal places
+        before ``around`` is added back; use ``transform`` with
+        ``Affine2D.rotation`` to rotate without rounding.
+
         :param by: The angle to rotate by, in radians.
         :param around: The point to rotate around.
 
         :return: A new rotated point.
         """
-        return _rotate_around_origin(self - around, by) + around
-
-
-def _rotate_around_origin(point: Point, by: Number) -> Point:
-    """
-    Rotate a point anticlockwise around the origin by an angle.
-
-    :param point: The point to rotate.
-    :param by: The angle to rotate by, in radians.
-
-    :return: A new rotated point.
-    """
-    return Point(
-        round(point.x * math.cos(by) - point.y * math.sin(by), 8),
-        round(point.x * math.sin(by) + point.y * math.cos(by), 8),
-    )
+        offset = (self - around).transform(Affine2D.rotation(by), ndigits=8)
+        return offset + around
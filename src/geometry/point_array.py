@@ -0,0 +1,264 @@
+"""
+A point array is a column-oriented collection of points.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import operator
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+
+from geometry.affine import Affine2D
+from geometry.point import Number, Point
+
+
+class PointArray:
+    """
+    A collection of coordinates in 2-dimensional space.
+
+    The coordinates are stored in two contiguous buffers of doubles, one for
+    the x coordinates and one for the y coordinates, so that operations on
+    the whole collection run in a single pass without creating a ``Point``
+    per coordinate.
+    """
+
+    __slots__ = ("_xs", "_ys")
+
+    def __init__(
+        self,
+        xs: Iterable[Number] = (),
+        ys: Iterable[Number] = (),
+    ) -> None:
+        self._xs = array("d", xs)
+        self._ys = array("d", ys)
+        if len(self._xs) != len(self._ys):
+            raise ValueError("The x and y coordinates must be the same length.")
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> PointArray:
+        """
+        Create a point array from an iterable of points.
+
+        :param points: The points to collect.
+
+        :return: A new point array.
+        """
+        if isinstance(points, PointArray):
+            return points.copy()
+
+        flat = array("d", itertools.chain.from_iterable(points))
+        return cls._from_buffers(flat[0::2], flat[1::2])
+
+    @classmethod
+    def _from_buffers(cls, xs: array, ys: array) -> PointArray:
+        """
+        Create a point array that takes ownership of existing buffers.
+        """
+        point_array = cls.__new__(cls)
+        point_array._xs = xs
+        point_array._ys = ys
+
+        return point_array
+
+    @property
+    def xs(self) -> array:
+        """
+        Return the buffer of x coordinates.
+        """
+        return self._xs
+
+    @property
+    def ys(self) -> array:
+        """
+        Return the buffer of y coordinates.
+        """
+        return self._ys
+
+    def copy(self) -> PointArray:
+        """
+        Return a copy of the point array.
+        """
+        return self._from_buffers(array("d", self._xs), array("d", self._ys))
+
+    def to_points(self) -> list[Point]:
+        """
+        Return the point array as a list of points.
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __iter__(self) -> Iterator[Point]:
+        return map(Point, self._xs, self._ys)
+
+    def __getitem__(self, index: int | slice) -> Point | PointArray:
+        if isinstance(index, slice):
+            return self._from_buffers(self._xs[index], self._ys[index])
+
+        return Point(self._xs[index], self._ys[index])
+
+    def __str__(self) -> str:
+        return f"PointArray({self.to_points()})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __eq__(self, other: PointArray) -> bool:
+        if isinstance(other, PointArray):
+            return self._xs == other._xs and self._ys == other._ys
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def _apply(
+        self,
+        op: Callable[[Number, Number], Number],
+        other: Number | Point | PointArray,
+    ) -> PointArray:
+        """
+        Apply a binary operator elementwise against another point array, or
+        broadcast against a point or a number.
+        """
+        if isinstance(other, PointArray):
+            if len(other) != len(self):
+                raise ValueError("Point arrays must be the same length.")
+            other_xs, other_ys = other._xs, other._ys
+        elif isinstance(other, Point):
+            other_xs = itertools.repeat(other.x)
+            other_ys = itertools.repeat(other.y)
+        elif isinstance(other, Number):
+            other_xs = other_ys = itertools.repeat(other)
+        else:
+            return NotImplemented
+
+        return self._from_buffers(
+            array("d", map(op, self._xs, other_xs)),
+            array("d", map(op, self._ys, other_ys)),
+        )
+
+    def __add__(self, other: Number | Point | PointArray) -> PointArray:
+        """
+        Add a point array to another point array, a point, or a number.
+
+        Adding two point arrays adds their points pairwise. Adding a point or a
+        number adds it to every point in the array.
+
+        :param other: The point array, point, or number to add.
+
+        :return: A new point array.
+
+        :raises ValueError: If the point arrays have different lengths.
+        """
+        return self._apply(operator.add, other)
+
+    def __radd__(self, other: Number | Point) -> PointArray:
+        return self.__add__(other)
+
+    def __sub__(self, other: Number | Point | PointArray) -> PointArray:
+        """
+        Subtract a point array, a point, or a number from a point array.
+
+        Subtracting a point array subtracts its points pairwise. Subtracting a
+        point or a number subtracts it from every point in the array.
+
+        :param other: The point array, point, or number to subtract.
+
+        :return: A new point array.
+
+        :raises ValueError: If the point arrays have different lengths.
+        """
+        return self._apply(operator.sub, other)
+
+    def __rsub__(self, other: Number | Point) -> PointArray:
+        return self._apply(_reverse(operator.sub), other)
+
+    def __neg__(self) -> PointArray:
+        return self._from_buffers(
+            array("d", map(operator.neg, self._xs)),
+            array("d", map(operator.neg, self._ys)),
+        )
+
+    def __mul__(self, other: Number | Point | PointArray) -> PointArray:
+        """
+        Multiply a point array with another point array, a point, or a number.
+
+        Multiplying two point arrays multiplies their points pairwise.
+        Multiplying with a point or a number multiplies every point in the
+        array with it.
+
+        :param other: The point array, point, or number to multiply.
+
+        :return: A new point array.
+
+        :raises ValueError: If the point arrays have different lengths.
+        """
+        return self._apply(operator.mul, other)
+
+    def __rmul__(self, other: Number | Point) -> PointArray:
+        return self.__mul__(other)
+
+    def transform(
+        self,
+        matrix: Affine2D,
+        *,
+        ndigits: int | None = None,
+    ) -> PointArray:
+        """
+        Apply an affine transformation to every point.
+
+        :param matrix: The transformation to apply.
+        :param ndigits: The number of decimal places to round the coordinates
+            to. Defaults to no rounding.
+
+        :return: A new point array of transformed points.
+        """
+        a, b, c, d, e, f = matrix
+        new_xs, new_ys = array("d"), array("d")
+        append_x, append_y = new_xs.append, new_ys.append
+        if ndigits is None:
+            for x, y in zip(self._xs, self._ys, strict=True):
+                append_x(a * x + b * y + c)
+                append_y(d * x + e * y + f)
+        else:
+            for x, y in zip(self._xs, self._ys, strict=True):
+                append_x(round(a * x + b * y + c, ndigits))
+                append_y(round(d * x + e * y + f, ndigits))
+
+        return self._from_buffers(new_xs, new_ys)
+
+    def rotate(self, *, by: Number, around: Point) -> PointArray:
+        """
+        Rotate every point anticlockwise around a point, ``around``, by an
+        angle, ``by``.
+
+        The coordinates are rounded like ``Point.rotate``, so each point
+        matches rotating it on its own.
+
+        :param by: The angle to rotate by, in radians.
+        :param around: The point to rotate around.
+
+        :return: A new point array of rotated points.
+        """
+        cos, sin = math.cos(by), math.sin(by)
+        around_x, around_y = around
+        new_xs, new_ys = array("d"), array("d")
+        append_x, append_y = new_xs.append, new_ys.append
+        for x, y in zip(self._xs, self._ys, strict=True):
+            offset_x, offset_y = x - around_x, y - around_y
+            append_x(round(offset_x * cos - offset_y * sin, 8) + around_x)
+            append_y(round(offset_x * sin + offset_y * cos, 8) + around_y)
+
+        return self._from_buffers(new_xs, new_ys)
+
+
+def _reverse(
+    op: Callable[[Number, Number], Number],
+) -> Callable[[Number, Number], Number]:
+    """
+    Return a binary operator with its operands swapped.
+    """
+    return lambda a, b: op(b, a)
@@ -0,0 +1,278 @@
+"""
+A polygon is an area enclosed by a ring of points.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import math
+import operator
+from collections.abc import Iterable, Iterator
+
+from geometry.box import BoundingBox
+from geometry.line import Line
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+
+# An edge in a slab: the x and y coordinates of its start, the change in x
+# per unit of y along it, and the edge itself
+_Edge = tuple[float, float, float, Line]
+
+
+class Polygon:
+    """
+    The area enclosed by a ring of points.
+
+    The ring is closed from the last point back to the first, and holes are
+    not supported. Containment follows the even-odd rule, with points on an
+    edge counted as inside.
+
+    Polygons are immutable. When a polygon is created its edges are split
+    into slabs between consecutive vertex y coordinates, and the edges
+    crossing each slab are sorted from left to right. Checking a point is
+    then a binary search for its slab and a binary search through the edges
+    crossing it, rather than a walk over every edge. The area, perimeter and
+    bounding box are worked out the first time they are needed and then
+    kept.
+    """
+
+    __slots__ = (
+        "_area",
+        "_bounding_box",
+        "_edges",
+        "_horizontals",
+        "_perimeter",
+        "_slabs",
+        "_tangled",
+        "_vertex_set",
+        "_vertices",
+        "_ys",
+    )
+
+    def __init__(self, vertices: Iterable[Point]) -> None:
+        """
+        Create a polygon from its vertices.
+
+        :param vertices: The points around the polygon, in either direction.
+            The first point may be repeated at the end to close the ring.
+
+        :raises ValueError: If there are fewer than three distinct vertices.
+        """
+        vertices = list(vertices)
+        if len(vertices) > 1 and vertices[0] == vertices[-1]:
+            vertices.pop()
+        if len(set(vertices)) < 3:  # noqa: PLR2004
+            raise ValueError("A polygon must have at least three vertices.")
+
+        self._vertices = vertices
+        self._vertex_set = frozenset(vertices)
+        self._edges = [
+            Line(start, end)
+            for start, end in itertools.pairwise([*vertices, vertices[0]])
+        ]
+        self._area = self._perimeter = self._bounding_box = None
+        self._index()
+
+    def _index(self) -> None:
+        """
+        Sort the edges into the slabs between consecutive vertex y
+        coordinates.
+        """
+        ys = sorted({y for _, y in self._vertices})
+        positions = {y: position for position, y in enumerate(ys)}
+        slabs: list[list[_Edge]] = [[] for _ in range(len(ys) - 1)]
+        horizontals: dict[float, list[tuple[float, float]]] = {}
+        for edge in self._edges:
+            (start_x, start_y), (end_x, end_y) = edge.start, edge.end
+            if start_y == end_y:
+                horizontals.setdefault(start_y, []).append(
+                    (min(start_x, end_x), max(start_x, end_x))
+                )
+                continue
+
+            entry = (
+                start_x,
+                start_y,
+                (end_x - start_x) / (end_y - start_y),
+                edge,
+            )
+            low, high = sorted((positions[start_y], positions[end_y]))
+            for slab in slabs[low:high]:
+                slab.append(entry)
+
+        # Edges of a simple polygon do not cross inside a slab, so their
+        # order at the middle of the slab is their order all the way across.
+        # Slabs where edges do cross are marked and searched in full
+        tangled = set()
+        for position, slab in enumerate(slabs):
+            low, high = ys[position], ys[position + 1]
+            slab.sort(key=lambda e, y=(low + high) / 2: _x_at(e, y))
+            for y in (low, high):
+                crossings = [_x_at(entry, y) for entry in slab]
+                if any(map(operator.gt, crossings, crossings[1:])):
+                    tangled.add(position)
+
+        self._ys = ys
+        self._slabs = slabs
+        self._tangled = frozenset(tangled)
+        self._horizontals = horizontals
+
+    @property
+    def vertices(self) -> list[Point]:
+        """
+        Return the vertices of the polygon.
+        """
+        return list(self._vertices)
+
+    @property
+    def edges(self) -> list[Line]:
+        """
+        Return the lines around the polygon, from each vertex to the next.
+        """
+        return list(self._edges)
+
+    def __len__(self) -> int:
+        return len(self._vertices)
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self._vertices)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._vertices))
+
+    def __str__(self) -> str:
+        return f"Polygon({self._vertices})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __eq__(self, other: Polygon) -> bool:
+        if isinstance(other, Polygon):
+            return self._vertices == other._vertices
+
+        return NotImplemented
+
+    @property
+    def area(self) -> Number:
+        """
+        Return the area enclosed by the polygon.
+
+        The area of a polygon whose edges cross itself counts the parts
+        wound clockwise against the parts wound anticlockwise.
+        """
+        if self._area is None:
+            self._area = abs(
+                math.fsum(
+                    start_x * end_y - end_x * start_y
+                    for (start_x, start_y), (
+                        end_x,
+                        end_y,
+                    ) in itertools.pairwise(
+                        [*self._vertices, self._vertices[0]]
+                    )
+                )
+                / 2
+            )
+
+        return self._area
+
+    @property
+    def perimeter(self) -> Number:
+        """
+        Return the total length of the edges of the polygon.
+        """
+        if self._perimeter is None:
+            self._perimeter = math.fsum(edge.length for edge in self._edges)
+
+        return self._perimeter
+
+    @property
+    def bounding_box(self) -> BoundingBox:
+        """
+        Return the smallest axis-aligned box around the polygon.
+        """
+        if self._bounding_box is None:
+            xs = [x for x, _ in self._vertices]
+            self._bounding_box = BoundingBox(
+                Point(min(xs), self._ys[0]),
+                Point(max(xs), self._ys[-1]),
+            )
+
+        return self._bounding_box
+
+    def contains(self, point: Point) -> bool:
+        """
+        Return whether a point is inside the polygon or on its edges.
+
+        :param point: The point to check.
+
+        :return: Whether the polygon contains the point.
+        """
+        x, y = point
+        return self._contains(x, y)
+
+    def contains_many(self, points: Iterable[Point]) -> list[bool]:
+        """
+        Return whether each of a batch of points is inside the polygon or on
+        its edges.
+
+        :param points: The points to check, as a point array or an iterable
+            of points.
+
+        :return: Whether the polygon contains each point, in order.
+        """
+        contains = self._contains
+        if isinstance(points, PointArray):
+            return list(map(contains, points._xs, points._ys))
+
+        return [contains(x, y) for x, y in points]
+
+    def _contains(self, x: Number, y: Number) -> bool:
+        """
+        Return whether the polygon contains the point at some coordinates.
+        """
+        (min_x, min_y), (max_x, max_y) = self.bounding_box
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            return False
+
+        ys = self._ys
+        position = bisect.bisect_right(ys, y) - 1
+        if ys[position] == y and self._on_vertex_or_horizontal(x, y):
+            return True
+        if position == len(self._slabs):
+            return False
+
+        slab = self._slabs[position]
+        point = Point(x, y)
+        if position in self._tangled:
+            return any(edge.contains(point) for *_, edge in slab) or (
+                sum(_x_at(entry, y) <= x for entry in slab) % 2 == 1
+            )
+
+        crossings = bisect.bisect_right(slab, x, key=lambda e: _x_at(e, y))
+
+        # The crossings are rounded, so check the edges either side of the
+        # point exactly in case it is on one of them
+        for *_, edge in slab[max(crossings - 1, 0) : crossings + 1]:
+            if edge.contains(point):
+                return True
+
+        return crossings % 2 == 1
+
+    def _on_vertex_or_horizontal(self, x: Number, y: Number) -> bool:
+        """
+        Return whether the point at some coordinates is a vertex or on a
+        horizontal edge, which the slabs do not cover.
+        """
+        return (x, y) in self._vertex_set or any(
+            low <= x <= high for low, high in self._horizontals.get(y, ())
+        )
+
+
+def _x_at(entry: _Edge, y: Number) -> float:
+    """
+    Return the x coordinate where an edge in a slab crosses a height.
+    """
+    start_x, start_y, dx_dy, _ = entry
+    return start_x + (y - start_y) * dx_dy
@@ -0,0 +1,221 @@
+"""
+A polyline is a path through a sequence of points.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+
+from geometry.line import Line
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+
+
+class Polyline:
+    """
+    A path made of the lines between consecutive points.
+
+    The distance along the path to each point is worked out once, as the
+    points are added, so finding a position along the path is a binary
+    search rather than a sum over its lines.
+    """
+
+    __slots__ = ("_distances", "_xs", "_ys")
+
+    def __init__(self, points: Iterable[Point] = ()) -> None:
+        self._xs = array("d")
+        self._ys = array("d")
+        self._distances = array("d")
+        self.extend(points)
+
+    @property
+    def points(self) -> PointArray:
+        """
+        Return a copy of the points along the path.
+        """
+        return PointArray(self._xs, self._ys)
+
+    @property
+    def distances(self) -> array:
+        """
+        Return a copy of the distance along the path to each point.
+        """
+        return array("d", self._distances)
+
+    @property
+    def length(self) -> Number:
+        """
+        Return the length of the path.
+        """
+        return self._distances[-1] if self._distances else 0.0
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __iter__(self) -> Iterator[Point]:
+        return map(Point, self._xs, self._ys)
+
+    def __getitem__(self, index: int) -> Point:
+        return Point(self._xs[index], self._ys[index])
+
+    def __str__(self) -> str:
+        return f"Polyline({list(self)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __eq__(self, other: Polyline) -> bool:
+        if isinstance(other, Polyline):
+            return self._xs == other._xs and self._ys == other._ys
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def to_lines(self) -> list[Line]:
+        """
+        Return the lines between consecutive points.
+        """
+        points = list(self)
+        return list(map(Line, points, points[1:]))
+
+    def append(self, point: Point) -> None:
+        """
+        Add a point to the end of the path.
+
+        Only the distance to the new point is worked out.
+
+        :param point: The point to add.
+        """
+        x, y = point
+        if self._xs:
+            step = math.sqrt((x - self._xs[-1]) ** 2 + (y - self._ys[-1]) ** 2)
+            self._distances.append(self._distances[-1] + step)
+        else:
+            self._distances.append(0.0)
+        self._xs.append(x)
+        self._ys.append(y)
+
+    def extend(self, points: Iterable[Point]) -> None:
+        """
+        Add points to the end of the path.
+
+        :param points: The points to add, in order.
+        """
+        for point in points:
+            self.append(point)
+
+    def _segment(self, distance: Number) -> int:
+        """
+        Return the position of the line that a distance along the path falls
+        on, as the position of the point that starts it.
+
+        :raises ValueError: If the distance is not on the path.
+        """
+        if not self._xs or not 0 <= distance <= self.length:
+            raise ValueError(f"{distance} is not on the path.")
+
+        return min(
+            bisect.bisect_right(self._distances, distance) - 1,
+            max(len(self._xs) - 2, 0),
+        )
+
+    def _interpolate(self, segment: int, distance: Number) -> Point:
+        """
+        Return the point a distance along the path, on a given line.
+        """
+        start = self._distances[segment]
+        if len(self._xs) == 1 or distance == start:
+            return self[segment]
+        end = self._distances[segment + 1]
+        if distance == end:
+            return self[segment + 1]
+
+        t = (distance - start) / (end - start)
+        start_x, start_y = self._xs[segment], self._ys[segment]
+        return Point(
+            start_x + t * (self._xs[segment + 1] - start_x),
+            start_y + t * (self._ys[segment + 1] - start_y),
+        )
+
+    def point_at(self, distance: Number) -> Point:
+        """
+        Return the point a distance along the path, in ``O(log n)`` time.
+
+        :param distance: The distance from the start of the path.
+
+        :return: The point at that distance.
+
+        :raises ValueError: If the distance is negative or longer than the
+            path.
+        """
+        return self._interpolate(self._segment(distance), distance)
+
+    def locate(self, point: Point) -> Number:
+        """
+        Return how far along the path the point on it closest to a point is.
+
+        Every line has to be checked, so this takes ``O(n)`` time.
+
+        :param point: The point to project onto the path.
+
+        :return: The distance from the start of the path to the closest
+            point. If several points on the path are equally close, the first
+            is used.
+
+        :raises ValueError: If the path has no points.
+        """
+        if not self._xs:
+            raise ValueError("An empty path has no points to locate.")
+
+        x, y = point
+        xs, ys, distances = self._xs, self._ys, self._distances
+        best, located = (x - xs[0]) ** 2 + (y - ys[0]) ** 2, 0.0
+        for i in range(len(xs) - 1):
+            d_x, d_y = xs[i + 1] - xs[i], ys[i + 1] - ys[i]
+            squared_length = d_x * d_x + d_y * d_y
+            if squared_length == 0:
+                continue
+
+            t = ((x - xs[i]) * d_x + (y - ys[i]) * d_y) / squared_length
+            t = min(max(t, 0), 1)
+            squared_distance = (xs[i] + t * d_x - x) ** 2 + (
+                ys[i] + t * d_y - y
+            ) ** 2
+            if squared_distance < best:
+                best = squared_distance
+                located = distances[i] + t * (distances[i + 1] - distances[i])
+
+        return located
+
+    def slice(self, start: Number, end: Number) -> Polyline:
+        """
+        Return the part of the path between two distances along it.
+
+        :param start: The distance along the path to start from.
+        :param end: The distance along the path to end at.
+
+        :return: A new path from the point at ``start`` to the point at
+            ``end``, through every point of this path between them.
+
+        :raises ValueError: If either distance is not on the path, or
+            ``start`` is after ``end``.
+        """
+        if start > end:
+            raise ValueError("The start must not be after the end.")
+
+        first, last = self._segment(start), self._segment(end)
+        return Polyline(
+            [
+                self._interpolate(first, start),
+                *(
+                    self[i]
+                    for i in range(first + 1, last + 1)
+                    if start < self._distances[i] < end
+                ),
+                self._interpolate(last, end),
+            ]
+        )
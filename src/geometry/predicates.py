@@ -0,0 +1,147 @@
+"""
+Exact geometric predicates that are as fast as floating point when they can
+be.
+
+Each predicate is the sign of a determinant. The determinant is first worked
+out in floating point along with a bound on its rounding error, following
+Shewchuk's "Adaptive Precision Floating-Point Arithmetic and Fast Robust
+Geometric Predicates". Only when the determinant is within that bound of
+zero, so its sign is in doubt, is it worked out again exactly with
+integers. That is rare outside of nearly degenerate input, so most calls
+cost little more than the floating point arithmetic.
+"""
+
+from __future__ import annotations
+
+import math
+
+from geometry.point import Point
+
+# Half the distance from 1 to the next float, which bounds the relative
+# rounding error of each operation
+_EPSILON = 2.0**-53
+_ORIENT2D_BOUND = (3 + 16 * _EPSILON) * _EPSILON
+_INCIRCLE_BOUND = (10 + 96 * _EPSILON) * _EPSILON
+
+
+def orient2d(a: Point, b: Point, c: Point) -> int:
+    """
+    Return which side of the line through two points a third point is on.
+
+    :param a: The first point on the line.
+    :param b: The second point on the line.
+    :param c: The point to check.
+
+    :return: 1 if ``c`` is to the left of the line from ``a`` to ``b``, so
+        the three points turn anticlockwise, -1 if it is to the right, and 0
+        if the three points are collinear.
+    """
+    ax, ay = a
+    bx, by = b
+    cx, cy = c
+    left = (ax - cx) * (by - cy)
+    right = (ay - cy) * (bx - cx)
+    determinant = left - right
+    bound = _ORIENT2D_BOUND * (abs(left) + abs(right))
+    if determinant > bound:
+        return 1
+    if -determinant > bound:
+        return -1
+
+    return _exact_orient2d(a, b, c)
+
+
+def _exact_orient2d(a: Point, b: Point, c: Point) -> int:
+    """
+    Return the sign of the orientation determinant of three points, worked
+    out exactly.
+    """
+    ax, ay, bx, by, cx, cy = _integers((*a, *b, *c))
+    return _sign((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+
+def incircle(a: Point, b: Point, c: Point, d: Point) -> int:
+    """
+    Return whether a point is inside the circle through three other points.
+
+    :param a: The first point on the circle.
+    :param b: The second point on the circle.
+    :param c: The third point on the circle.
+    :param d: The point to check.
+
+    :return: 1 if ``d`` is inside the circle, -1 if it is outside, and 0 if
+        it is on it, when ``a``, ``b`` and ``c`` are in anticlockwise order.
+        The signs are reversed when they are in clockwise order, and the
+        result is 0 when they are collinear.
+    """
+    ax, ay = a
+    bx, by = b
+    cx, cy = c
+    dx, dy = d
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+
+    determinant = (
+        alift * (bdxcdy - cdxbdy)
+        + blift * (cdxady - adxcdy)
+        + clift * (adxbdy - bdxady)
+    )
+    bound = _INCIRCLE_BOUND * (
+        (abs(bdxcdy) + abs(cdxbdy)) * alift
+        + (abs(cdxady) + abs(adxcdy)) * blift
+        + (abs(adxbdy) + abs(bdxady)) * clift
+    )
+    if determinant > bound:
+        return 1
+    if -determinant > bound:
+        return -1
+
+    return _exact_incircle(a, b, c, d)
+
+
+def _exact_incircle(a: Point, b: Point, c: Point, d: Point) -> int:
+    """
+    Return the sign of the incircle determinant of four points, worked out
+    exactly.
+    """
+    ax, ay, bx, by, cx, cy, dx, dy = _integers((*a, *b, *c, *d))
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    return _sign(
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+
+
+def _integers(values: tuple[float, ...]) -> list[int]:
+    """
+    Scale some numbers by their common denominator to make them integers.
+
+    Both determinants are homogeneous, so scaling every coordinate by the
+    same positive number keeps their signs. A float's denominator is a power
+    of two, so this is exact and much faster than fractions.
+    """
+    ratios = [value.as_integer_ratio() for value in values]
+    denominator = math.lcm(*(denominator for _, denominator in ratios))
+    return [
+        numerator * (denominator // value_denominator)
+        for numerator, value_denominator in ratios
+    ]
+
+
+def _sign(value: int) -> int:
+    """
+    Return the sign of a number as 1, -1, or 0.
+    """
+    return (value > 0) - (value < 0)
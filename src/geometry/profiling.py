@@ -0,0 +1,180 @@
+"""
+Count and time calls to the operations on points and lines.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from geometry.line import Line
+from geometry.point import Point
+
+_OPERATIONS: dict[type, tuple[str, ...]] = {
+    Point: (
+        "__add__",
+        "__radd__",
+        "__sub__",
+        "__rsub__",
+        "__neg__",
+        "__mul__",
+        "__rmul__",
+        "transform",
+        "rotate",
+    ),
+    Line: (
+        "__add__",
+        "__radd__",
+        "__sub__",
+        "length",
+        "slope",
+        "intercept",
+        "bounding_box",
+        "contains",
+        "closest_point",
+        "distance_to",
+        "crosses_box",
+        "intersection",
+        "transform",
+        "rotate",
+        "as_vector",
+    ),
+}
+
+_lock = threading.Lock()
+_active: list[Stats] = []
+_originals: dict[tuple[type, str], Any] = {}
+
+
+class Stats:
+    """
+    The number of calls to each operation, and optionally the time spent in
+    them, while a profile is active.
+
+    Operations are named ``"<class>.<operation>"``, such as
+    ``"Point.rotate"``. Calls that operations make to other operations are
+    counted too (``Line.rotate`` calls ``Point.transform``, for example), and
+    the time spent in an operation includes the time spent in those calls.
+    """
+
+    __slots__ = ("calls", "seconds", "timing")
+
+    def __init__(self, *, timing: bool = False) -> None:
+        self.timing = timing
+        self.calls: collections.Counter[str] = collections.Counter()
+        self.seconds: collections.defaultdict[str, float] = (
+            collections.defaultdict(float)
+        )
+
+    def snapshot(self) -> dict[str, dict[str, int | float]]:
+        """
+        Return the statistics so far as plain dictionaries.
+
+        :return: The number of ``calls`` to each operation that was called,
+            and the ``seconds`` spent in it if timing is on.
+        """
+        if not self.timing:
+            return {
+                name: {"calls": calls} for name, calls in self.calls.items()
+            }
+
+        return {
+            name: {"calls": calls, "seconds": self.seconds[name]}
+            for name, calls in self.calls.items()
+        }
+
+    def reset(self) -> None:
+        """
+        Forget the statistics so far.
+        """
+        self.calls.clear()
+        self.seconds.clear()
+
+
+@contextlib.contextmanager
+def profile(*, timing: bool = False) -> Iterator[Stats]:
+    """
+    Count calls to the operations on points and lines inside a ``with`` block.
+
+    The operations are only wrapped while at least one profile is active, so
+    there is no overhead at all outside of a profile. Profiles can be nested,
+    with each one counting the calls made while it is active. The wrapping
+    applies to every thread, so calls made by other threads while a profile is
+    active are counted too.
+
+    :param timing: Whether to also time each call.
+
+    :return: The statistics, which keep updating until the block exits.
+    """
+    stats = Stats(timing=timing)
+    with _lock:
+        if not _active:
+            _install()
+        _active.append(stats)
+
+    try:
+        yield stats
+    finally:
+        with _lock:
+            _active.remove(stats)
+            if not _active:
+                _uninstall()
+
+
+def _install() -> None:
+    """
+    Replace the operations with wrappers that record their calls.
+    """
+    for cls, names in _OPERATIONS.items():
+        for name in names:
+            original = cls.__dict__[name]
+            _originals[cls, name] = original
+            qualified_name = f"{cls.__name__}.{name}"
+            if isinstance(original, property):
+                wrapped = property(
+                    _record(qualified_name, original.fget),
+                    doc=original.__doc__,
+                )
+            else:
+                wrapped = _record(qualified_name, original)
+            setattr(cls, name, wrapped)
+
+
+def _uninstall() -> None:
+    """
+    Put the original operations back.
+    """
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+
+def _record(name: str, function: Callable) -> Callable:
+    """
+    Wrap a function so that its calls are recorded in the active profiles.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profiles = tuple(_active)
+        if not any(stats.timing for stats in profiles):
+            for stats in profiles:
+                stats.calls[name] += 1
+            return function(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            for stats in profiles:
+                stats.calls[name] += 1
+                if stats.timing:
+                    stats.seconds[name] += elapsed
+
+    return wrapper
@@ -0,0 +1,180 @@
+"""
+Find pairs of points that are close together.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from array import array
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+
+# The cells next to a cell that come after it, so each pair of neighbouring
+# cells is only compared once
+_FORWARD_CELLS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+class Pair(NamedTuple):
+    """
+    A pair of points and the distance between them.
+
+    The points are identified by their positions in the input, with
+    ``first`` always less than ``second``.
+    """
+
+    first: int
+    second: int
+    distance: Number
+
+
+def closest_pair(points: Iterable[Point]) -> Pair | None:
+    """
+    Return the two points closest to each other, in ``O(n log n)`` time.
+
+    The points are sorted by x and split in half, the closest pair in each
+    half is found, and then only points near the split are compared across
+    it, in order of y, stopping once they are further apart vertically than
+    the closest pair so far.
+
+    :param points: The points to search.
+
+    :return: The closest pair, or ``None`` if there are fewer than two
+        points. Of equally close pairs, the one with the lowest positions is
+        returned.
+    """
+    points = PointArray.from_points(points)
+    if len(points) < 2:  # noqa: PLR2004
+        return None
+
+    # The split stops working when many points are at the same place, but
+    # then the answer is the first place that is repeated
+    xs, ys = points.xs, points.ys
+    first_seen: dict[tuple[float, float], int] = {}
+    duplicates = []
+    for index, coordinates in enumerate(zip(xs, ys, strict=True)):
+        first = first_seen.setdefault(coordinates, index)
+        if first != index:
+            duplicates.append((first, index))
+    if duplicates:
+        return Pair(*min(duplicates), 0.0)
+
+    # Relabel the points in order of y, so that merging halves in order of y
+    # compares plain integers
+    by_y = sorted(range(len(points)), key=lambda i: (ys[i], xs[i]))
+    columns = (
+        array("d", map(xs.__getitem__, by_y)),
+        array("d", map(ys.__getitem__, by_y)),
+        array("q", by_y),
+    )
+    order = sorted(range(len(points)), key=lambda i: (columns[0][i], i))
+    (distance, first, second), _ = _closest(order, columns)
+
+    return Pair(first, second, distance)
+
+
+def _closest(
+    order: list[int],
+    columns: tuple[array, array, array],
+) -> tuple[tuple[float, int, int], list[int]]:
+    """
+    Return the distance and input positions of the closest pair of some
+    points in order of x, and the points in order of y.
+    """
+    if len(order) <= 3:  # noqa: PLR2004
+        best = min(
+            (_pair(i, j, columns) for i, j in itertools.combinations(order, 2)),
+            default=(math.inf, -1, -1),
+        )
+        return best, sorted(order)
+
+    xs, ys, _ = columns
+    middle = len(order) // 2
+    middle_x = xs[order[middle]]
+    left_best, left_by_y = _closest(order[:middle], columns)
+    right_best, right_by_y = _closest(order[middle:], columns)
+    best = min(left_best, right_best)
+
+    # Both halves are already in order, which sorting merges in one pass
+    by_y = sorted(left_by_y + right_by_y)
+    low, high = middle_x - best[0], middle_x + best[0]
+    strip = [i for i in by_y if low <= xs[i] <= high]
+    for position, i in enumerate(strip):
+        for following in range(position + 1, len(strip)):
+            j = strip[following]
+            if ys[j] - ys[i] > best[0]:
+                break
+            best = min(best, _pair(i, j, columns))
+
+    return best, by_y
+
+
+def _pair(
+    i: int,
+    j: int,
+    columns: tuple[array, array, array],
+) -> tuple[float, int, int]:
+    """
+    Return the distance between two points and their input positions in
+    order.
+    """
+    xs, ys, positions = columns
+    distance = math.hypot(xs[i] - xs[j], ys[i] - ys[j])
+    i, j = positions[i], positions[j]
+    return (distance, i, j) if i < j else (distance, j, i)
+
+
+def pairs_within(points: Iterable[Point], distance: Number) -> list[Pair]:
+    """
+    Return every pair of points within a distance of each other.
+
+    The points are bucketed into a grid of square cells as wide as the
+    distance, so each point is only compared with the points in its own cell
+    and the cells next to it. For points that are spread out this takes
+    ``O(n + k)`` time for ``k`` pairs, rather than comparing every pair.
+
+    :param points: The points to search.
+    :param distance: The greatest distance between the points, inclusive.
+
+    :return: The pairs of points found, ordered by their positions.
+
+    :raises ValueError: If the distance is negative.
+    """
+    if distance < 0:
+        raise ValueError("The distance cannot be negative.")
+
+    points = PointArray.from_points(points)
+    xs, ys = points.xs, points.ys
+    cells: dict[tuple[float, float], list[int]] = {}
+    for index, (x, y) in enumerate(zip(xs, ys, strict=True)):
+        # Only identical points can be within no distance of each other
+        cell = (x // distance, y // distance) if distance else (x, y)
+        cells.setdefault(cell, []).append(index)
+
+    found = []
+    for (cell_x, cell_y), members in cells.items():
+        neighbours = (
+            [
+                cells.get((cell_x + dx, cell_y + dy), ())
+                for dx, dy in _FORWARD_CELLS
+            ]
+            if distance
+            else []
+        )
+        for position, i in enumerate(members):
+            x, y = xs[i], ys[i]
+            candidates = itertools.chain(
+                itertools.islice(members, position + 1, None), *neighbours
+            )
+            for j in candidates:
+                between = math.hypot(xs[j] - x, ys[j] - y)
+                if between <= distance:
+                    found.append(
+                        Pair(i, j, between) if i < j else Pair(j, i, between)
+                    )
+
+    found.sort()
+    return found
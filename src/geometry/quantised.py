@@ -0,0 +1,423 @@
+"""
+A quantised point is a coordinate snapped to a grid and stored as integers.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+
+
+class Grid:
+    """
+    A square grid that coordinates are snapped to.
+
+    A coordinate is stored as the number of grid steps from zero. A step
+    that divides 1 a whole number of times, such as ``1e-7``, is held as
+    that number of steps per unit, so coordinates on the grid convert back
+    to the nearest float to their decimal value.
+    """
+
+    __slots__ = ("_per_unit", "_step")
+
+    def __init__(self, step: Number) -> None:
+        """
+        Create a grid.
+
+        :param step: The distance between neighbouring grid lines.
+
+        :raises ValueError: If the step is not positive and finite.
+        """
+        if not 0 < step < math.inf:
+            raise ValueError("The grid step must be positive and finite.")
+
+        per_unit = 1 / step
+        whole = round(per_unit)
+        self._step = step
+        self._per_unit = whole if math.isclose(per_unit, whole) else per_unit
+
+    @property
+    def step(self) -> Number:
+        """
+        Return the distance between neighbouring grid lines.
+        """
+        return self._step
+
+    def __str__(self) -> str:
+        return f"Grid({self._step})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __eq__(self, other: Grid) -> bool:
+        if isinstance(other, Grid):
+            return self._step == other._step
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._step)
+
+    def quantise(self, point: Point) -> QuantisedPoint:
+        """
+        Snap a point to the nearest grid intersection.
+
+        :param point: The point to snap.
+
+        :return: The quantised point.
+        """
+        per_unit = self._per_unit
+        return QuantisedPoint(
+            round(point.x * per_unit), round(point.y * per_unit)
+        )
+
+    def restore(self, point: QuantisedPoint) -> Point:
+        """
+        Convert a quantised point back to a point.
+
+        :param point: The quantised point.
+
+        :return: The point at the grid intersection, which is within half a
+            step of the point that was quantised in each coordinate.
+        """
+        per_unit = self._per_unit
+        return Point(point.x / per_unit, point.y / per_unit)
+
+    def quantise_many(self, points: Iterable[Point]) -> QuantisedArray:
+        """
+        Snap a batch of points to the grid.
+
+        :param points: The points to snap, as a point array or an iterable
+            of points.
+
+        :return: A quantised array of the snapped points.
+        """
+        if not isinstance(points, PointArray):
+            points = PointArray.from_points(points)
+
+        per_unit = self._per_unit
+        return QuantisedArray(
+            [round(x * per_unit) for x in points._xs],
+            [round(y * per_unit) for y in points._ys],
+        )
+
+    def restore_many(self, points: QuantisedArray) -> PointArray:
+        """
+        Convert a batch of quantised points back to points.
+
+        :param points: The quantised points.
+
+        :return: A point array of the grid intersections.
+        """
+        per_unit = self._per_unit
+        return PointArray._from_buffers(
+            array("d", [x / per_unit for x in points._xs]),
+            array("d", [y / per_unit for y in points._ys]),
+        )
+
+
+class QuantisedPoint(NamedTuple):
+    """
+    A coordinate on a grid, as whole numbers of grid steps.
+
+    Quantised points hash and compare by their integers, so equal points
+    always have equal hashes, but never equal a ``Point``, whose coordinates
+    are in units rather than grid steps. Adding and subtracting them is
+    exact, and scaling and rotating them snap the result back to the grid.
+    The grid itself is not stored; ``Grid`` converts between quantised
+    points and points.
+    """
+
+    x: int
+    y: int
+
+    def __hash__(self) -> int:
+        return hash((QuantisedPoint, self.x, self.y))
+
+    def __eq__(self, other: QuantisedPoint) -> bool:
+        if isinstance(other, QuantisedPoint):
+            return self.x == other.x and self.y == other.y
+
+        return NotImplemented
+
+    def __ne__(self, other: QuantisedPoint) -> bool:
+        if isinstance(other, QuantisedPoint):
+            return self.x != other.x or self.y != other.y
+
+        return NotImplemented
+
+    def __add__(self, other: QuantisedPoint) -> QuantisedPoint:
+        """
+        Add two quantised points on the same grid.
+
+        :param other: The quantised point to add.
+
+        :return: A new quantised point.
+        """
+        if isinstance(other, QuantisedPoint):
+            return QuantisedPoint(self.x + other.x, self.y + other.y)
+
+        return NotImplemented
+
+    def __sub__(self, other: QuantisedPoint) -> QuantisedPoint:
+        """
+        Subtract a quantised point on the same grid.
+
+        :param other: The quantised point to subtract.
+
+        :return: A new quantised point.
+        """
+        if isinstance(other, QuantisedPoint):
+            return QuantisedPoint(self.x - other.x, self.y - other.y)
+
+        return NotImplemented
+
+    def __neg__(self) -> QuantisedPoint:
+        return QuantisedPoint(-self.x, -self.y)
+
+    def __mul__(self, other: Number) -> QuantisedPoint:
+        """
+        Scale a quantised point away from the origin, snapping it to the
+        nearest grid intersection.
+
+        :param other: The number to scale by.
+
+        :return: A new quantised point.
+        """
+        if isinstance(other, Number):
+            return QuantisedPoint(round(self.x * other), round(self.y * other))
+
+        return NotImplemented
+
+    def __rmul__(self, other: Number) -> QuantisedPoint:
+        return self.__mul__(other)
+
+    def rotate(
+        self,
+        *,
+        by: Number,
+        around: QuantisedPoint = (0, 0),
+    ) -> QuantisedPoint:
+        """
+        Rotate the quantised point anticlockwise around another, ``around``,
+        by an angle, ``by``.
+
+        The rotation is made of three shears, each snapped to the grid, so
+        it lands within a couple of grid steps of the exact rotation, and
+        rotating back by ``-by`` returns exactly the original point.
+
+        :param by: The angle to rotate by, in radians.
+        :param around: The quantised point to rotate around.
+
+        :return: A new quantised point.
+        """
+        around_x, around_y = around
+        x, y = _Rotation.by(by).apply(self.x - around_x, self.y - around_y)
+        return QuantisedPoint(x + around_x, y + around_y)
+
+
+class QuantisedArray:
+    """
+    A collection of quantised points.
+
+    The coordinates are stored in two packed integer buffers, of 32-bit
+    integers when every coordinate fits and 64-bit integers otherwise.
+    """
+
+    __slots__ = ("_xs", "_ys")
+
+    def __init__(self, xs: Iterable[int] = (), ys: Iterable[int] = ()) -> None:
+        xs, ys = list(xs), list(ys)
+        if len(xs) != len(ys):
+            raise ValueError("The x and y coordinates must be the same length.")
+
+        self._xs = _pack(xs)
+        self._ys = _pack(ys)
+
+    @classmethod
+    def from_points(cls, points: Iterable[QuantisedPoint]) -> QuantisedArray:
+        """
+        Create a quantised array from an iterable of quantised points.
+
+        :param points: The quantised points to collect.
+
+        :return: A new quantised array.
+        """
+        points = list(points)
+        return cls([x for x, _ in points], [y for _, y in points])
+
+    @property
+    def xs(self) -> array:
+        """
+        Return the buffer of x coordinates.
+        """
+        return self._xs
+
+    @property
+    def ys(self) -> array:
+        """
+        Return the buffer of y coordinates.
+        """
+        return self._ys
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Return the number of bytes the coordinates take up.
+        """
+        return (len(self._xs) * self._xs.itemsize) + (
+            len(self._ys) * self._ys.itemsize
+        )
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __iter__(self) -> Iterator[QuantisedPoint]:
+        return map(QuantisedPoint, self._xs, self._ys)
+
+    def __getitem__(self, index: int) -> QuantisedPoint:
+        return QuantisedPoint(self._xs[index], self._ys[index])
+
+    def __str__(self) -> str:
+        return f"QuantisedArray({list(self)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __eq__(self, other: QuantisedArray) -> bool:
+        if isinstance(other, QuantisedArray):
+            return self._xs == other._xs and self._ys == other._ys
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other: QuantisedPoint) -> QuantisedArray:
+        """
+        Add a quantised point to every point in the array.
+
+        :param other: The quantised point to add.
+
+        :return: A new quantised array.
+        """
+        if isinstance(other, QuantisedPoint):
+            return QuantisedArray(
+                [x + other.x for x in self._xs],
+                [y + other.y for y in self._ys],
+            )
+
+        return NotImplemented
+
+    def __sub__(self, other: QuantisedPoint) -> QuantisedArray:
+        """
+        Subtract a quantised point from every point in the array.
+
+        :param other: The quantised point to subtract.
+
+        :return: A new quantised array.
+        """
+        if isinstance(other, QuantisedPoint):
+            return QuantisedArray(
+                [x - other.x for x in self._xs],
+                [y - other.y for y in self._ys],
+            )
+
+        return NotImplemented
+
+    def rotate(
+        self,
+        *,
+        by: Number,
+        around: QuantisedPoint = (0, 0),
+    ) -> QuantisedArray:
+        """
+        Rotate every quantised point anticlockwise around another,
+        ``around``, by an angle, ``by``, matching ``QuantisedPoint.rotate``.
+
+        :param by: The angle to rotate by, in radians.
+        :param around: The quantised point to rotate around.
+
+        :return: A new quantised array.
+        """
+        around_x, around_y = around
+        apply = _Rotation.by(by).apply
+        rotated = [
+            apply(x - around_x, y - around_y)
+            for x, y in zip(self._xs, self._ys, strict=True)
+        ]
+        return QuantisedArray(
+            [x + around_x for x, _ in rotated],
+            [y + around_y for _, y in rotated],
+        )
+
+
+class _Rotation(NamedTuple):
+    """
+    A rotation on a grid, as a number of quarter turns and the shears of a
+    small rotation.
+
+    A rotation by less than an eighth of a turn is three shears: along x by
+    ``-tan(angle / 2)``, along y by ``sin(angle)``, and along x again. Each
+    moves a coordinate by a rounded multiple of the other, so it is undone
+    exactly by the opposite shear. Larger angles add whole quarter turns,
+    which are exact, between two halves of the remaining rotation, so the
+    steps of the rotation by ``-angle`` are always the steps of the rotation
+    by ``angle`` undone in reverse.
+    """
+
+    quarters: int
+    shear: float
+    lift: float
+
+    @classmethod
+    def by(cls, angle: Number) -> _Rotation:
+        """
+        Split an angle into quarter turns and the shears of what is left.
+        """
+        quarter = math.pi / 2
+        quarters = round(angle / quarter)
+        rest = angle - quarters * quarter
+        if quarters:
+            rest /= 2
+
+        # Both functions are odd, and are kept so exactly, so that rotating
+        # by ``-angle`` uses the opposite shears
+        return cls(
+            quarters,
+            -math.copysign(math.tan(abs(rest) / 2), rest),
+            math.copysign(math.sin(abs(rest)), rest),
+        )
+
+    def apply(self, x: int, y: int) -> tuple[int, int]:
+        """
+        Rotate a grid coordinate around the origin.
+        """
+        quarters, shear, lift = self
+        x += round(shear * y)
+        y += round(lift * x)
+        x += round(shear * y)
+        if not quarters:
+            return x, y
+
+        for _ in range(quarters % 4):
+            x, y = -y, x
+        x += round(shear * y)
+        y += round(lift * x)
+        x += round(shear * y)
+        return x, y
+
+
+def _pack(values: list[int]) -> array:
+    """
+    Pack integers into a buffer of 32-bit integers, or 64-bit integers if
+    any of them is too big.
+    """
+    try:
+        return array("i", values)
+    except OverflowError:
+        return array("q", values)
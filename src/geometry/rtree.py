@@ -0,0 +1,577 @@
+"""
+An R-tree is a spatial index that can change as points and lines move.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from collections.abc import Hashable, Iterable, Iterator
+
+from geometry.kdtree import Neighbour
+from geometry.line import Line
+from geometry.point import Number, Point
+
+Box = tuple[float, float, float, float]  # min x, min y, max x, max y
+
+
+class _Entry:
+    """
+    A point or line in the tree, and the leaf that holds it.
+    """
+
+    __slots__ = ("box", "geometry", "id", "leaf")
+
+    def __init__(self, id_: Hashable, geometry: Point | Line) -> None:
+        self.id = id_
+        self.geometry = geometry
+        self.box = _box(geometry)
+        self.leaf: _Node | None = None
+
+
+class _Node:
+    """
+    A node in the tree, holding either entries (a leaf) or other nodes.
+    """
+
+    __slots__ = ("box", "children", "is_leaf", "parent")
+
+    def __init__(self, children: list, *, is_leaf: bool) -> None:
+        self.children = children
+        self.is_leaf = is_leaf
+        self.parent: _Node | None = None
+        for child in children:
+            if is_leaf:
+                child.leaf = self
+            else:
+                child.parent = self
+        self.box = _union(child.box for child in children)
+
+    def add(self, child: _Entry | _Node) -> None:
+        """
+        Add a child to the node without updating its box.
+        """
+        self.children.append(child)
+        if self.is_leaf:
+            child.leaf = self
+        else:
+            child.parent = self
+
+
+class RTree:
+    """
+    A dynamic spatial index over points and lines.
+
+    Each point or line is stored against an id, so that it can be moved or
+    removed later without searching for it: every entry remembers the leaf
+    that holds it. Moving an entry within its leaf's box only replaces the
+    entry, which is the common case for positions that change a little at a
+    time.
+
+    Nodes are split with Guttman's linear split, which is cheaper than the
+    quadratic split at the cost of slightly looser boxes; that is the better
+    trade-off when the tree changes as often as it is queried.
+    """
+
+    __slots__ = ("_entries", "_max_entries", "_min_entries", "_root")
+
+    def __init__(self, *, max_entries: int = 16) -> None:
+        """
+        Create an empty tree.
+
+        :param max_entries: The most children to keep in each node. Nodes
+            with fewer than 40% of this many children are merged away when
+            entries are removed.
+        """
+        if max_entries < 4:  # noqa: PLR2004
+            raise ValueError("Nodes must hold at least 4 children.")
+
+        self._max_entries = max_entries
+        self._min_entries = max(2, math.floor(0.4 * max_entries))
+        self._entries: dict[Hashable, _Entry] = {}
+        self._root = _Node([], is_leaf=True)
+
+    @classmethod
+    def bulk_load(
+        cls,
+        items: Iterable[tuple[Hashable, Point | Line]],
+        *,
+        max_entries: int = 16,
+    ) -> RTree:
+        """
+        Create a tree from many points and lines at once.
+
+        The entries are packed bottom-up with Sort-Tile-Recursive (STR)
+        packing, which is much faster than inserting them one at a time and
+        gives tighter boxes.
+
+        :param items: The ids and the points or lines to store against them.
+        :param max_entries: The most children to keep in each node.
+
+        :return: A new tree.
+
+        :raises ValueError: If an id is used more than once.
+        """
+        tree = cls(max_entries=max_entries)
+        for id_, geometry in items:
+            if id_ in tree._entries:
+                raise ValueError(f"The id {id_!r} is used more than once.")
+            tree._entries[id_] = _Entry(id_, geometry)
+
+        nodes = [
+            _Node(group, is_leaf=True)
+            for group in _str_groups(list(tree._entries.values()), max_entries)
+        ]
+        while len(nodes) > 1:
+            nodes = [
+                _Node(group, is_leaf=False)
+                for group in _str_groups(nodes, max_entries)
+            ]
+        if nodes:
+            tree._root = nodes[0]
+
+        return tree
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, id_: Hashable) -> bool:
+        return id_ in self._entries
+
+    def __getitem__(self, id_: Hashable) -> Point | Line:
+        return self._entries[id_].geometry
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def insert(self, id_: Hashable, geometry: Point | Line) -> None:
+        """
+        Add a point or line to the tree.
+
+        :param id_: The id to store the point or line against.
+        :param geometry: The point or line to store.
+
+        :raises ValueError: If the id is already in the tree.
+        """
+        if id_ in self._entries:
+            raise ValueError(f"The id {id_!r} is already in the tree.")
+
+        entry = self._entries[id_] = _Entry(id_, geometry)
+        self._insert(entry, height=0)
+
+    def remove(self, id_: Hashable) -> Point | Line:
+        """
+        Remove a point or line from the tree.
+
+        :param id_: The id of the point or line to remove.
+
+        :return: The point or line that was removed.
+
+        :raises KeyError: If the id is not in the tree.
+        """
+        entry = self._entries.pop(id_)
+        leaf = entry.leaf
+        leaf.children.remove(entry)
+        self._condense(leaf)
+
+        return entry.geometry
+
+    def update(self, id_: Hashable, geometry: Point | Line) -> None:
+        """
+        Move a point or line in the tree.
+
+        :param id_: The id of the point or line to move.
+        :param geometry: The point or line to store instead.
+
+        :raises KeyError: If the id is not in the tree.
+        """
+        entry = self._entries[id_]
+        box = _box(geometry)
+        if _covers(entry.leaf.box, box):
+            entry.geometry, entry.box = geometry, box
+            return
+
+        self.remove(id_)
+        self.insert(id_, geometry)
+
+    def _insert(self, child: _Entry | _Node, height: int) -> None:
+        """
+        Add an entry or a node to a node ``height`` levels above the leaves,
+        splitting nodes that become too full.
+
+        Entries are always added to leaves, at height 0, and a node is added
+        one level above its own height.
+        """
+        node = self._root
+        for _ in range(self._height() - height):
+            node = min(
+                node.children,
+                key=lambda c: (_enlargement(c.box, child.box), _area(c.box)),
+            )
+        node.add(child)
+        _enlarge(node, child.box)
+
+        while len(node.children) > self._max_entries:
+            sibling = self._split(node)
+            if node.parent is None:
+                self._root = _Node([node, sibling], is_leaf=False)
+                break
+            node.parent.add(sibling)
+            node = node.parent
+
+    def _height(self) -> int:
+        """
+        Return the number of levels of nodes above the leaves.
+        """
+        height, node = 0, self._root
+        while not node.is_leaf:
+            height, node = height + 1, node.children[0]
+
+        return height
+
+    def _split(self, node: _Node) -> _Node:
+        """
+        Split a node's children between it and a new sibling.
+
+        This is Guttman's linear split: the two children furthest apart along
+        either axis seed the two groups, and every other child joins whichever
+        group it enlarges least.
+        """
+        children = node.children
+        first, second = _linear_seeds(children)
+        groups = ([children[first]], [children[second]])
+        boxes = [children[first].box, children[second].box]
+        rest = [c for i, c in enumerate(children) if i not in {first, second}]
+
+        for i, child in enumerate(rest):
+            remaining = len(rest) - i
+            if len(groups[0]) + remaining <= self._min_entries:
+                chosen = 0
+            elif len(groups[1]) + remaining <= self._min_entries:
+                chosen = 1
+            else:
+                chosen = min(
+                    (0, 1),
+                    key=lambda g: (
+                        _enlargement(boxes[g], child.box),
+                        _area(boxes[g]),
+                        len(groups[g]),
+                    ),
+                )
+            groups[chosen].append(child)
+            boxes[chosen] = _merge(boxes[chosen], child.box)
+
+        sibling = _Node(groups[1], is_leaf=node.is_leaf)
+        node.children = []
+        for child in groups[0]:
+            node.add(child)
+        node.box = boxes[0]
+
+        return sibling
+
+    def _condense(self, node: _Node) -> None:
+        """
+        Shrink the boxes above a node after removing a child from it, and
+        re-insert the children of nodes that have become too empty.
+        """
+        orphans: list[tuple[_Entry | _Node, int]] = []
+        height = 0
+        while node.parent is not None:
+            parent = node.parent
+            if len(node.children) < self._min_entries:
+                parent.children.remove(node)
+                orphans.extend((child, height) for child in node.children)
+            else:
+                node.box = _union(child.box for child in node.children)
+            node, height = parent, height + 1
+        node.box = _union(child.box for child in node.children)
+
+        # Collapse a root with a single child node
+        while not self._root.is_leaf and len(self._root.children) == 1:
+            self._root = self._root.children[0]
+            self._root.parent = None
+        if not self._root.is_leaf and not self._root.children:
+            self._root = _Node([], is_leaf=True)
+
+        for child, child_height in orphans:
+            if child_height > self._height():
+                # The tree is now too short to hold this node, so re-insert
+                # the entries beneath it instead
+                for entry in _entries_below(child):
+                    self._insert(entry, height=0)
+            else:
+                self._insert(child, height=child_height)
+
+    def within_box(self, min_point: Point, max_point: Point) -> list[Hashable]:
+        """
+        Return the points and lines inside a box.
+
+        :param min_point: The bottom-left corner of the box.
+        :param max_point: The top-right corner of the box.
+
+        :return: The ids of the points and lines that are at least partly
+            inside the box.
+        """
+        box = (min_point.x, min_point.y, max_point.x, max_point.y)
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for child in node.children:
+                if not _overlaps(child.box, box):
+                    continue
+                if not node.is_leaf:
+                    stack.append(child)
+                elif isinstance(child.geometry, Point) or (
+                    child.geometry.crosses_box(min_point, max_point)
+                ):
+                    found.append(child.id)
+
+        return found
+
+    def within_radius(self, point: Point, radius: Number) -> list[Hashable]:
+        """
+        Return the points and lines within a distance of a point.
+
+        :param point: The point to search around.
+        :param radius: The greatest distance from the point, inclusive.
+
+        :return: The ids of the points and lines found.
+        """
+        squared_radius = radius * radius
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for child in node.children:
+                if _squared_distance(child.box, point) > squared_radius:
+                    continue
+                if not node.is_leaf:
+                    stack.append(child)
+                elif _distance(child.geometry, point) <= radius:
+                    found.append(child.id)
+
+        return found
+
+    def nearest(self, point: Point, k: int = 1) -> list[Neighbour]:
+        """
+        Return the points and lines nearest to a point.
+
+        :param point: The point to search around.
+        :param k: The number of points and lines to return.
+
+        :return: The ``k`` nearest points and lines, nearest first, with their
+            ids and the closest point on each.
+        """
+        # Entries are (squared distance, tiebreak, node or entry, is exact)
+        tiebreak = itertools.count()
+        heap = [(0.0, next(tiebreak), self._root, False)]
+        found = []
+        while heap and len(found) < k:
+            _, _, item, is_exact = heapq.heappop(heap)
+            if is_exact:
+                closest = _closest_point(item.geometry, point)
+                found.append(
+                    Neighbour(item.id, closest, _distance(item.geometry, point))
+                )
+            elif item.is_leaf:
+                for entry in item.children:
+                    distance = _distance(entry.geometry, point)
+                    heapq.heappush(
+                        heap, (distance * distance, next(tiebreak), entry, True)
+                    )
+            else:
+                for child in item.children:
+                    heapq.heappush(
+                        heap,
+                        (
+                            _squared_distance(child.box, point),
+                            next(tiebreak),
+                            child,
+                            False,
+                        ),
+                    )
+
+        return found
+
+
+def _box(geometry: Point | Line) -> Box:
+    """
+    Return the bounding box of a point or line.
+    """
+    if isinstance(geometry, Point):
+        return (geometry.x, geometry.y, geometry.x, geometry.y)
+
+    start, end = geometry.start, geometry.end
+    return (
+        min(start.x, end.x),
+        min(start.y, end.y),
+        max(start.x, end.x),
+        max(start.y, end.y),
+    )
+
+
+def _union(boxes: Iterable[Box]) -> Box:
+    """
+    Return the bounding box of several boxes.
+    """
+    boxes = list(boxes)
+    if not boxes:
+        return (math.inf, math.inf, -math.inf, -math.inf)
+
+    return (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+
+
+def _merge(box: Box, other: Box) -> Box:
+    """
+    Return the bounding box of two boxes.
+    """
+    return (
+        min(box[0], other[0]),
+        min(box[1], other[1]),
+        max(box[2], other[2]),
+        max(box[3], other[3]),
+    )
+
+
+def _enlarge(node: _Node, box: Box) -> None:
+    """
+    Grow the boxes of a node and the nodes above it to cover a box.
+    """
+    while node is not None and not _covers(node.box, box):
+        node.box = _merge(node.box, box)
+        node = node.parent
+
+
+def _area(box: Box) -> float:
+    return (box[2] - box[0]) * (box[3] - box[1])
+
+
+def _enlargement(box: Box, other: Box) -> float:
+    """
+    Return how much a box's area grows to cover another box.
+    """
+    min_x, min_y, max_x, max_y = box
+    other_min_x, other_min_y, other_max_x, other_max_y = other
+    width = max_x - min_x
+    height = max_y - min_y
+    if other_min_x < min_x:
+        width += min_x - other_min_x
+    if other_max_x > max_x:
+        width += other_max_x - max_x
+    if other_min_y < min_y:
+        height += min_y - other_min_y
+    if other_max_y > max_y:
+        height += other_max_y - max_y
+
+    return width * height - _area(box)
+
+
+def _covers(box: Box, other: Box) -> bool:
+    return (
+        box[0] <= other[0]
+        and box[1] <= other[1]
+        and other[2] <= box[2]
+        and other[3] <= box[3]
+    )
+
+
+def _overlaps(box: Box, other: Box) -> bool:
+    return (
+        box[0] <= other[2]
+        and other[0] <= box[2]
+        and box[1] <= other[3]
+        and other[1] <= box[3]
+    )
+
+
+def _squared_distance(box: Box, point: Point) -> float:
+    """
+    Return the squared distance from a point to a box.
+    """
+    dx = max(box[0] - point.x, 0, point.x - box[2])
+    dy = max(box[1] - point.y, 0, point.y - box[3])
+    return dx * dx + dy * dy
+
+
+def _closest_point(geometry: Point | Line, point: Point) -> Point:
+    if isinstance(geometry, Point):
+        return geometry
+
+    return geometry.closest_point(point)
+
+
+def _distance(geometry: Point | Line, point: Point) -> float:
+    if isinstance(geometry, Point):
+        return math.dist(geometry, point)
+
+    return geometry.distance_to(point)
+
+
+def _linear_seeds(children: list[_Entry | _Node]) -> tuple[int, int]:
+    """
+    Return the positions of the two children that are furthest apart,
+    relative to the spread of all the children, along either axis.
+    """
+    boxes = [child.box for child in children]
+    best = (-math.inf, 0, 1)
+    for low, high in ((0, 2), (1, 3)):
+        lows = [box[low] for box in boxes]
+        highs = [box[high] for box in boxes]
+        highest_low = lows.index(max(lows))
+        lowest_high = highs.index(min(highs))
+        if highest_low == lowest_high:
+            continue
+        width = (max(highs) - min(lows)) or 1
+        separation = (lows[highest_low] - highs[lowest_high]) / width
+        best = max(best, (separation, lowest_high, highest_low))
+
+    _, first, second = best
+    return first, second
+
+
+def _str_groups(items: list, capacity: int) -> list[list]:
+    """
+    Return the items grouped with Sort-Tile-Recursive (STR) packing.
+
+    The items are sorted by the x coordinates of their centres and cut into
+    vertical slices, then each slice is sorted by the y coordinates of the
+    centres and cut into groups of ``capacity`` items.
+    """
+    if not items:
+        return []
+
+    slice_size = capacity * math.ceil(
+        math.sqrt(math.ceil(len(items) / capacity))
+    )
+    by_x = sorted(items, key=lambda item: item.box[0] + item.box[2])
+
+    groups = []
+    for start in range(0, len(items), slice_size):
+        by_y = sorted(
+            by_x[start : start + slice_size],
+            key=lambda item: item.box[1] + item.box[3],
+        )
+        groups.extend(
+            by_y[i : i + capacity] for i in range(0, len(by_y), capacity)
+        )
+
+    return groups
+
+
+def _entries_below(item: _Entry | _Node) -> Iterator[_Entry]:
+    """
+    Iterate over the entries in and beneath a node.
+    """
+    if isinstance(item, _Entry):
+        yield item
+        return
+
+    for child in item.children:
+        yield from _entries_below(child)
@@ -0,0 +1,200 @@
+"""
+Simplify a path through points by dropping the points it can do without.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Iterable, Iterator
+
+from geometry.line import Line
+from geometry.point import Number, Point
+
+
+def douglas_peucker(points: Iterable[Point], tolerance: Number) -> list[Point]:
+    """
+    Simplify a path with the Douglas-Peucker algorithm.
+
+    Starting from the line between the first and last points, the point
+    furthest from the line is kept if it is further than the tolerance, and
+    the two halves either side of it are simplified in the same way. The
+    halves are kept on a stack rather than recursed into, so long paths
+    cannot exceed the recursion limit.
+
+    :param points: The points along the path.
+    :param tolerance: The furthest a dropped point can be from the
+        simplified path.
+
+    :return: The points that are kept, in order. The first and last points
+        are always kept.
+
+    :raises ValueError: If the tolerance is negative.
+    """
+    if tolerance < 0:
+        raise ValueError("The tolerance cannot be negative.")
+
+    points = list(points)
+    return list(itertools.compress(points, _douglas_peucker(points, tolerance)))
+
+
+def _douglas_peucker(points: list[Point], tolerance: Number) -> bytearray:
+    """
+    Return whether each point is kept by the Douglas-Peucker algorithm.
+    """
+    if len(points) <= 2:  # noqa: PLR2004
+        return bytearray(b"\x01" * len(points))
+
+    keep = bytearray(len(points))
+    keep[0] = keep[-1] = 1
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        line = Line(points[first], points[last])
+        furthest, distance = first, tolerance
+        for i in range(first + 1, last):
+            between = line.distance_to(points[i])
+            if between > distance:
+                furthest, distance = i, between
+
+        if furthest != first:
+            keep[furthest] = 1
+            stack.append((furthest, last))
+            stack.append((first, furthest))
+
+    return keep
+
+
+def visvalingam_whyatt(
+    points: Iterable[Point],
+    tolerance: Number,
+) -> list[Point]:
+    """
+    Simplify a path with the Visvalingam-Whyatt algorithm, in
+    ``O(n log n)`` time.
+
+    Each point has the area of the triangle it makes with its neighbours,
+    and the point with the smallest area is dropped repeatedly until every
+    remaining area is at least the tolerance. The areas are kept in a heap,
+    and the areas of a dropped point's neighbours are updated as it goes. A
+    neighbour's area never drops below the area of the point dropped next to
+    it, so points are dropped in order of how much they matter.
+
+    :param points: The points along the path.
+    :param tolerance: The smallest area of a kept point's triangle.
+
+    :return: The points that are kept, in order. The first and last points
+        are always kept.
+
+    :raises ValueError: If the tolerance is negative.
+    """
+    if tolerance < 0:
+        raise ValueError("The tolerance cannot be negative.")
+
+    points = list(points)
+    if len(points) <= 2:  # noqa: PLR2004
+        return points
+
+    previous = list(range(-1, len(points) - 1))
+    following = list(range(1, len(points) + 1))
+    areas = [0.0] * len(points)
+    for i in range(1, len(points) - 1):
+        areas[i] = _area(points[i - 1], points[i], points[i + 1])
+    heap = [(areas[i], i) for i in range(1, len(points) - 1)]
+    heapq.heapify(heap)
+
+    keep = bytearray(b"\x01" * len(points))
+    while heap and heap[0][0] < tolerance:
+        area, i = heapq.heappop(heap)
+        if not keep[i] or area != areas[i]:
+            continue  # Dropped already, or the area has changed since
+
+        keep[i] = 0
+        before, after = previous[i], following[i]
+        following[before], previous[after] = after, before
+        for neighbour in (before, after):
+            if 0 < neighbour < len(points) - 1:
+                areas[neighbour] = max(
+                    area,
+                    _area(
+                        points[previous[neighbour]],
+                        points[neighbour],
+                        points[following[neighbour]],
+                    ),
+                )
+                heapq.heappush(heap, (areas[neighbour], neighbour))
+
+    return list(itertools.compress(points, keep))
+
+
+def _area(first: Point, second: Point, third: Point) -> float:
+    """
+    Return the area of the triangle between three points.
+    """
+    return (
+        abs(
+            (second.x - first.x) * (third.y - first.y)
+            - (second.y - first.y) * (third.x - first.x)
+        )
+        / 2
+    )
+
+
+def simplify_stream(
+    points: Iterable[Point],
+    tolerance: Number,
+    *,
+    lookahead: int = 1024,
+) -> Iterator[Point]:
+    """
+    Simplify a path of any length with the Douglas-Peucker algorithm,
+    reading only a window of points at a time.
+
+    Each window starts at the last point kept from the window before it, so
+    the simplified path is continuous. The windows are simplified
+    independently, so the result can keep a few more points than
+    simplifying the whole path at once would, but no dropped point is
+    further than the tolerance from it.
+
+    :param points: The points along the path, such as from a generator.
+    :param tolerance: The furthest a dropped point can be from the
+        simplified path.
+    :param lookahead: The most points to read ahead at once.
+
+    :return: The points that are kept, in order, as soon as they are known.
+
+    :raises ValueError: If the tolerance is negative or the lookahead is
+        less than 3.
+    """
+    if tolerance < 0:
+        raise ValueError("The tolerance cannot be negative.")
+    if lookahead < 3:  # noqa: PLR2004
+        raise ValueError("The lookahead must be at least 3.")
+
+    return _simplify_stream(iter(points), tolerance, lookahead)
+
+
+def _simplify_stream(
+    points: Iterator[Point],
+    tolerance: Number,
+    lookahead: int,
+) -> Iterator[Point]:
+    """
+    Simplify the windows of a path, as ``simplify_stream`` describes.
+    """
+    window = list(itertools.islice(points, lookahead))
+    while len(window) == lookahead:
+        kept = list(
+            itertools.compress(
+                range(lookahead), _douglas_peucker(window, tolerance)
+            )
+        )
+        # The last point of the window was only kept because the window ends
+        # there, so the next window starts from the last point kept before
+        # it, unless that is the first point, when the window end is kept
+        restart = kept[-2] if kept[-2] > 0 else kept[-1]
+        yield from (window[i] for i in kept if i < restart)
+        window = window[restart:]
+        window.extend(itertools.islice(points, lookahead - len(window)))
+
+    yield from douglas_peucker(window, tolerance)
@@ -0,0 +1,256 @@
+"""
+Read and write points and lines as CSV or WKT text, one at a time.
+
+The readers take any iterable of text lines, such as an open file, and the
+writers take anything with a ``write`` method, so both work in constant
+memory however large the file is and can be chained to transform one file
+into another::
+
+    with open("in.wkt") as source, open("out.wkt", "w") as target:
+        write_wkt(target, (g + Point(1, 1) for g in read_wkt(source)))
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TextIO
+
+from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+POINT_COLUMNS = ("x", "y")
+LINE_COLUMNS = ("start_x", "start_y", "end_x", "end_y")
+
+
+def read_csv_points(
+    source: Iterable[str],
+    *,
+    columns: Sequence[str] = POINT_COLUMNS,
+) -> Iterator[Point]:
+    """
+    Read points from CSV text with a header row.
+
+    :param source: The lines of text, such as an open file.
+    :param columns: The names of the x and y columns.
+
+    :return: The points, one per row.
+
+    :raises ValueError: If a column is missing or a value is not a number.
+    """
+    for x, y in _read_csv(source, columns):
+        yield Point(x, y)
+
+
+def read_csv_lines(
+    source: Iterable[str],
+    *,
+    columns: Sequence[str] = LINE_COLUMNS,
+) -> Iterator[Line]:
+    """
+    Read lines from CSV text with a header row.
+
+    :param source: The lines of text, such as an open file.
+    :param columns: The names of the start x, start y, end x, and end y
+        columns.
+
+    :return: The lines, one per row.
+
+    :raises ValueError: If a column is missing or a value is not a number.
+    """
+    for start_x, start_y, end_x, end_y in _read_csv(source, columns):
+        yield Line(Point(start_x, start_y), Point(end_x, end_y))
+
+
+def _read_csv(
+    source: Iterable[str],
+    columns: Sequence[str],
+) -> Iterator[list[float]]:
+    """
+    Read the values in some columns of CSV text as numbers.
+    """
+    reader = csv.reader(source)
+    header = next(reader, None)
+    if header is None:
+        return
+
+    try:
+        positions = [header.index(column) for column in columns]
+    except ValueError:
+        missing = [column for column in columns if column not in header]
+        raise ValueError(f"Missing columns: {', '.join(missing)}.") from None
+
+    for row in reader:
+        if not row:
+            continue
+        try:
+            yield [float(row[position]) for position in positions]
+        except (IndexError, ValueError):
+            raise ValueError(
+                f"Invalid row on line {reader.line_num}: {row}"
+            ) from None
+
+
+def write_csv_points(
+    target: TextIO,
+    points: Iterable[Point],
+    *,
+    columns: Sequence[str] = POINT_COLUMNS,
+) -> int:
+    """
+    Write points as CSV text with a header row.
+
+    :param target: Where to write the text, such as an open file.
+    :param points: The points to write.
+    :param columns: The names of the x and y columns.
+
+    :return: The number of points written.
+    """
+    writer = csv.writer(target, lineterminator="\n")
+    writer.writerow(columns)
+    count = 0
+    for point in points:
+        writer.writerow(point)
+        count += 1
+
+    return count
+
+
+def write_csv_lines(
+    target: TextIO,
+    lines: Iterable[Line],
+    *,
+    columns: Sequence[str] = LINE_COLUMNS,
+) -> int:
+    """
+    Write lines as CSV text with a header row.
+
+    :param target: Where to write the text, such as an open file.
+    :param lines: The lines to write.
+    :param columns: The names of the start x, start y, end x, and end y
+        columns.
+
+    :return: The number of lines written.
+    """
+    writer = csv.writer(target, lineterminator="\n")
+    writer.writerow(columns)
+    count = 0
+    for line in lines:
+        writer.writerow((*line.start, *line.end))
+        count += 1
+
+    return count
+
+
+def read_wkt(source: Iterable[str]) -> Iterator[Point | Line]:
+    """
+    Read points and lines from well-known text, one geometry per line.
+
+    Each ``POINT`` becomes a point and each ``LINESTRING`` becomes a line
+    per segment, so a linestring through three points becomes two lines.
+    Blank lines are skipped.
+
+    :param source: The lines of text, such as an open file.
+
+    :return: The points and lines, in the order they appear.
+
+    :raises ValueError: If a line is not a point or linestring.
+    """
+    for number, text in enumerate(source, 1):
+        if not text.strip():
+            continue
+        try:
+            kind, points = _parse_wkt(text)
+        except ValueError:
+            raise ValueError(
+                f"Invalid geometry on line {number}: {text.strip()}"
+            ) from None
+
+        if kind == "POINT":
+            yield points[0]
+        else:
+            yield from map(Line, points, points[1:])
+
+
+def _parse_wkt(text: str) -> tuple[str, list[Point]]:
+    """
+    Return the kind of a geometry and the points in it.
+    """
+    kind, _, rest = text.partition("(")
+    kind = kind.strip().upper()
+    body, _, trailing = rest.partition(")")
+    if trailing.strip():
+        raise ValueError(text)
+
+    points = []
+    for pair in body.split(","):
+        x, y = pair.split()
+        points.append(Point(float(x), float(y)))
+
+    if kind == "POINT" and len(points) == 1:
+        return kind, points
+    if kind == "LINESTRING" and len(points) >= 2:  # noqa: PLR2004
+        return kind, points
+
+    raise ValueError(text)
+
+
+def write_wkt(target: TextIO, geometries: Iterable[Point | Line]) -> int:
+    """
+    Write points and lines as well-known text, one geometry per line.
+
+    :param target: Where to write the text, such as an open file.
+    :param geometries: The points and lines to write.
+
+    :return: The number of geometries written.
+    """
+    count = 0
+    for geometry in geometries:
+        if isinstance(geometry, Line):
+            (start_x, start_y), (end_x, end_y) = geometry.start, geometry.end
+            target.write(f"LINESTRING ({start_x} {start_y}, {end_x} {end_y})\n")
+        else:
+            x, y = geometry
+            target.write(f"POINT ({x} {y})\n")
+        count += 1
+
+    return count
+
+
+def point_batches(
+    points: Iterable[Point],
+    size: int = 65_536,
+) -> Iterator[PointArray]:
+    """
+    Collect points into point arrays of a fixed size.
+
+    :param points: The points to collect, such as from a reader.
+    :param size: The number of points in each batch. The last batch may be
+        smaller.
+
+    :return: The batches of points.
+    """
+    points = iter(points)
+    while batch := PointArray.from_points(itertools.islice(points, size)):
+        yield batch
+
+
+def line_batches(
+    lines: Iterable[Line],
+    size: int = 65_536,
+) -> Iterator[LineArray]:
+    """
+    Collect lines into line arrays of a fixed size.
+
+    :param lines: The lines to collect, such as from a reader.
+    :param size: The number of lines in each batch. The last batch may be
+        smaller.
+
+    :return: The batches of lines.
+    """
+    lines = iter(lines)
+    while batch := LineArray.from_lines(itertools.islice(lines, size)):
+        yield batch
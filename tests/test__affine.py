@@ -0,0 +1,140 @@
+"""
+Tests for the ``geometry/affine.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from geometry.affine import Affine2D
+from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+
+
+def test__affine_identity_leaves_points_unchanged():
+    """
+    The identity transformation leaves points unchanged.
+    """
+    assert Affine2D.identity() == Affine2D(1, 0, 0, 0, 1, 0)
+    assert Affine2D.identity().apply(Point(3, 4)) == Point(3, 4)
+
+
+@pytest.mark.parametrize(
+    "by, point, expected",
+    [
+        (3, Point(1, 2), Point(4, 5)),
+        (Point(1, -1), Point(1, 2), Point(2, 1)),
+    ],
+)
+def test__affine_translation_matches_point_addition(
+    by: Number | Point,
+    point: Point,
+    expected: Point,
+):
+    """
+    A translation moves points like point addition.
+    """
+    assert Affine2D.translation(by).apply(point) == point + by == expected
+
+
+@pytest.mark.parametrize(
+    "by, around, point, expected",
+    [
+        (3, Point(0, 0), Point(1, 2), Point(3, 6)),
+        (Point(2, -1), Point(0, 0), Point(1, 2), Point(2, -2)),
+        (2, Point(1, 1), Point(2, 3), Point(3, 5)),
+    ],
+)
+def test__affine_scale_moves_points_away_from_a_point(
+    by: Number | Point,
+    around: Point,
+    point: Point,
+    expected: Point,
+):
+    """
+    A scale multiplies the distance from a point.
+    """
+    assert Affine2D.scale(by, around).apply(point) == expected
+
+
+@pytest.mark.parametrize(
+    "around, angle, point, expected",
+    [
+        (Point(0, 0), math.radians(90), Point(1, 2), Point(-2, 1)),
+        (Point(1, 1), math.radians(90), Point(1, 2), Point(0, 1)),
+        (Point(1, 1), math.radians(180), Point(1, 2), Point(1, 0)),
+    ],
+)
+def test__affine_rotation_matches_point_rotation(
+    around: Point,
+    angle: Number,
+    point: Point,
+    expected: Point,
+):
+    """
+    A rotation rotates points like ``Point.rotate``.
+    """
+    rotation = Affine2D.rotation(angle, around)
+
+    assert rotation.apply(point, ndigits=8) == expected
+    assert point.rotate(by=angle, around=around) == expected
+
+
+def test__affine_rotation_is_only_rounded_when_asked():
+    """
+    Transformed coordinates are not rounded by default.
+    """
+    rotated = Affine2D.rotation(math.radians(90)).apply(Point(1, 2))
+
+    assert rotated != Point(-2, 1)
+    assert math.isclose(rotated.x, -2)
+    assert math.isclose(rotated.y, 1)
+
+
+def test__affine_transformations_can_be_composed():
+    """
+    Composed transformations apply right-to-left, like the individual steps.
+    """
+    centre, angle = Point(1, 1), 0.75
+    point = Point(3, -2)
+    pipeline = (
+        Affine2D.translation(Point(5, 6))
+        @ Affine2D.scale(2)
+        @ Affine2D.rotation(angle, centre)
+    )
+    stepwise = (point.rotate(by=angle, around=centre) * 2) + Point(5, 6)
+
+    assert pipeline.apply(point, ndigits=6) == Point(
+        round(stepwise.x, 6), round(stepwise.y, 6)
+    )
+    assert Affine2D.identity() @ pipeline == pipeline
+    with pytest.raises(TypeError):
+        pipeline @ Point(1, 2)
+
+
+def test__affine_applies_to_lines_and_collections():
+    """
+    Transformations apply to lines, point arrays, line arrays, and iterables
+    of points.
+    """
+    shift = Affine2D.translation(1)
+    points = [Point(0, 0), Point(1, 2)]
+    lines = [Line(0, 1), Line(Point(1, 2), Point(3, 5))]
+
+    assert shift.apply(Line(0, 1)) == Line(1, 2)
+    assert shift.apply(points) == [Point(1, 1), Point(2, 3)]
+    assert shift.apply(PointArray.from_points(points)) == PointArray(
+        [1, 2], [1, 3]
+    )
+    assert shift.apply(LineArray.from_lines(lines)) == LineArray.from_lines(
+        [line + 1 for line in lines]
+    )
+    assert list(
+        Affine2D.rotation(1.5, Point(1, 2)).apply(
+            PointArray.from_points(points), ndigits=8
+        )
+    ) == [point.rotate(by=1.5, around=Point(1, 2)) for point in points]
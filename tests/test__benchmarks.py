@@ -0,0 +1,117 @@
+"""
+Tests for the ``benchmarks`` package.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks import suite
+from benchmarks.__main__ import main
+
+
+def test__benchmarks_record_time_and_memory():
+    """
+    Every benchmark records its time and peak memory at each size.
+    """
+    results = suite.run(sizes=(10, 20), repeats=1)
+
+    assert set(results["results"]) == set(suite.BENCHMARKS)
+    for sizes in results["results"].values():
+        assert set(sizes) == {"10", "20"}
+        for metrics in sizes.values():
+            assert metrics["seconds"] >= 0
+            assert metrics["peak_bytes"] > 0
+
+
+def test__benchmarks_flag_regressions_against_a_baseline():
+    """
+    Measurements that exceed their baseline by more than the threshold are
+    regressions, and measurements missing from the baseline are ignored.
+    """
+    baseline = {
+        "results": {
+            "point_add": {"10": {"seconds": 1.0, "peak_bytes": 100}},
+        }
+    }
+    current = {
+        "results": {
+            "point_add": {
+                "10": {"seconds": 1.2, "peak_bytes": 200},
+                "20": {"seconds": 9.0, "peak_bytes": 900},
+            },
+            "line_slope": {"10": {"seconds": 9.0, "peak_bytes": 900}},
+        }
+    }
+
+    assert suite.compare(current, baseline, threshold=0.25) == [
+        suite.Regression("point_add", "10", "peak_bytes", 100, 200)
+    ]
+    assert suite.compare(current, baseline, threshold=0.1)[0].ratio == 1.2
+
+
+def test__benchmarks_can_be_saved_and_compared(tmp_path):
+    """
+    The command line writes results that it can then compare against.
+    """
+    path = tmp_path / "results.json"
+    arguments = ["point_add", "--sizes", "10", "--repeats", "1"]
+
+    assert main([*arguments, "--output", str(path)]) == 0
+    assert suite.load(path)["results"]["point_add"]["10"]["peak_bytes"] > 0
+    assert main([*arguments, "--compare", str(path), "--threshold", "1e9"]) == 0
+    with pytest.raises(SystemExit):
+        main(["not_a_benchmark"])
+
+
+def test__benchmarks_record_the_size_of_serialised_output():
+    """
+    Benchmarks that serialise points record the size of their output, and
+    the encoded points are smaller than the same points as JSON.
+    """
+    encoded = suite.measure(suite.BENCHMARKS["encode_points"], 100, 1)
+    naive = suite.measure(suite.BENCHMARKS["encode_points_json"], 100, 1)
+
+    assert 0 < encoded["output_bytes"] < naive["output_bytes"]
+    assert "output_bytes" not in suite.measure(
+        suite.BENCHMARKS["point_add"], 10, 1
+    )
+
+
+def test__benchmarks_are_only_compared_in_the_same_environment(
+    tmp_path, capsys
+):
+    """
+    Results are not compared against a baseline from another Python
+    version or another platform.
+    """
+    baseline = {"python": "3.13.1", "platform": "Linux-x86_64", "results": {}}
+
+    assert (
+        suite.environment_differences(
+            {**baseline, "python": "3.13.5"}, baseline
+        )
+        == {}
+    )
+    assert set(
+        suite.environment_differences(
+            {"python": "3.14.0", "platform": "Darwin-arm64"}, baseline
+        )
+    ) == {"python", "platform"}
+
+    path = tmp_path / "baseline.json"
+    current = suite.run(sizes=(10,), names=["point_add"], repeats=1)
+    arguments = ["point_add", "--sizes", "10", "--repeats", "1"]
+    suite.save({**current, "python": "2.7.18"}, path)
+
+    assert main([*arguments, "--compare", str(path)]) == 2
+    assert "NOT COMPARED" in capsys.readouterr().err
+
+    suite.save({**current, "platform": "elsewhere"}, path)
+
+    assert main([*arguments, "--compare", str(path)]) == 2
+    assert "elsewhere" in capsys.readouterr().err
+
+    suite.save(current, path)
+
+    assert main([*arguments, "--compare", str(path), "--threshold", "1e9"]) == 0
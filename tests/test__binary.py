@@ -0,0 +1,193 @@
+"""
+Tests for the ``geometry/binary.py`` module.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterator
+
+import pytest
+
+from geometry.binary import (
+    MAGIC,
+    read_lines,
+    read_points,
+    write_lines,
+    write_points,
+)
+from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+POINTS = [Point(0, 0), Point(1.5, -2), Point(-3, 4.25), Point(1e300, -1e-300)]
+LINES = [
+    Line(Point(0, 0), Point(1, 1)),
+    Line(Point(-1.5, 2), Point(3, -4.25)),
+    Line(Point(1e300, 0), Point(0, -1e-300)),
+]
+
+
+def test__points_can_be_written_and_read(tmp_path):
+    """
+    Points can be written to a file and read back exactly.
+    """
+    path = tmp_path / "points.geom"
+
+    assert write_points(path, iter(POINTS)) == len(POINTS)
+    with read_points(path) as points:
+        assert len(points) == len(POINTS)
+        assert list(points) == POINTS
+        assert points[1] == POINTS[1]
+        assert points[-1] == POINTS[-1]
+        assert points.xs.tolist() == [point.x for point in POINTS]
+        assert points.ys.tolist() == [point.y for point in POINTS]
+        assert points.to_point_array() == PointArray.from_points(POINTS)
+        with pytest.raises(IndexError):
+            points[len(POINTS)]
+
+
+def test__mapped_files_can_be_sliced(tmp_path):
+    """
+    Slicing a file copies the points or lines into an array, like slicing
+    a point array or a line array.
+    """
+    write_points(tmp_path / "points.geom", POINTS)
+    write_lines(tmp_path / "lines.geom", LINES)
+    with read_points(tmp_path / "points.geom") as points:
+        for index in (slice(1, 3), slice(None, None, -2), slice(5, 9)):
+            assert points[index] == PointArray.from_points(POINTS)[index]
+    with read_lines(tmp_path / "lines.geom") as lines:
+        for index in (slice(1, None), slice(None, None, -1), slice(0, 0)):
+            assert lines[index] == LineArray.from_lines(LINES)[index]
+
+
+def test__point_arrays_can_be_written(tmp_path):
+    """
+    Point arrays are written the same as the points they hold.
+    """
+    from_points = tmp_path / "from_points.geom"
+    from_array = tmp_path / "from_array.geom"
+
+    write_points(from_points, POINTS)
+    write_points(from_array, PointArray.from_points(POINTS))
+
+    assert from_points.read_bytes() == from_array.read_bytes()
+
+
+def test__lines_can_be_written_and_read(tmp_path):
+    """
+    Lines can be written to a file and read back exactly.
+    """
+    path = tmp_path / "lines.geom"
+
+    assert write_lines(path, iter(LINES)) == len(LINES)
+    with read_lines(path) as lines:
+        assert len(lines) == len(LINES)
+        assert list(lines) == LINES
+        assert lines[1] == LINES[1]
+        assert lines[-1] == LINES[-1]
+        assert lines.start_xs.tolist() == [line.start.x for line in LINES]
+        assert lines.start_ys.tolist() == [line.start.y for line in LINES]
+        assert lines.end_xs.tolist() == [line.end.x for line in LINES]
+        assert lines.end_ys.tolist() == [line.end.y for line in LINES]
+        assert lines.to_line_array() == LineArray.from_lines(LINES)
+
+
+def test__files_are_little_endian_with_a_header(tmp_path):
+    """
+    Files start with a header and hold packed little-endian doubles.
+    """
+    path = tmp_path / "points.geom"
+    write_points(path, POINTS[:2])
+
+    assert path.read_bytes() == (
+        struct.pack("<4sBBxxQ", MAGIC, 1, 1, 2)
+        + struct.pack("<4d", 0, 0, 1.5, -2)
+    )
+
+
+def test__empty_files_can_be_written_and_read(tmp_path):
+    """
+    Files can hold no points or lines.
+    """
+    path = tmp_path / "empty.geom"
+
+    assert write_lines(path, []) == 0
+    with read_lines(path) as lines:
+        assert len(lines) == 0
+        assert list(lines) == []
+
+
+def test__large_files_are_written_in_chunks(tmp_path):
+    """
+    Files with more coordinates than fit in one chunk are written in full.
+    """
+    path = tmp_path / "points.geom"
+    points = [Point(i, -i) for i in range(100_000)]
+
+    assert write_points(path, points) == len(points)
+    with read_points(path) as mapped:
+        assert list(mapped) == points
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"",
+        b"GEOM",
+        struct.pack("<4sBBxxQ", b"NOPE", 1, 1, 0),
+        struct.pack("<4sBBxxQ", MAGIC, 2, 1, 0),
+        struct.pack("<4sBBxxQ", MAGIC, 1, 2, 0),
+        struct.pack("<4sBBxxQ", MAGIC, 1, 1, 2) + struct.pack("<2d", 0, 0),
+    ],
+)
+def test__invalid_files_cannot_be_read(tmp_path, contents):
+    """
+    Files that are not point files, or are cut short, cannot be read as
+    points.
+    """
+    path = tmp_path / "points.geom"
+    path.write_bytes(contents)
+
+    with pytest.raises(ValueError):
+        read_points(path)
+
+
+def test__points_must_have_two_coordinates(tmp_path):
+    """
+    Points cannot be written if they have a missing coordinate.
+    """
+    path = tmp_path / "points.geom"
+    for points in ([(1, 2), (3,)], [(1, 2, 3), (4, 5, 6)]):
+        with pytest.raises(ValueError, match="Every point"):
+            write_points(path, iter(points))
+        assert not path.exists()
+
+
+def test__lines_must_have_two_points_of_two_coordinates(tmp_path):
+    """
+    Lines cannot be written if a point has a missing coordinate.
+    """
+    line = Line(Point(0, 0), Point(1, 1))
+    partial = type("Partial", (), {"start": (0,), "end": (1, 1)})()
+
+    with pytest.raises(ValueError, match="Every line"):
+        write_lines(tmp_path / "lines.geom", [line, partial])
+    assert not (tmp_path / "lines.geom").exists()
+
+
+def test__files_are_removed_if_writing_fails(tmp_path):
+    """
+    A file is not left behind part written if its points fail to arrive.
+    """
+    path = tmp_path / "points.geom"
+
+    def points() -> Iterator[Point]:
+        yield from POINTS
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        write_points(path, points())
+    assert not path.exists()
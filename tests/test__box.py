@@ -0,0 +1,109 @@
+"""
+Tests for the ``geometry/box.py`` module.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from geometry.box import BoundingBox, clip_interval
+from geometry.line import Line
+from geometry.point import Point
+
+BOX = BoundingBox(Point(0, 0), Point(4, 2))
+
+
+def test__around():
+    """
+    The box around some points reaches each of their extremes.
+    """
+    points = [Point(1, 5), Point(-2, 3), Point(4, -1), Point(0, 0)]
+
+    assert BoundingBox.around(points) == BoundingBox(Point(-2, -1), Point(4, 5))
+    assert BoundingBox.around([Point(1, 1)]) == (Point(1, 1), Point(1, 1))
+    with pytest.raises(ValueError):
+        BoundingBox.around([])
+
+
+def test__measurements():
+    """
+    The width, height and area of a box come from its corners.
+    """
+    assert BOX.width == 4
+    assert BOX.height == 2
+    assert BOX.area == 8
+
+
+@pytest.mark.parametrize(
+    ("point", "expected"),
+    [
+        (Point(1, 1), True),
+        (Point(4, 2), True),
+        (Point(0, 1), True),
+        (Point(5, 1), False),
+        (Point(1, -0.5), False),
+    ],
+)
+def test__contains(point, expected):
+    """
+    Points inside a box or on its edges are contained.
+    """
+    assert BOX.contains(point) is expected
+
+
+@pytest.mark.parametrize(
+    ("other", "expected"),
+    [
+        (BoundingBox(Point(1, 1), Point(2, 5)), True),
+        (BoundingBox(Point(4, 2), Point(6, 6)), True),
+        (BoundingBox(Point(5, 0), Point(6, 1)), False),
+        (BoundingBox(Point(0, 3), Point(4, 4)), False),
+    ],
+)
+def test__overlaps(other, expected):
+    """
+    Boxes overlap when they share any area or edge.
+    """
+    assert BOX.overlaps(other) is expected
+    assert other.overlaps(BOX) is expected
+
+
+def test__union():
+    """
+    The union of two boxes surrounds both.
+    """
+    other = BoundingBox(Point(-1, 1), Point(2, 3))
+
+    assert BOX.union(other) == BoundingBox(Point(-1, 0), Point(4, 3))
+
+
+def test__bounding_boxes_unpack_into_corners():
+    """
+    Lines give their bounding boxes as ``BoundingBox`` objects, which can be
+    passed where a box is taken as two corners.
+    """
+    line = Line(Point(3, 1), Point(-1, 4))
+
+    assert line.bounding_box == BoundingBox(Point(-1, 1), Point(3, 4))
+    assert line.crosses_box(*BOX)
+    assert not Line(Point(5, 5), Point(6, 6)).crosses_box(*BOX)
+
+
+@pytest.mark.parametrize(
+    ("segment", "expected"),
+    [
+        ((1, 1, 3, 1), (0.0, 1.0)),
+        ((-2, 1, 6, 1), (0.25, 0.75)),
+        ((2, 3, 2, -1), (0.25, 0.75)),
+        ((-1, 3, 5, 3), None),
+        ((5, 0, 5, 2), None),
+        ((-2, -1, 0, 0), (1.0, 1.0)),
+        ((6, 6, 7, 7), None),
+    ],
+)
+def test__clip_interval(segment, expected):
+    """
+    The interval is the fractions along a segment between which it is
+    inside the box, or ``None`` if none of it is.
+    """
+    assert clip_interval(segment, *BOX) == expected
@@ -0,0 +1,109 @@
+"""
+Tests for the ``geometry/bvh.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from geometry.bvh import BVH
+from geometry.kdtree import Neighbour
+from geometry.line import Line
+from geometry.point import Point
+
+RNG = random.Random(0)  # noqa: S311
+
+
+def _random_line() -> Line:
+    start = Point(RNG.uniform(0, 100), RNG.uniform(0, 100))
+    return Line(start, start + Point(RNG.uniform(-5, 5), RNG.uniform(-5, 5)))
+
+
+LINES = [_random_line() for _ in range(400)] + [
+    Line(Point(50, 0), Point(50, 100)),
+    Line(Point(0, 50), Point(100, 50)),
+    Line(Point(20, 20), Point(20, 20)),
+]
+QUERIES = [
+    Point(RNG.uniform(-10, 110), RNG.uniform(-10, 110)) for _ in range(40)
+]
+
+
+def test__bvh_can_be_built():
+    """
+    A BVH can be built from many lines, one line, and no lines.
+    """
+    assert len(BVH(LINES)) == len(LINES)
+    assert BVH([Line(0, 1)]).nearest(Point(2, 1)) == [
+        Neighbour(0, Point(1, 1), 1.0)
+    ]
+    assert BVH([]).nearest(Point(0, 0)) == []
+    assert BVH([]).intersecting_box(Point(0, 0), Point(1, 1)) == []
+
+
+@pytest.mark.parametrize("k", [1, 5])
+@pytest.mark.parametrize("node_capacity", [2, 16])
+def test__bvh_nearest_matches_a_scan(k: int, node_capacity: int):
+    """
+    The nearest lines match measuring every line.
+    """
+    tree = BVH(LINES, node_capacity=node_capacity)
+
+    for query in QUERIES:
+        distances = sorted(
+            (line.distance_to(query), i) for i, line in enumerate(LINES)
+        )
+        actual = tree.nearest(query, k=k)
+
+        assert [n.index for n in actual] == [i for _, i in distances[:k]]
+        assert all(
+            math.isclose(n.distance, d)
+            for n, (d, _) in zip(actual, distances, strict=False)
+        )
+        assert all(
+            n.point == LINES[n.index].closest_point(query) for n in actual
+        )
+
+
+@pytest.mark.parametrize(
+    "min_point, max_point",
+    [
+        (Point(0, 0), Point(100, 100)),
+        (Point(10, 20), Point(30, 70)),
+        (Point(49, 0), Point(49.5, 100)),
+        (Point(20, 20), Point(20, 20)),
+        (Point(200, 200), Point(300, 300)),
+    ],
+)
+def test__bvh_intersecting_box_matches_a_scan(
+    min_point: Point,
+    max_point: Point,
+):
+    """
+    The lines passing through a box match clipping every line.
+    """
+    tree = BVH(LINES, node_capacity=4)
+    corners = [
+        min_point,
+        Point(max_point.x, min_point.y),
+        max_point,
+        Point(min_point.x, max_point.y),
+    ]
+    sides = [
+        Line(a, b)
+        for a, b in zip(corners, corners[1:] + corners[:1], strict=True)
+    ]
+
+    def passes_through(line: Line) -> bool:
+        starts_inside = (
+            min_point.x <= line.start.x <= max_point.x
+            and min_point.y <= line.start.y <= max_point.y
+        )
+        return starts_inside or any(line.intersection(s) for s in sides)
+
+    assert tree.intersecting_box(min_point, max_point) == [
+        i for i, line in enumerate(LINES) if passes_through(line)
+    ]
@@ -0,0 +1,103 @@
+"""
+Tests for the ``geometry/clip.py`` module.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from geometry.box import BoundingBox
+from geometry.clip import clip
+from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.point import Point
+
+RANDOM = random.Random(22)  # noqa: S311
+BOX = BoundingBox(Point(0, 0), Point(4, 2))
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        (Line(Point(1, 1), Point(3, 1)), Line(Point(1, 1), Point(3, 1))),
+        (Line(Point(-2, 1), Point(6, 1)), Line(Point(0, 1), Point(4, 1))),
+        (Line(Point(2, -1), Point(2, 5)), Line(Point(2, 0), Point(2, 2))),
+        (Line(Point(5, 2), Point(3, 0)), Line(Point(4, 1), Point(3, 0))),
+        (Line(Point(-1, -1), Point(5, 5)), Line(Point(0, 0), Point(2, 2))),
+        (Line(Point(-1, 1), Point(1, 3)), Line(Point(0, 2), Point(0, 2))),
+        (Line(Point(-1, 3), Point(5, 3)), None),
+        (Line(Point(5, -1), Point(5, 5)), None),
+        (Line(Point(-1, 2), Point(2, 5)), None),
+    ],
+)
+def test__clip(line, expected):
+    """
+    Lines are cut to the box, including vertical and horizontal lines, and
+    lines outside it are dropped.
+    """
+    assert clip([line], BOX) == ([expected] if expected else [])
+
+
+def test__clip_keeps_lines_inside_the_box():
+    """
+    Lines wholly inside the box are returned as they are.
+    """
+    inside = Line(Point(1, 1), Point(2, 2))
+
+    assert clip([inside], BOX)[0] is inside
+    assert clip([], BOX) == []
+
+
+def test__clip_matches_crosses_box():
+    """
+    Exactly the lines that cross the box are kept, cut to parts of
+    themselves inside it, including lines along and parallel to its sides.
+    """
+    lines = [
+        Line(
+            Point(RANDOM.uniform(-5, 9), RANDOM.uniform(-5, 7)),
+            Point(RANDOM.uniform(-5, 9), RANDOM.uniform(-5, 7)),
+        )
+        for _ in range(2000)
+    ] + [
+        Line(
+            Point(RANDOM.randint(-2, 6), RANDOM.randint(-2, 4)),
+            Point(RANDOM.randint(-2, 6), RANDOM.randint(-2, 4)),
+        )
+        for _ in range(2000)
+    ]
+    crossing = [line for line in lines if line.crosses_box(*BOX)]
+    clipped = clip(lines, BOX)
+
+    assert len(clipped) == len(crossing)
+    for line, part in zip(crossing, clipped, strict=True):
+        assert BOX.contains(part.start)
+        assert BOX.contains(part.end)
+        assert line.distance_to(part.start) < 1e-9
+        assert line.distance_to(part.end) < 1e-9
+
+
+def test__clip_line_arrays():
+    """
+    A line array is clipped into a new line array.
+    """
+    lines = [
+        Line(Point(-2, 1), Point(6, 1)),
+        Line(Point(5, 5), Point(6, 6)),
+        Line(Point(1, 1), Point(2, 2)),
+    ]
+
+    clipped = clip(LineArray.from_lines(lines), BOX)
+
+    assert isinstance(clipped, LineArray)
+    assert clipped == LineArray.from_lines(clip(lines, BOX))
+
+
+def test__clip_checks_the_box():
+    """
+    The box's corners must be in order.
+    """
+    with pytest.raises(ValueError):
+        clip([], BoundingBox(Point(1, 1), Point(0, 0)))
@@ -0,0 +1,142 @@
+"""
+Tests for the ``geometry/curves.py`` module.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+from geometry.box import BoundingBox
+from geometry.curves import (
+    hilbert_key,
+    hilbert_keys,
+    morton_key,
+    morton_keys,
+    partition,
+    spatial_sort,
+)
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+RANDOM = random.Random(23)  # noqa: S311
+GRID = [Point(x, y) for x in range(16) for y in range(16)]
+GRID_BOX = BoundingBox(Point(0, 0), Point(15, 15))
+
+
+@pytest.mark.parametrize("bits", [1, 2, 4, 8])
+def test__hilbert_keys_visit_neighbouring_cells(bits):
+    """
+    Each cell of the grid has its own Hilbert key, and consecutive keys are
+    in cells next to each other.
+    """
+    size = 1 << bits
+    cells = [Point(x, y) for x in range(size) for y in range(size)]
+    box = BoundingBox(Point(0, 0), Point(size - 1, size - 1))
+    keys = hilbert_keys(cells, box, bits=bits)
+    ordered = [cell for _, cell in sorted(zip(keys, cells, strict=True))]
+
+    assert sorted(keys) == list(range(size * size))
+    assert all(
+        abs(a.x - b.x) + abs(a.y - b.y) == 1
+        for a, b in itertools.pairwise(ordered)
+    )
+
+
+@pytest.mark.parametrize(
+    ("point", "expected"),
+    [
+        (Point(0, 0), 0),
+        (Point(1, 0), 1),
+        (Point(0, 1), 2),
+        (Point(1, 1), 3),
+        (Point(2, 0), 4),
+        (Point(3, 3), 15),
+        (Point(-5, 9), 10),
+    ],
+)
+def test__morton_key(point, expected):
+    """
+    Z-order keys interleave the bits of the quantised coordinates, with
+    points outside the box placed on its edge.
+    """
+    box = BoundingBox(Point(0, 0), Point(3, 3))
+
+    assert morton_key(point, box, bits=2) == expected
+
+
+def test__keys_for_batches_match_single_points():
+    """
+    Keys for a batch are the keys of each point in it.
+    """
+    points = [
+        Point(RANDOM.uniform(-9, 9), RANDOM.uniform(-9, 9)) for _ in range(200)
+    ]
+    box = BoundingBox.around(points)
+
+    assert list(morton_keys(points)) == [morton_key(p, box) for p in points]
+    assert list(hilbert_keys(PointArray.from_points(points))) == [
+        hilbert_key(p, box) for p in points
+    ]
+    assert list(hilbert_keys([])) == []
+
+
+@pytest.mark.parametrize("curve", ["hilbert", "morton"])
+def test__spatial_sort(curve):
+    """
+    Sorting keeps every point and orders them by their keys.
+    """
+    points = [
+        Point(RANDOM.uniform(0, 1), RANDOM.uniform(0, 1)) for _ in range(500)
+    ]
+    keys = {"hilbert": hilbert_keys, "morton": morton_keys}[curve]
+
+    ordered = spatial_sort(points, curve=curve)
+
+    assert sorted(ordered) == sorted(points)
+    assert list(keys(ordered, BoundingBox.around(points))) == sorted(
+        keys(points)
+    )
+    assert spatial_sort(PointArray.from_points(points), curve=curve) == (
+        PointArray.from_points(ordered)
+    )
+
+
+def test__partition_into_compact_chunks():
+    """
+    A grid split into four chunks along the Hilbert curve is split into its
+    quadrants.
+    """
+    chunks = partition(RANDOM.sample(GRID, len(GRID)), 4, box=GRID_BOX)
+    boxes = [BoundingBox.around(chunk) for chunk in chunks]
+
+    assert [len(chunk) for chunk in chunks] == [64] * 4
+    assert all(box.area == 49 for box in boxes)
+    assert sorted(point for chunk in chunks for point in chunk) == sorted(GRID)
+
+
+def test__partition_sizes_differ_by_at_most_one():
+    """
+    Points that do not divide evenly are spread over the first chunks.
+    """
+    chunks = partition(PointArray.from_points(GRID[:10]), 4)
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2, 2]
+    assert all(isinstance(chunk, PointArray) for chunk in chunks)
+    assert partition([], 2) == [[], []]
+
+
+def test__arguments_are_checked():
+    """
+    The curve, number of bits and number of chunks must be valid.
+    """
+    with pytest.raises(ValueError):
+        spatial_sort(GRID, curve="peano")
+    with pytest.raises(ValueError):
+        morton_keys(GRID, bits=17)
+    with pytest.raises(ValueError):
+        hilbert_keys(GRID, bits=0)
+    with pytest.raises(ValueError):
+        partition(GRID, 0)
@@ -0,0 +1,109 @@
+"""
+Tests for the ``geometry/encoding.py`` module.
+"""
+
+from __future__ import annotations
+
+import io
+import random
+
+import pytest
+
+from geometry.encoding import (
+    decode_point_batches,
+    decode_points,
+    decode_points_stream,
+    encode_points,
+)
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.polyline import Polyline
+
+RANDOM = random.Random(25)  # noqa: S311
+
+
+def _route(size: int, spread: float) -> list[Point]:
+    x, y, route = RANDOM.uniform(-180, 180), RANDOM.uniform(-90, 90), []
+    for _ in range(size):
+        x += RANDOM.uniform(-spread, spread)
+        y += RANDOM.uniform(-spread, spread)
+        route.append(Point(round(x, 5), round(y, 5)))
+    return route
+
+
+def test__encoded_points_round_trip():
+    """
+    Points on the grid decode to exactly the points that were encoded, for
+    paths of nearby points and of points far apart.
+    """
+    for spread in (1e-4, 1.0, 100.0):
+        route = _route(500, spread)
+
+        assert decode_points(encode_points(route)) == PointArray.from_points(
+            route
+        )
+
+    point = Point(0.123456789, -1.987654321)
+    decoded = decode_points(encode_points([point], step=1e-3), step=1e-3)
+
+    assert decoded[0] == Point(0.123, -1.988)
+    assert decode_points(b"") == PointArray()
+    assert encode_points([]) == b""
+
+
+def test__encoded_points_are_zig_zag_varints_of_differences():
+    """
+    Each coordinate is the zig-zag varint of its difference from the point
+    before it.
+    """
+    points = [Point(1e-5, 0), Point(2e-5, -1e-5), Point(1.00002, -1e-5)]
+
+    assert encode_points(points) == b"\x02\x00\x02\x01\xc0\x9a\x0c\x00"
+
+
+def test__encoded_points_are_smaller_than_text():
+    """
+    A path of nearby points takes about two bytes a point.
+    """
+    route = _route(1000, 1e-4)
+
+    assert len(encode_points(route)) < 2.1 * len(route)
+    assert encode_points(Polyline(route)) == encode_points(route)
+    assert encode_points(PointArray.from_points(route)) == encode_points(route)
+
+
+def test__encoded_points_stream_from_any_split():
+    """
+    A stream decodes to the same points however it is split into chunks,
+    including in the middle of a varint or a point.
+    """
+    route = _route(300, 1.0)
+    data = encode_points(route)
+    for _ in range(20):
+        cuts = sorted(RANDOM.sample(range(1, len(data)), 10))
+        chunks = [
+            data[start:end]
+            for start, end in zip([0, *cuts], [*cuts, len(data)], strict=True)
+        ]
+
+        assert list(decode_points_stream(chunks)) == route
+
+    batches = list(decode_point_batches(io.BytesIO(data), chunk_size=7))
+
+    assert len(batches) > 1
+    assert [point for batch in batches for point in batch] == route
+    assert list(decode_points_stream(io.BytesIO(data), chunk_size=1)) == route
+
+
+def test__encoded_points_must_not_be_cut_short():
+    """
+    Data that ends part of the way through a varint or a point is an error.
+    """
+    data = encode_points([Point(1.0, 2.0), Point(3.0, 4.0)])
+
+    with pytest.raises(ValueError, match="part of the way"):
+        decode_points(data[:-1])
+    with pytest.raises(ValueError, match="part of the way"):
+        decode_points(data[:3])
+    with pytest.raises(ValueError, match="part of the way"):
+        list(decode_points_stream([data, b"\x80"]))
@@ -0,0 +1,97 @@
+"""
+Tests for the ``geometry/hull.py`` module.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from geometry.hull import convex_hull, merge_hulls, streaming_convex_hull
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+RANDOM = random.Random(14)  # noqa: S311
+POINTS = [
+    Point(RANDOM.randint(-50, 50), RANDOM.randint(-50, 50)) for _ in range(2000)
+]
+
+
+def _is_convex_hull(hull: list[Point], points: list[Point]) -> bool:
+    """
+    Return whether every turn of a hull is anticlockwise and every point is
+    inside or on it.
+    """
+    edges = list(zip(hull, hull[1:] + hull[:1], strict=True))
+    return all(
+        (end.x - start.x) * (point.y - start.y)
+        - (end.y - start.y) * (point.x - start.x)
+        >= 0
+        for start, end in edges
+        for point in [*points, *hull]
+    ) and all(
+        (end.x - start.x) * (after.y - start.y)
+        - (end.y - start.y) * (after.x - start.x)
+        > 0
+        for (start, end), (_, after) in zip(
+            edges, edges[1:] + edges[:1], strict=True
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("points", "expected"),
+    [
+        ([], []),
+        ([Point(1, 1)], [Point(1, 1)]),
+        ([Point(1, 1)] * 3, [Point(1, 1)]),
+        ([Point(2, 2), Point(0, 0), Point(1, 1)], [Point(0, 0), Point(2, 2)]),
+        (
+            [Point(0, 0), Point(1, 1), Point(2, 0), Point(1, 0), Point(1, 2)],
+            [Point(0, 0), Point(2, 0), Point(1, 2)],
+        ),
+        (
+            [(0, 0), (0, 1), (1, 1), (1, 0), (0.5, 0.5)],
+            [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)],
+        ),
+    ],
+)
+def test__convex_hull(points, expected):
+    """
+    The hull is the outermost points in anticlockwise order, without
+    duplicates or points along its edges.
+    """
+    assert convex_hull(points) == expected
+
+
+def test__convex_hull_of_many_points():
+    """
+    The hull of many points surrounds them all, and is the same for any
+    container of the points.
+    """
+    hull = convex_hull(POINTS)
+
+    assert _is_convex_hull(hull, POINTS)
+    assert convex_hull(PointArray.from_points(POINTS)) == hull
+    assert convex_hull(iter(POINTS)) == hull
+
+
+def test__hulls_can_be_merged():
+    """
+    Merging the hulls of chunks of points gives the hull of all the points.
+    """
+    chunks = [POINTS[i : i + 300] for i in range(0, len(POINTS), 300)]
+
+    assert merge_hulls(*map(convex_hull, chunks)) == convex_hull(POINTS)
+    assert merge_hulls() == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 500, 5000])
+def test__convex_hull_can_be_streamed(chunk_size):
+    """
+    Reading the points in chunks gives the same hull as reading them at once.
+    """
+    assert streaming_convex_hull(
+        iter(POINTS), chunk_size=chunk_size
+    ) == convex_hull(POINTS)
@@ -0,0 +1,95 @@
+"""
+Tests for the ``geometry/interning.py`` module.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from geometry.interning import PointPool, PoolStats
+from geometry.line import Line
+from geometry.point import Point
+
+
+def test__pool_returns_canonical_points():
+    """
+    Equal points are interned to the first instance seen.
+    """
+    pool = PointPool()
+    first = Point(1.5, 2.5)
+    second = Point(1.5, 2.5)
+
+    assert pool.intern(first) is first
+    assert pool.intern(second) is first
+    assert pool.intern(Point(0, 0)) == Point(0, 0)
+    assert len(pool) == 2
+    assert Point(1.5, 2.5) in pool
+    assert Point(9, 9) not in pool
+
+
+def test__pool_records_hits_and_misses():
+    """
+    The pool counts the points it found and the points it added.
+    """
+    pool = PointPool()
+    for point in [Point(0, 0), Point(1, 1), Point(0, 0), Point(0, 0)]:
+        pool.intern(point)
+
+    assert pool.stats() == PoolStats(hits=2, misses=2, evictions=0, size=2)
+    assert pool.stats().hit_rate == 0.5
+    assert PointPool().stats().hit_rate == 0
+
+    pool.clear()
+
+    assert pool.stats() == PoolStats(0, 0, 0, 0)
+
+
+def test__pool_evicts_the_least_recently_used_points():
+    """
+    A full pool drops the point that was used longest ago.
+    """
+    pool = PointPool(max_size=2)
+    pool.intern(Point(0, 0))
+    pool.intern(Point(1, 1))
+    pool.intern(Point(0, 0))
+    pool.intern(Point(2, 2))
+
+    assert Point(0, 0) in pool
+    assert Point(1, 1) not in pool
+    assert Point(2, 2) in pool
+    assert pool.stats().evictions == 1
+
+
+def test__unbounded_pool_keeps_every_point():
+    """
+    A pool without a size never evicts.
+    """
+    pool = PointPool(max_size=None)
+    for i in range(1000):
+        pool.intern(Point(i, i))
+
+    assert len(pool) == 1000
+    assert pool.stats().evictions == 0
+
+
+def test__pool_must_hold_a_point():
+    """
+    A pool must have room for at least one point.
+    """
+    with pytest.raises(ValueError):
+        PointPool(max_size=0)
+
+
+def test__lines_can_share_points_through_a_pool():
+    """
+    Lines built with a pool share the instances of their common ends.
+    """
+    pool = PointPool()
+    first = Line(Point(0, 0), Point(1, 1), pool=pool)
+    second = Line(Point(1, 1), Point(2, 0), pool=pool)
+    third = Line(2, Point(0, 0), pool=pool)
+
+    assert first.end is second.start
+    assert third.end is first.start
+    assert first == Line(Point(0, 0), Point(1, 1))
+    assert pool.stats() == PoolStats(hits=2, misses=4, evictions=0, size=4)
@@ -0,0 +1,89 @@
+"""
+Tests for the ``geometry/intersection.py`` module.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+
+from geometry.intersection import Intersection, intersections
+from geometry.line import Line
+from geometry.point import Point
+
+
+def _pairwise(lines: list[Line]) -> list[Intersection]:
+    """
+    Intersect every pair of lines.
+    """
+    return [
+        Intersection(i, j, at)
+        for (i, line), (j, other) in itertools.combinations(enumerate(lines), 2)
+        if (at := line.intersection(other)) is not None
+    ]
+
+
+def test__intersections_are_reported_for_each_pair():
+    """
+    Each pair of lines that meet is reported once with where they meet.
+    """
+    lines = [
+        Line(0, 2),
+        Line(Point(0, 2), Point(2, 0)),
+        Line(Point(1, -1), Point(1, 3)),
+        Line(Point(5, 5), Point(6, 5)),
+        Line(1, 3),
+    ]
+
+    assert intersections(lines) == [
+        Intersection(0, 1, Point(1, 1)),
+        Intersection(0, 2, Point(1, 1)),
+        Intersection(0, 4, Line(1, 2)),
+        Intersection(1, 2, Point(1, 1)),
+        Intersection(1, 4, Point(1, 1)),
+        Intersection(2, 4, Point(1, 1)),
+    ]
+
+
+@pytest.mark.parametrize("lines", [[], [Line(0, 1)], [Line(0, 1), Line(2, 3)]])
+def test__intersections_can_be_empty(lines: list[Line]):
+    """
+    No intersections are reported when no lines meet.
+    """
+    assert intersections(lines) == []
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test__intersections_match_pairwise_intersections(seed: int):
+    """
+    The sweep finds the same intersections as comparing every pair, including
+    for vertical, collinear, and zero-length lines.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    scale = rng.choice([1, 4])
+
+    def random_point() -> Point:
+        return Point(rng.randint(0, 8) / scale, rng.randint(0, 8) / scale)
+
+    lines = [Line(random_point(), random_point()) for _ in range(60)]
+
+    assert intersections(lines) == _pairwise(lines)
+
+
+def test__intersections_match_pairwise_intersections_for_random_lines():
+    """
+    The sweep finds the same intersections as comparing every pair for lines
+    in general position.
+    """
+    rng = random.Random(0)  # noqa: S311
+    lines = [
+        Line(
+            Point(rng.uniform(0, 100), rng.uniform(0, 100)),
+            Point(rng.uniform(0, 100), rng.uniform(0, 100)),
+        )
+        for _ in range(200)
+    ]
+
+    assert intersections(lines) == _pairwise(lines)
@@ -0,0 +1,159 @@
+"""
+Tests for the ``geometry/kdtree.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from geometry.kdtree import KDTree, Neighbour
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+RNG = random.Random(0)  # noqa: S311
+POINTS = [Point(RNG.uniform(0, 100), RNG.uniform(0, 100)) for _ in range(500)]
+QUERIES = [
+    Point(RNG.uniform(-10, 110), RNG.uniform(-10, 110)) for _ in range(50)
+]
+
+
+def _distance(point: Point, other: Point) -> float:
+    return math.dist(point, other)
+
+
+def test__kdtree_can_be_built_from_points_and_point_arrays():
+    """
+    A k-d tree can be built from points, point arrays, and nothing.
+    """
+    assert len(KDTree(POINTS)) == 500
+    assert len(KDTree(PointArray.from_points(POINTS))) == 500
+    assert len(KDTree([])) == 0
+    assert KDTree([]).nearest(Point(0, 0)) == []
+
+
+def test__kdtree_finds_the_nearest_point():
+    """
+    The nearest point is the point with the smallest distance.
+    """
+    tree = KDTree([Point(0, 0), Point(5, 5), Point(1, 2)])
+
+    assert tree.nearest(Point(2, 2)) == [Neighbour(2, Point(1, 2), 1.0)]
+
+
+def test__kdtree_nearest_finds_nothing_for_no_points():
+    """
+    Asking for no neighbours, or searching an empty tree, finds nothing.
+    """
+    tree = KDTree(POINTS)
+
+    assert tree.nearest(Point(1, 1), k=0) == []
+    assert tree.nearest(Point(1, 1), k=-1) == []
+    assert tree.nearest_many(QUERIES[:3], k=0) == [[], [], []]
+    assert KDTree([]).nearest(Point(1, 1), k=3) == []
+
+
+@pytest.mark.parametrize("k", [1, 3, 10])
+@pytest.mark.parametrize("leaf_size", [1, 8])
+def test__kdtree_nearest_matches_a_scan(k: int, leaf_size: int):
+    """
+    The nearest points match scanning every point.
+    """
+    tree = KDTree(POINTS, leaf_size=leaf_size)
+
+    for query in QUERIES:
+        expected = sorted(
+            range(len(POINTS)), key=lambda i: _distance(POINTS[i], query)
+        )[:k]
+        actual = tree.nearest(query, k=k)
+
+        assert [n.index for n in actual] == expected
+        assert [n.point for n in actual] == [POINTS[i] for i in expected]
+        assert all(
+            math.isclose(n.distance, _distance(n.point, query)) for n in actual
+        )
+
+
+@pytest.mark.parametrize("k", [1, 4])
+def test__kdtree_nearest_many_matches_nearest(k: int):
+    """
+    Searching for many points at once matches searching for each point.
+    """
+    tree = KDTree(POINTS)
+
+    assert tree.nearest_many(QUERIES, k=k) == [
+        tree.nearest(query, k=k) for query in QUERIES
+    ]
+    assert tree.nearest_many(PointArray.from_points(QUERIES)) == [
+        tree.nearest(query) for query in QUERIES
+    ]
+
+
+@pytest.mark.parametrize("radius", [0, 5, 20])
+def test__kdtree_within_radius_matches_a_scan(radius: float):
+    """
+    The points within a radius match scanning every point.
+    """
+    tree = KDTree(POINTS)
+    expected = [
+        [i for i, p in enumerate(POINTS) if _distance(p, query) <= radius]
+        for query in QUERIES
+    ]
+
+    assert [tree.within_radius(query, radius) for query in QUERIES] == expected
+    assert tree.within_radius_many(QUERIES, radius) == expected
+    assert tree.within_radius(POINTS[7], 0) == [7]
+
+
+@pytest.mark.parametrize(
+    "min_point, max_point",
+    [
+        (Point(0, 0), Point(100, 100)),
+        (Point(10, 20), Point(30, 70)),
+        (Point(50, 50), Point(50.5, 90)),
+        (Point(200, 200), Point(300, 300)),
+    ],
+)
+def test__kdtree_within_box_matches_a_scan(min_point: Point, max_point: Point):
+    """
+    The points within a box match scanning every point.
+    """
+    tree = KDTree(POINTS)
+
+    assert tree.within_box(min_point, max_point) == [
+        i
+        for i, p in enumerate(POINTS)
+        if min_point.x <= p.x <= max_point.x
+        and min_point.y <= p.y <= max_point.y
+    ]
+
+
+def test__kdtree_handles_duplicate_points():
+    """
+    Duplicate points are all indexed.
+    """
+    tree = KDTree([Point(1, 1)] * 20 + [Point(2, 2)])
+
+    assert tree.within_radius(Point(1, 1), 0) == list(range(20))
+    assert tree.within_box(Point(1, 1), Point(1, 1)) == list(range(20))
+    assert tree.nearest(Point(2, 2))[0].index == 20
+
+
+def test__kdtree_breaks_ties_the_same_way_with_or_without_a_hint():
+    """
+    Equally distant points are chosen the same way whatever order the tree
+    is searched in.
+    """
+    grid = [Point(x, y) for x in range(10) for y in range(10)]
+    queries = [Point(x + 0.5, y + 0.5) for x in range(9) for y in range(9)]
+    tree = KDTree(grid, leaf_size=2)
+
+    for k in (1, 3):
+        assert tree.nearest_many(queries, k=k) == [
+            tree.nearest(query, k=k) for query in queries
+        ]
+        assert tree.nearest_many(reversed(queries), k=k) == [
+            tree.nearest(query, k=k) for query in reversed(queries)
+        ]
@@ -0,0 +1,148 @@
+"""
+Tests for the ``geometry/lazy.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from geometry.affine import Affine2D
+from geometry.lazy import Expression, lazy
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+RANDOM = random.Random(20)  # noqa: S311
+POINTS = [
+    Point(RANDOM.uniform(-1e3, 1e3), RANDOM.uniform(-1e3, 1e3))
+    for _ in range(500)
+]
+CENTRE, AROUND, SCALE, SHIFT = Point(1.5, -2), Point(0.3, 0.7), Point(2, 3), 7
+
+
+class _Counted(float):
+    """
+    A number that counts how many times it is subtracted from.
+    """
+
+    subtractions = 0
+
+    def __rsub__(self, other: float) -> float:
+        _Counted.subtractions += 1
+        return other - float(self)
+
+
+def _chain(point: Point | Expression) -> Point | Expression:
+    return ((point - CENTRE).rotate(by=0.7, around=AROUND) * SCALE) + SHIFT
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        _chain,
+        lambda p: -p + 3,
+        lambda p: 3 - p,
+        lambda p: CENTRE - p,
+        lambda p: 2.5 * (p - 1) * p,
+        lambda p: (p - CENTRE) * (p - CENTRE) + (p - CENTRE),
+        lambda p: p.transform(Affine2D.scale(2, AROUND)).rotate(
+            by=math.pi / 3, around=CENTRE
+        ),
+        lambda p: p.transform(Affine2D.rotation(1), ndigits=3),
+    ],
+)
+def test__lazy_matches_eager(build):
+    """
+    Computing an expression gives the same points as the eager methods.
+    """
+    expected = [build(point) for point in POINTS]
+    expression = build(lazy(POINTS))
+
+    assert isinstance(expression, Expression)
+    assert expression.compute() == PointArray.from_points(expected)
+    assert list(expression) == expected
+    assert build(lazy(POINTS[0])).compute() == expected[0]
+
+
+def test__lazy_single_points_stay_points():
+    """
+    An expression of single points computes to a point, keeping integer
+    coordinates as the eager methods do.
+    """
+    expression = (lazy(Point(1, 2)) + Point(3, 4)) * 2
+
+    assert expression.compute() == Point(8, 12)
+    assert isinstance(expression.compute().x, int)
+    assert tuple(expression) == (8, 12)
+
+
+def test__lazy_combines_batches_and_points():
+    """
+    Batches combine pairwise and single points broadcast across them.
+    """
+    first = PointArray.from_points(POINTS)
+    second = PointArray.from_points(reversed(POINTS))
+    centre = lazy(CENTRE).rotate(by=1, around=AROUND)
+    expression = (lazy(first) - second) * centre + first
+
+    assert expression.compute() == PointArray.from_points(
+        (a - b) * CENTRE.rotate(by=1, around=AROUND) + a
+        for a, b in zip(first, second, strict=True)
+    )
+    assert (second - lazy(first)).compute() == second - first
+
+
+def test__lazy_defers_until_computed():
+    """
+    Nothing is worked out, or checked, until the expression is used.
+    """
+    expression = lazy(POINTS) + lazy(POINTS[:10])
+
+    with pytest.raises(ValueError):
+        expression.compute()
+    with pytest.raises(ValueError):
+        list(expression)
+
+    iterator = iter(lazy(POINTS) * 2)
+
+    assert next(iterator) == POINTS[0] * 2
+
+
+def test__lazy_evaluates_common_subexpressions_once():
+    """
+    A step that appears more than once in an expression is worked out once
+    per point.
+    """
+    _Counted.subtractions = 0
+    offset = _Counted(1.5)
+    points = lazy(POINTS)
+    expression = (points - offset) * (points - offset) + (points - offset)
+
+    expression.compute()
+
+    assert _Counted.subtractions == 2 * len(POINTS)
+
+
+def test__lazy_rejects_other_operands():
+    """
+    Only points, point arrays, numbers and expressions can be combined.
+    """
+    with pytest.raises(TypeError):
+        lazy(POINTS) + "a"
+    assert str(lazy(Point(1, 2)) * 2) == "Expression((Point(x=1, y=2) * 2))"
+
+
+def test__lazy_transform_rounds_to_whole_numbers_of_places():
+    """
+    The number of decimal places is passed to the compiled loop as a value,
+    never as source, so only integers are accepted.
+    """
+    expression = lazy(Point(1.23456, 2)).transform(Affine2D(), ndigits=2)
+
+    assert expression.compute() == Point(1.23, 2)
+    with pytest.raises(TypeError, match="integer"):
+        lazy(Point(1, 2)).transform(Affine2D(), ndigits='__import__("os")')
+    with pytest.raises(TypeError, match="integer"):
+        lazy(POINTS).transform(Affine2D(), ndigits=2.5)
@@ -4,7 +4,9 @@ Tests for the ``geometry/line.py`` module.
 
 from __future__ import annotations
 
+import copy
 import math
+import pickle
 
 import pytest
 
@@ -253,9 +255,170 @@ def test__line_contains_points(line: Line, point: Point, expected: bool):
     assert line.contains(point) == expected
 
 
+@pytest.mark.parametrize(
+    "line, point, expected",
+    [
+        (Line(1, 0), Point(0.5, 0.5), True),
+        (Line(Point(0, 1), 0), Point(0, 0.5), True),
+        (Line(Point(2, 0), Point(0, 1)), Point(1, 0.5), True),
+        (Line(Point(0.1, 0.1), Point(0.7, 0.7)), Point(0.3, 0.3), True),
+        (Line(Point(0, 0), Point(1e-12, 1)), Point(0, 0.5), False),
+        (Line(Point(0, 0), Point(3, 1)), Point(1, 1 / 3), False),
+        (Line(Point(12, 12), Point(24, 24)), Point(18, 18 + 1e-14), False),
+        (Line(1, 1), Point(1, 1), True),
+        (Line(1, 1), Point(1, 2), False),
+    ],
+)
+def test__line_contains_points_exactly(
+    line: Line, point: Point, expected: bool
+):
+    """
+    Lines in either direction contain exactly the points on them, however
+    steep or short the line.
+    """
+    assert line.contains(point) == expected
+
+
 def test__line_can_be_turned_into_a_vector():
     """
     A line can be represented as a vector.
     """
     line = Line(1, 2)
     assert line.as_vector() == Point(1, 1)
+
+
+@pytest.mark.parametrize(
+    "line, other, expected",
+    [
+        # Crossing and touching
+        (Line(0, 2), Line(Point(0, 2), Point(2, 0)), Point(1, 1)),
+        (Line(0, 1), Line(1, 2), Point(1, 1)),
+        (Line(0, Point(0, 2)), Line(Point(-1, 1), Point(1, 1)), Point(0, 1)),
+        (Line(0, Point(0, 2)), Line(Point(0, 1), Point(1, 1)), Point(0, 1)),
+        # Not meeting
+        (Line(0, 1), Line(Point(0, 1), Point(1, 2)), None),
+        (Line(0, 1), Line(Point(2, 0), Point(3, -1)), None),
+        (Line(0, Point(0, 1)), Line(Point(1, 0), Point(1, 1)), None),
+        # Collinear
+        (Line(0, 2), Line(1, 3), Line(1, 2)),
+        (Line(0, 3), Line(2, 1), Line(1, 2)),
+        (
+            Line(0, Point(0, 2)),
+            Line(Point(0, 1), Point(0, 3)),
+            Line(Point(0, 1), Point(0, 2)),
+        ),
+        (Line(0, 1), Line(1, 2), Point(1, 1)),
+        (Line(0, 1), Line(2, 3), None),
+        # Zero-length
+        (Line(1, 1), Line(0, 2), Point(1, 1)),
+        (Line(0, 2), Line(1, 1), Point(1, 1)),
+        (Line(1, 1), Line(1, 1), Point(1, 1)),
+        (Line(1, 1), Line(2, 2), None),
+    ],
+)
+def test__line_can_intersect_lines(
+    line: Line,
+    other: Line,
+    expected: Point | Line | None,
+):
+    """
+    Lines meet at a point when they cross or touch and along a line when they
+    overlap, including when they are vertical.
+    """
+    assert line.intersection(other) == expected
+
+
+@pytest.mark.parametrize(
+    "line, point, expected",
+    [
+        (Line(0, Point(2, 0)), Point(1, 1), Point(1, 0)),
+        (Line(0, Point(2, 0)), Point(-1, 1), Point(0, 0)),
+        (Line(0, Point(2, 0)), Point(5, -4), Point(2, 0)),
+        (Line(0, Point(0, 2)), Point(3, 1), Point(0, 1)),
+        (Line(0, 2), Point(2, 0), Point(1, 1)),
+        (Line(1, 1), Point(4, 5), Point(1, 1)),
+    ],
+)
+def test__line_has_closest_point(line: Line, point: Point, expected: Point):
+    """
+    The closest point on a line is the projection of the point onto the line,
+    limited to its endpoints.
+    """
+    assert line.closest_point(point) == expected
+    assert math.isclose(
+        line.distance_to(point),
+        math.dist(point, expected),
+    )
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        (Line(Point(1, 1), Point(2, 2)), True),
+        (Line(Point(-1, 1), Point(5, 1)), True),
+        (Line(Point(1, -1), Point(1, 5)), True),
+        (Line(Point(-1, 2), Point(2, -1)), True),
+        (Line(Point(-1, 3), Point(3, -1)), True),
+        (Line(Point(3, 1), Point(1, 3)), True),
+        (Line(Point(-2, 3), Point(3, -2)), True),
+        (Line(Point(-2, 1), Point(1, -2)), False),
+        (Line(Point(-1, 5), Point(5, 5)), False),
+        (Line(Point(5, -1), Point(5, 5)), False),
+        (Line(Point(3, 3), Point(3, 3)), False),
+        (Line(Point(2, 2), Point(2, 2)), True),
+    ],
+)
+def test__line_can_cross_boxes(line: Line, expected: bool):
+    """
+    A line crosses a box when any part of it is inside the box.
+    """
+    assert line.crosses_box(Point(0, 0), Point(2, 2)) is expected
+
+
+def test__line_is_immutable():
+    """
+    The points of a line cannot be changed and lines have no ``__dict__``.
+    """
+    line = Line(1, 2)
+
+    with pytest.raises(AttributeError):
+        line.start = Point(0, 0)
+    with pytest.raises(AttributeError):
+        line.colour = "red"
+    assert not hasattr(line, "__dict__")
+
+
+def test__line_derived_values_are_cached():
+    """
+    The slope, intercept, length, and bounding box are worked out once.
+    """
+    line = Line(Point(3, 1), Point(1, 5))
+
+    assert line.slope is line.slope
+    assert line.intercept is line.intercept
+    assert line.length is line.length
+    assert line.bounding_box is line.bounding_box
+    assert line.bounding_box == (Point(1, 1), Point(3, 5))
+    assert (line.slope, line.intercept) == (-2, 7)
+    assert math.isclose(line.length, math.sqrt(20))
+
+
+def test__line_can_be_pickled_and_copied():
+    """
+    A pickled or copied line works out its derived values again, whether or
+    not the original had already worked them out.
+    """
+    line = Line(Point(0, 0), Point(2, 1))
+    cached = Line(Point(0, 0), Point(2, 1))
+    cached.bounding_box  # noqa: B018
+    for original in (line, cached):
+        for restored in (
+            pickle.loads(pickle.dumps(original)),  # noqa: S301
+            copy.copy(original),
+            copy.deepcopy(original),
+        ):
+            assert restored == original
+            assert restored.slope == 0.5
+            assert restored.intercept == 0
+            assert restored.length == math.sqrt(5)
+            assert restored.bounding_box == (Point(0, 0), Point(2, 1))
@@ -0,0 +1,153 @@
+"""
+Tests for the ``geometry/line_array.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+LINES = [
+    Line(0, 0),
+    Line(0, 1),
+    Line(1, 2),
+    Line(0, Point(1, 0)),
+    Line(Point(0, 1), 0),
+    Line(0, Point(0, 1)),
+    Line(Point(1, 2), Point(4, 8)),
+]
+
+
+def test__line_array_can_be_initialised():
+    """
+    A line array can be initialised from start and end points and from lines.
+    """
+    from_points = LineArray(
+        [line.start for line in LINES],
+        [line.end for line in LINES],
+    )
+    from_lines = LineArray.from_lines(LINES)
+
+    assert from_points == from_lines
+    assert LineArray.from_lines(from_lines) == from_lines
+    assert from_lines.starts == PointArray.from_points(
+        line.start for line in LINES
+    )
+    assert from_lines.ends == PointArray.from_points(line.end for line in LINES)
+    assert len(LineArray()) == 0
+
+
+def test__line_array_start_and_end_points_must_be_the_same_length():
+    """
+    A line array cannot be initialised with mismatched points.
+    """
+    with pytest.raises(ValueError):
+        LineArray([Point(0, 0)], [])
+
+
+def test__line_array_can_be_converted_to_lines():
+    """
+    A line array can be iterated, indexed, and sliced.
+    """
+    lines = LineArray.from_lines(LINES)
+
+    assert len(lines) == len(LINES)
+    assert lines.to_lines() == LINES
+    assert lines[2] == Line(1, 2)
+    assert lines[-1] == LINES[-1]
+    assert lines[1:3] == LineArray.from_lines(LINES[1:3])
+
+
+def test__line_array_is_represented_correctly():
+    """
+    The string and representation of a line array are correct.
+    """
+    lines = LineArray.from_lines([Line(1, 2)])
+    expected = "LineArray([Line(Point(x=1.0, y=1.0), Point(x=2.0, y=2.0))])"
+
+    assert str(lines) == expected
+    assert repr(lines) == expected
+
+
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (LineArray.from_lines(LINES), True),
+        (LineArray.from_lines(LINES[1:]), False),
+        (LINES, False),
+    ],
+)
+def test__line_array_can_be_compared_for_equality(
+    other: LineArray | list,
+    expected: bool,
+):
+    """
+    Line arrays can be compared for equality and comparisons with
+    non-line-arrays return ``False``.
+    """
+    assert (LineArray.from_lines(LINES) == other) is expected
+
+
+def test__line_array_properties_match_lines():
+    """
+    The length, slope, and intercept of a line array match each line.
+    """
+    lines = LineArray.from_lines(LINES)
+
+    assert list(lines.length) == [line.length for line in LINES]
+    assert list(lines.slope) == [line.slope for line in LINES]
+    assert lines.intercept == [line.intercept for line in LINES]
+    assert lines.slope[0] == math.inf
+    assert lines.intercept[0] is None
+
+
+@pytest.mark.parametrize(
+    "point",
+    [
+        Point(0, 0),
+        Point(1, 1),
+        Point(0.5, 0.5),
+        Point(0.25, 0.75),
+        Point(0, 1),
+        Point(1, 0),
+        Point(2, 4),
+        Point(-1, 0),
+    ],
+)
+def test__line_array_contains_a_point(point: Point):
+    """
+    Checking one point against a line array matches each line.
+    """
+    lines = LineArray.from_lines(LINES)
+
+    assert lines.contains_many(point) == [
+        line.contains(point) for line in LINES
+    ]
+
+
+def test__line_array_contains_points_pairwise():
+    """
+    Checking points pairwise against a line array matches each line.
+    """
+    lines = LineArray.from_lines(LINES)
+    points = [
+        Point(0, 0),
+        Point(0.25, 0.75),
+        Point(1.5, 1.5),
+        Point(1, 0),
+        Point(0, 0.5),
+        Point(0, 2),
+        Point(2, 4),
+    ]
+
+    assert lines.contains_many(points) == [
+        line.contains(point) for line, point in zip(LINES, points, strict=True)
+    ]
+    with pytest.raises(ValueError):
+        lines.contains_many(points[1:])
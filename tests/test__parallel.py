@@ -0,0 +1,143 @@
+"""
+Tests for the ``geometry/parallel.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+import pickle
+import random
+from collections.abc import Callable
+from concurrent.futures import Future
+
+import pytest
+
+from geometry.affine import Affine2D
+from geometry.bvh import BVH
+from geometry.kdtree import KDTree
+from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.parallel import ParallelExecutor, _load_index, _shared_index
+from geometry.point import Point
+from geometry.point_array import PointArray
+
+RANDOM = random.Random(13)  # noqa: S311
+POINTS = PointArray.from_points(
+    Point(RANDOM.uniform(-100, 100), RANDOM.uniform(-100, 100))
+    for _ in range(1000)
+)
+LINES = LineArray(POINTS, POINTS[::-1])
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ParallelExecutor(workers=2, chunk_size=128) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("batch", [POINTS, LINES])
+@pytest.mark.parametrize("ndigits", [None, 8])
+def test__transform_matches_serial(executor, batch, ndigits):
+    """
+    Transforming in parallel gives exactly the serial result.
+    """
+    matrix = Affine2D.rotation(math.pi / 3, Point(1, 2)) @ Affine2D.scale(3)
+
+    assert executor.transform(
+        batch, matrix, ndigits=ndigits
+    ) == batch.transform(matrix, ndigits=ndigits)
+
+
+def test__length_matches_serial(executor):
+    """
+    Measuring in parallel gives exactly the serial result.
+    """
+    assert executor.length(LINES) == LINES.length
+
+
+def test__contains_many_matches_serial(executor):
+    """
+    Checking containment in parallel gives exactly the serial result.
+    """
+    lines = LineArray.from_lines(
+        Line(Point(i, i), Point(i + 10, i + 20)) for i in range(1000)
+    )
+    points = [
+        Point(i + 5, i + 10) if i % 3 else Point(i, 0) for i in range(1000)
+    ]
+
+    assert executor.contains_many(lines, points) == lines.contains_many(points)
+    assert executor.contains_many(
+        lines, Point(505, 510)
+    ) == lines.contains_many(Point(505, 510))
+    with pytest.raises(ValueError):
+        executor.contains_many(lines, points[1:])
+
+
+@pytest.mark.parametrize("k", [1, 3])
+def test__index_queries_match_serial(executor, k):
+    """
+    Querying an index in parallel gives exactly the serial result.
+    """
+    kdtree = KDTree(POINTS)
+    bvh = BVH(LINES[:200])
+    queries = POINTS.transform(Affine2D.translation(Point(0.5, 0.5)))
+
+    assert executor.nearest_many(kdtree, queries, k=k) == kdtree.nearest_many(
+        queries, k=k
+    )
+    assert executor.nearest_many(bvh, queries, k=k) == [
+        bvh.nearest(query, k=k) for query in queries
+    ]
+    assert executor.within_radius_many(
+        kdtree, queries, 10
+    ) == kdtree.within_radius_many(queries, 10)
+
+
+def test__indexes_are_not_sent_with_each_chunk(executor, monkeypatch):
+    """
+    An index is pickled into shared memory once per query, so what is sent
+    with each chunk is far smaller than the index, and each worker only
+    unpickles it the first time it sees it.
+    """
+    kdtree = KDTree(POINTS)
+    submit, sent = executor._pool.submit, []
+
+    def record(task: Callable[..., object], *arguments: object) -> Future:
+        sent.append(pickle.dumps(arguments))
+        return submit(task, *arguments)
+
+    monkeypatch.setattr(executor._pool, "submit", record)
+
+    assert executor.nearest_many(kdtree, POINTS, k=2) == kdtree.nearest_many(
+        POINTS, k=2
+    )
+    assert len(sent) == math.ceil(len(POINTS) / 128)
+    assert max(map(len, sent)) * 20 < len(pickle.dumps(kdtree))
+
+    with _shared_index(kdtree) as shared:
+        assert _load_index(shared) is _load_index(shared)
+        assert _load_index(shared).nearest(Point(0, 0)) == kdtree.nearest(
+            Point(0, 0)
+        )
+
+
+def test__small_and_empty_batches_are_processed(executor):
+    """
+    Batches that fit in a single chunk are processed too.
+    """
+    matrix = Affine2D.translation(Point(1, 1))
+
+    assert executor.transform(POINTS[:10], matrix) == POINTS[:10].transform(
+        matrix
+    )
+    assert executor.length(LineArray()) == LineArray().length
+    assert executor.nearest_many(KDTree(POINTS), []) == []
+
+
+def test__chunk_size_must_be_positive():
+    """
+    The chunk size must be at least 1.
+    """
+    with pytest.raises(ValueError):
+        ParallelExecutor(chunk_size=0)
@@ -231,3 +231,14 @@ def test__point_can_be_rotated(
     assert (
         point_to_rotate.rotate(by=angle, around=point_of_rotation) == expected
     )
+
+
+def test__point_rotation_rounds_the_offset_before_adding_the_centre_back():
+    """
+    Rotating a point rounds its rotated offset from the centre, not the
+    result, so the result keeps the centre's own floating point error.
+    """
+    rotated = Point(1, 0).rotate(by=math.pi / 2, around=Point(0.1, 0.2))
+
+    assert rotated == Point(0.30000000000000004, 1.1)
+    assert rotated == Point(0.2, 0.9) + Point(0.1, 0.2)
@@ -0,0 +1,143 @@
+"""
+Tests for the ``geometry/point_array.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from geometry.point import Number, Point
+from geometry.point_array import PointArray
+
+POINTS = [Point(1, 2), Point(3, 4), Point(-5, 6)]
+
+
+def test__point_array_can_be_initialised():
+    """
+    A point array can be initialised from coordinates and from points.
+    """
+    from_coordinates = PointArray([1, 3, -5], [2, 4, 6])
+    from_points = PointArray.from_points(POINTS)
+
+    assert from_coordinates == from_points
+    assert list(from_points.xs) == [1, 3, -5]
+    assert list(from_points.ys) == [2, 4, 6]
+    assert PointArray.from_points(from_points) == from_points
+    assert len(PointArray()) == 0
+
+
+def test__point_array_coordinates_must_be_the_same_length():
+    """
+    A point array cannot be initialised with mismatched coordinates.
+    """
+    with pytest.raises(ValueError):
+        PointArray([1, 2], [3])
+
+
+def test__point_array_can_be_converted_to_points():
+    """
+    A point array can be iterated, indexed, and sliced.
+    """
+    points = PointArray.from_points(POINTS)
+
+    assert len(points) == 3
+    assert points.to_points() == POINTS
+    assert list(points) == POINTS
+    assert points[1] == Point(3, 4)
+    assert points[-1] == Point(-5, 6)
+    assert points[1:] == PointArray.from_points(POINTS[1:])
+
+
+def test__point_array_is_represented_correctly():
+    """
+    The string and representation of a point array are correct.
+    """
+    points = PointArray([1], [2])
+
+    assert str(points) == "PointArray([Point(x=1.0, y=2.0)])"
+    assert repr(points) == "PointArray([Point(x=1.0, y=2.0)])"
+
+
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (PointArray.from_points(POINTS), True),
+        (PointArray.from_points(POINTS[:2]), False),
+        (POINTS, False),
+        ("3", False),
+    ],
+)
+def test__point_array_can_be_compared_for_equality(
+    other: PointArray | list | str,
+    expected: bool,
+):
+    """
+    Point arrays can be compared for equality and comparisons with
+    non-point-arrays return ``False``.
+    """
+    assert (PointArray.from_points(POINTS) == other) is expected
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        3,
+        2.5,
+        Point(1, -2),
+        PointArray([1, 2, 3], [4, 5, 6]),
+    ],
+)
+def test__point_array_arithmetic_matches_points(
+    other: Number | Point | PointArray,
+):
+    """
+    Point array arithmetic matches point arithmetic for each point.
+    """
+    points = PointArray.from_points(POINTS)
+    others = list(other) if isinstance(other, PointArray) else [other] * 3
+    pairs = list(zip(POINTS, others, strict=True))
+
+    assert list(points + other) == [p + o for p, o in pairs]
+    assert list(points - other) == [p - o for p, o in pairs]
+    assert list(points * other) == [p * o for p, o in pairs]
+    assert list(other + points) == [o + p for p, o in pairs]
+    assert list(other - points) == [o - p for p, o in pairs]
+    assert list(other * points) == [o * p for p, o in pairs]
+    assert list(-points) == [-p for p in POINTS]
+
+
+def test__point_array_arithmetic_is_not_implemented_with_non_numerics():
+    """
+    Point arrays cannot be combined with non-numerics or mismatched arrays.
+    """
+    points = PointArray.from_points(POINTS)
+
+    with pytest.raises(TypeError):
+        points + "3"
+    with pytest.raises(TypeError):
+        points * "3"
+    with pytest.raises(ValueError):
+        points - PointArray([1], [2])
+
+
+@pytest.mark.parametrize(
+    "around, angle",
+    [
+        (Point(0, 0), math.radians(0)),
+        (Point(0, 0), math.radians(90)),
+        (Point(1, 1), math.radians(180)),
+        (Point(1, 1), math.radians(270)),
+        (Point(-2, 3), 1.234),
+    ],
+)
+def test__point_array_can_be_rotated(around: Point, angle: Number):
+    """
+    Rotating a point array matches rotating each point.
+    """
+    points = PointArray.from_points(POINTS)
+
+    assert list(points.rotate(by=angle, around=around)) == [
+        p.rotate(by=angle, around=around) for p in POINTS
+    ]
@@ -0,0 +1,146 @@
+"""
+Tests for the ``geometry/polygon.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from geometry.line import Line
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.polygon import Polygon
+
+RANDOM = random.Random(21)  # noqa: S311
+SQUARE = Polygon([Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)])
+# A U shape, open at the top
+CUP = Polygon(
+    [
+        Point(0, 0),
+        Point(6, 0),
+        Point(6, 6),
+        Point(4, 6),
+        Point(4, 2),
+        Point(2, 2),
+        Point(2, 6),
+        Point(0, 6),
+    ]
+)
+
+
+def _ray_cast(polygon: Polygon, point: Point) -> bool:
+    """
+    Check containment by casting a ray through every edge.
+    """
+    if any(edge.contains(point) for edge in polygon.edges):
+        return True
+
+    inside = False
+    for edge in polygon.edges:
+        (x0, y0), (x1, y1) = edge.start, edge.end
+        if (y0 <= point.y) != (y1 <= point.y):
+            x = x0 + (point.y - y0) * (x1 - x0) / (y1 - y0)
+            inside ^= point.x < x
+    return inside
+
+
+@pytest.mark.parametrize(
+    ("point", "expected"),
+    [
+        (Point(1, 1), True),
+        (Point(5, 5), True),
+        (Point(3, 4), False),
+        (Point(3, 2), True),
+        (Point(3, 6), False),
+        (Point(0, 3), True),
+        (Point(4, 6), True),
+        (Point(5, 6), True),
+        (Point(2, 4), True),
+        (Point(-1, 1), False),
+        (Point(7, 3), False),
+    ],
+)
+def test__contains(point, expected):
+    """
+    Points inside the polygon or on its edges are contained.
+    """
+    assert CUP.contains(point) is expected
+
+
+def test__contains_matches_ray_casting():
+    """
+    The slab index agrees with checking every edge, including for polygons
+    whose edges cross.
+    """
+    for _ in range(50):
+        angles = sorted(RANDOM.uniform(0, 2 * math.pi) for _ in range(40))
+        vertices = [
+            Point(
+                round(radius * math.cos(angle)),
+                round(radius * math.sin(angle)),
+            )
+            for angle in angles
+            for radius in [RANDOM.uniform(1, 10)]
+        ]
+        RANDOM.shuffle(vertices)
+        polygon = Polygon(vertices)
+        points = [
+            Point(RANDOM.randint(-11, 11), RANDOM.uniform(-11, 11))
+            for _ in range(100)
+        ]
+
+        assert polygon.contains_many(points) == [
+            _ray_cast(polygon, point) for point in points
+        ]
+
+
+def test__contains_many():
+    """
+    Batches of points can be checked as lists or point arrays.
+    """
+    points = [Point(1, 1), Point(3, 4), Point(5, 0), Point(9, 9)]
+
+    assert CUP.contains_many(points) == [True, False, True, False]
+    assert CUP.contains_many(PointArray.from_points(points)) == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert CUP.contains_many([]) == []
+
+
+def test__measurements():
+    """
+    The area, perimeter and bounding box are measured once and kept.
+    """
+    assert CUP.area == 28
+    assert CUP.perimeter == 32
+    assert CUP.bounding_box == (Point(0, 0), Point(6, 6))
+    assert CUP.area is CUP.area
+    assert Polygon(reversed(CUP.vertices)).area == 28
+
+
+def test__polygon_closes_its_ring():
+    """
+    The edges run around the vertices and back to the first, which may be
+    repeated at the end.
+    """
+    closed = Polygon([*SQUARE, Point(0, 0)])
+
+    assert closed == SQUARE
+    assert len(closed) == 4
+    assert hash(closed) == hash(SQUARE)
+    assert closed.edges[-1] == Line(Point(0, 4), Point(0, 0))
+    assert str(SQUARE) == f"Polygon({SQUARE.vertices})"
+
+
+def test__polygon_needs_three_vertices():
+    """
+    A polygon must enclose an area.
+    """
+    with pytest.raises(ValueError):
+        Polygon([Point(0, 0), Point(1, 1), Point(0, 0)])
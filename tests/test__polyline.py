@@ -0,0 +1,152 @@
+"""
+Tests for the ``geometry/polyline.py`` module.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from geometry.line import Line
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.polyline import Polyline
+
+# An L shape: 3 along the x axis, then 4 up
+ROUTE = [Point(0, 0), Point(3, 0), Point(3, 4)]
+
+
+def test__polyline_can_be_initialised():
+    """
+    A polyline can be built from points, and holds them in order.
+    """
+    polyline = Polyline(ROUTE)
+
+    assert len(polyline) == 3
+    assert list(polyline) == ROUTE
+    assert polyline[-1] == Point(3, 4)
+    assert polyline.points == PointArray.from_points(ROUTE)
+    assert polyline == Polyline(iter(ROUTE))
+    assert polyline != Polyline(ROUTE[:2])
+    assert polyline.to_lines() == [
+        Line(Point(0, 0), Point(3, 0)),
+        Line(Point(3, 0), Point(3, 4)),
+    ]
+    assert str(polyline) == f"Polyline({list(polyline)})"
+
+
+def test__polyline_length_is_the_sum_of_its_lines():
+    """
+    The length of a polyline is the sum of the lengths of its lines.
+    """
+    assert Polyline(ROUTE).length == 7
+    assert list(Polyline(ROUTE).distances) == [0, 3, 7]
+    assert Polyline([Point(1, 1)]).length == 0
+    assert Polyline().length == 0
+
+
+def test__appending_updates_the_distances():
+    """
+    Appending points extends the distances without changing earlier ones.
+    """
+    polyline = Polyline()
+    polyline.append(Point(0, 0))
+    polyline.extend([Point(3, 0), Point(3, 4)])
+    polyline.append(Point(0, 0))
+
+    assert list(polyline.distances) == [0, 3, 7, 12]
+    assert polyline.point_at(9.5) == Point(1.5, 2)
+
+
+@pytest.mark.parametrize(
+    ("distance", "expected"),
+    [
+        (0, Point(0, 0)),
+        (1.5, Point(1.5, 0)),
+        (3, Point(3, 0)),
+        (5, Point(3, 2)),
+        (7, Point(3, 4)),
+    ],
+)
+def test__point_at(distance, expected):
+    """
+    The point at a distance is found along the right line.
+    """
+    assert Polyline(ROUTE).point_at(distance) == expected
+
+
+def test__point_at_handles_repeated_points():
+    """
+    Lines of no length are skipped over.
+    """
+    polyline = Polyline([Point(0, 0), Point(0, 0), Point(2, 0), Point(2, 0)])
+
+    assert polyline.point_at(0) == Point(0, 0)
+    assert polyline.point_at(1) == Point(1, 0)
+    assert polyline.point_at(2) == Point(2, 0)
+    assert Polyline([Point(1, 1)]).point_at(0) == Point(1, 1)
+
+
+@pytest.mark.parametrize("distance", [-0.1, 7.1])
+def test__point_at_must_be_on_the_path(distance):
+    """
+    Distances before the start or after the end are not on the path.
+    """
+    with pytest.raises(ValueError):
+        Polyline(ROUTE).point_at(distance)
+    with pytest.raises(ValueError):
+        Polyline().point_at(0)
+
+
+@pytest.mark.parametrize(
+    ("point", "expected"),
+    [
+        (Point(0, 0), 0),
+        (Point(1, -1), 1),
+        (Point(-1, -1), 0),
+        (Point(4, 2), 5),
+        (Point(3, 9), 7),
+        (Point(2, 1), 2),
+    ],
+)
+def test__locate(point, expected):
+    """
+    A point is located at the distance to its projection on the path.
+    """
+    assert Polyline(ROUTE).locate(point) == expected
+
+
+def test__locate_needs_points():
+    """
+    A point cannot be located on an empty path.
+    """
+    assert Polyline([Point(1, 1)]).locate(Point(5, 5)) == 0
+    with pytest.raises(ValueError):
+        Polyline().locate(Point(0, 0))
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        (0, 7, ROUTE),
+        (1, 5, [Point(1, 0), Point(3, 0), Point(3, 2)]),
+        (3, 7, [Point(3, 0), Point(3, 4)]),
+        (1, 2, [Point(1, 0), Point(2, 0)]),
+        (4, 4, [Point(3, 1), Point(3, 1)]),
+    ],
+)
+def test__slice(start, end, expected):
+    """
+    A slice runs between the points at two distances.
+    """
+    sliced = Polyline(ROUTE).slice(start, end)
+
+    assert list(sliced) == expected
+    assert sliced.length == end - start
+
+
+def test__slice_must_be_in_order():
+    """
+    A slice cannot end before it starts.
+    """
+    with pytest.raises(ValueError):
+        Polyline(ROUTE).slice(5, 1)
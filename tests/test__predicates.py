@@ -0,0 +1,101 @@
+"""
+Tests for the ``geometry/predicates.py`` module.
+"""
+
+from __future__ import annotations
+
+import random
+from fractions import Fraction
+
+import pytest
+
+from geometry.point import Point
+from geometry.predicates import incircle, orient2d
+
+RANDOM = random.Random(18)  # noqa: S311
+
+
+def _exact_orient2d(a: Point, b: Point, c: Point) -> int:
+    ax, ay, bx, by, cx, cy = map(Fraction, (*a, *b, *c))
+    determinant = (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+    return (determinant > 0) - (determinant < 0)
+
+
+def _exact_incircle(a: Point, b: Point, c: Point, d: Point) -> int:
+    ax, ay, bx, by, cx, cy, dx, dy = map(Fraction, (*a, *b, *c, *d))
+    rows = [(ax - dx, ay - dy), (bx - dx, by - dy), (cx - dx, cy - dy)]
+    (adx, ady), (bdx, bdy), (cdx, cdy) = rows
+    determinant = (
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+    return (determinant > 0) - (determinant < 0)
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "c", "expected"),
+    [
+        (Point(0, 0), Point(1, 0), Point(0, 1), 1),
+        (Point(0, 0), Point(0, 1), Point(1, 0), -1),
+        (Point(0, 0), Point(1, 1), Point(2, 2), 0),
+        (Point(0, 0), Point(0, 0), Point(5, 3), 0),
+        (Point(0.1, 0.1), Point(0.3, 0.3), Point(0.7, 0.7), 0),
+        (Point(0.5, 0.5 + 2**-53), Point(12, 12), Point(24, 24), 1),
+        (Point(10**30, 0), Point(0, 10**30), Point(1, 1), 1),
+    ],
+)
+def test__orient2d(a, b, c, expected):
+    """
+    The orientation of three points is exact, even when floating point
+    arithmetic rounds the determinant to the wrong sign.
+    """
+    assert orient2d(a, b, c) == expected
+    assert orient2d(a, b, c) == _exact_orient2d(a, b, c)
+
+
+def test__orient2d_is_exact_for_nearly_collinear_points():
+    """
+    Points rounded onto a line are classified exactly.
+    """
+    for _ in range(2000):
+        a = Point(RANDOM.uniform(-1e3, 1e3), RANDOM.uniform(-1e3, 1e3))
+        b = Point(RANDOM.uniform(-1e3, 1e3), RANDOM.uniform(-1e3, 1e3))
+        t = RANDOM.random()
+        c = Point(a.x + t * (b.x - a.x), a.y + t * (b.y - a.y))
+
+        assert orient2d(a, b, c) == _exact_orient2d(a, b, c)
+        assert orient2d(b, a, c) == -orient2d(a, b, c)
+
+
+@pytest.mark.parametrize(
+    ("d", "expected"),
+    [
+        (Point(0, 0), 1),
+        (Point(0.5, 0.5), 1),
+        (Point(1, 0), 0),
+        (Point(0, -1), 0),
+        (Point(2, 2), -1),
+    ],
+)
+def test__incircle(d, expected):
+    """
+    A point inside the circle through three anticlockwise points is
+    positive, on it is zero, and outside it is negative.
+    """
+    a, b, c = Point(1, 0), Point(0, 1), Point(-1, 0)
+
+    assert incircle(a, b, c, d) == expected
+    assert incircle(a, c, b, d) == -expected
+
+
+def test__incircle_is_exact_for_nearly_cocircular_points():
+    """
+    Points very close to the circle are classified exactly.
+    """
+    square = [Point(0.1, 0.1), Point(0.7, 0.1), Point(0.7, 0.7)]
+    for _ in range(2000):
+        shift = RANDOM.uniform(-1e-15, 1e-15)
+        d = Point(0.1 + shift, 0.7 - shift)
+
+        assert incircle(*square, d) == _exact_incircle(*square, d)
@@ -0,0 +1,86 @@
+"""
+Tests for the ``geometry/profiling.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+
+import geometry
+from geometry.line import Line
+from geometry.point import Point
+from geometry.profiling import profile
+
+
+def test__profile_counts_calls_to_operations():
+    """
+    Calls to point and line operations are counted while a profile is active,
+    including properties and operations called by other operations.
+    """
+    line = Line(Point(0, 0), Point(1, 1))
+
+    with geometry.profile() as stats:
+        Point(1, 2) + Point(3, 4)
+        Point(1, 2).rotate(by=math.pi, around=Point(0, 0))
+        line.contains(Point(0.5, 0.5))
+        _ = line.length
+
+    assert stats.snapshot() == {
+        "Point.__add__": {"calls": 2},
+        "Point.__sub__": {"calls": 1},
+        "Point.rotate": {"calls": 1},
+        "Point.transform": {"calls": 1},
+        "Line.contains": {"calls": 1},
+        "Line.length": {"calls": 1},
+    }
+
+
+def test__profile_can_time_calls():
+    """
+    The time spent in each operation is recorded when timing is on.
+    """
+    with profile(timing=True) as stats:
+        for _ in range(10):
+            Line(0, 1).rotate(1)
+
+    snapshot = stats.snapshot()
+    assert snapshot["Line.rotate"]["calls"] == 10
+    assert snapshot["Line.rotate"]["seconds"] > 0
+    assert (
+        snapshot["Line.rotate"]["seconds"]
+        >= snapshot["Point.transform"]["seconds"]
+    )
+
+
+def test__profiles_can_be_nested_and_reset():
+    """
+    Each nested profile counts the calls made while it is active.
+    """
+    with profile() as outer:
+        Point(1, 2) * 3
+        with profile(timing=True) as inner:
+            Point(1, 2) * 3
+        Point(1, 2) * 3
+
+    assert outer.calls["Point.__mul__"] == 3
+    assert inner.calls["Point.__mul__"] == 1
+    assert "seconds" not in outer.snapshot()["Point.__mul__"]
+
+    outer.reset()
+    assert outer.snapshot() == {}
+
+
+def test__profile_restores_the_operations():
+    """
+    The operations are not wrapped once every profile has exited.
+    """
+    rotate, length = Point.rotate, Line.__dict__["length"]
+
+    with profile() as stats:
+        assert Point.rotate is not rotate
+    Point(1, 2).rotate(by=1, around=Point(0, 0))
+    _ = Line(0, 1).length
+
+    assert Point.rotate is rotate
+    assert Line.__dict__["length"] is length
+    assert stats.snapshot() == {}
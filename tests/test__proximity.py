@@ -0,0 +1,95 @@
+"""
+Tests for the ``geometry/proximity.py`` module.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+
+import pytest
+
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.proximity import Pair, closest_pair, pairs_within
+
+RANDOM = random.Random(15)  # noqa: S311
+SCATTERED = [
+    Point(RANDOM.uniform(-100, 100), RANDOM.uniform(-100, 100))
+    for _ in range(500)
+]
+GRID = [Point(RANDOM.randint(0, 30), RANDOM.randint(0, 30)) for _ in range(300)]
+UNIQUE_GRID = list(dict.fromkeys(GRID))
+
+
+def _all_pairs(points: list[Point]) -> list[Pair]:
+    """
+    Return every pair of points, ordered by their positions.
+    """
+    return [
+        Pair(i, j, math.hypot(first.x - second.x, first.y - second.y))
+        for (i, first), (j, second) in itertools.combinations(
+            enumerate(points), 2
+        )
+    ]
+
+
+@pytest.mark.parametrize("points", [SCATTERED, GRID, UNIQUE_GRID])
+def test__closest_pair_matches_brute_force(points):
+    """
+    The closest pair is the first of the pairs with the least distance.
+    """
+    expected = min(
+        _all_pairs(points), key=lambda pair: (pair.distance, pair.first)
+    )
+
+    assert closest_pair(points) == expected
+    assert closest_pair(PointArray.from_points(points)) == expected
+
+
+@pytest.mark.parametrize(
+    ("points", "expected"),
+    [
+        ([], None),
+        ([Point(1, 1)], None),
+        ([Point(0, 0), Point(3, 4)], Pair(0, 1, 5.0)),
+        ([Point(0, 0), Point(5, 5), Point(1, 1), Point(5, 5)], Pair(1, 3, 0)),
+        ([Point(i, 0) for i in range(10)], Pair(0, 1, 1.0)),
+        ([Point(0, i) for i in range(10, 0, -1)], Pair(0, 1, 1.0)),
+    ],
+)
+def test__closest_pair(points, expected):
+    """
+    The closest pair handles too few points, duplicates and collinear points.
+    """
+    assert closest_pair(points) == expected
+
+
+@pytest.mark.parametrize("points", [SCATTERED, GRID])
+@pytest.mark.parametrize("distance", [0, 1, 2.5, 10])
+def test__pairs_within_matches_brute_force(points, distance):
+    """
+    The pairs found are exactly the pairs within the distance.
+    """
+    assert pairs_within(points, distance) == [
+        pair for pair in _all_pairs(points) if pair.distance <= distance
+    ]
+
+
+def test__pairs_within_is_inclusive():
+    """
+    Points exactly the distance apart are a pair.
+    """
+    points = [Point(0, 0), Point(3, 4), Point(6, 8.5)]
+
+    assert pairs_within(points, 5) == [Pair(0, 1, 5.0)]
+    assert pairs_within(iter(points), 4.9) == []
+
+
+def test__pairs_within_needs_a_positive_distance():
+    """
+    The distance cannot be negative.
+    """
+    with pytest.raises(ValueError):
+        pairs_within([Point(0, 0)], -1)
@@ -0,0 +1,162 @@
+"""
+Tests for the ``geometry/quantised.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.quantised import Grid, QuantisedArray, QuantisedPoint
+
+RANDOM = random.Random(24)  # noqa: S311
+GRID = Grid(1e-7)
+
+
+def test__grid_round_trips_points_on_it():
+    """
+    Points on the grid convert to quantised points and back exactly, and
+    others move by at most half a step.
+    """
+    for _ in range(1000):
+        point = Point(
+            round(RANDOM.uniform(-180, 180), 7),
+            round(RANDOM.uniform(-90, 90), 7),
+        )
+
+        assert GRID.restore(GRID.quantise(point)) == point
+
+    point = Point(0.123456789, -1.987654321)
+    restored = GRID.restore(GRID.quantise(point))
+
+    assert GRID.quantise(point) == QuantisedPoint(1234568, -19876543)
+    assert abs(restored.x - point.x) <= 0.5e-7
+    assert abs(restored.y - point.y) <= 0.5e-7
+
+
+def test__grid_checks_its_step():
+    """
+    A grid step must be a positive finite number.
+    """
+    for step in (0, -1, math.inf):
+        with pytest.raises(ValueError):
+            Grid(step)
+    assert Grid(0.25) == Grid(0.25)
+    assert Grid(0.25).step == 0.25
+    assert str(Grid(0.5)) == "Grid(0.5)"
+
+
+def test__arithmetic_stays_on_the_grid():
+    """
+    Adding and subtracting are exact and scaling snaps to the grid.
+    """
+    a, b = QuantisedPoint(10, -3), QuantisedPoint(4, 7)
+
+    assert a + b == QuantisedPoint(14, 4)
+    assert a - b == QuantisedPoint(6, -10)
+    assert -a == QuantisedPoint(-10, 3)
+    assert a * 0.25 == QuantisedPoint(2, -1)
+    assert 3 * b == QuantisedPoint(12, 21)
+    with pytest.raises(TypeError):
+        a + Point(1, 1)
+
+
+def test__quantised_points_are_not_points():
+    """
+    A quantised point never equals or shares a dict key with the point of
+    the same numbers, as one is in grid steps and the other in units.
+    """
+    quantised, point = QuantisedPoint(1, 2), Point(1, 2)
+
+    assert quantised != point
+    assert point != quantised
+    assert not quantised == point
+    assert quantised == QuantisedPoint(1, 2)
+    assert hash(quantised) == hash(QuantisedPoint(1, 2))
+    assert len({quantised: "grid", point: "units"}) == 2
+
+
+@pytest.mark.parametrize(
+    ("angle", "expected"),
+    [
+        (math.pi / 2, QuantisedPoint(0, 100)),
+        (math.pi, QuantisedPoint(-100, 0)),
+        (-math.pi / 2, QuantisedPoint(0, -100)),
+        (2 * math.pi, QuantisedPoint(100, 0)),
+    ],
+)
+def test__rotate_by_quarter_turns(angle, expected):
+    """
+    Quarter turns land exactly on the grid.
+    """
+    assert QuantisedPoint(100, 0).rotate(by=angle) == expected
+
+
+def test__rotate_is_reversible():
+    """
+    Rotating a quantised point and rotating it back returns the same point,
+    and so the same hash, while staying close to the exact rotation.
+    """
+    for _ in range(2000):
+        point = QuantisedPoint(
+            RANDOM.randint(-(10**9), 10**9), RANDOM.randint(-(10**9), 10**9)
+        )
+        around = QuantisedPoint(RANDOM.randint(-1000, 1000), 0)
+        angle = RANDOM.uniform(-10, 10)
+        rotated = point.rotate(by=angle, around=around)
+        exact = Point(*point).rotate(by=angle, around=Point(*around))
+
+        assert rotated.rotate(by=-angle, around=around) == point
+        assert hash(rotated.rotate(by=-angle, around=around)) == hash(point)
+        assert abs(rotated.x - exact.x) <= 3
+        assert abs(rotated.y - exact.y) <= 3
+
+
+def test__quantised_arrays_pack_their_coordinates():
+    """
+    Coordinates are stored as 32-bit integers when they fit and 64-bit
+    integers otherwise.
+    """
+    small = QuantisedArray([1, 2, 3], [-4, 5, 6])
+    large = QuantisedArray([1, 2**40], [0, 0])
+
+    assert small.xs.typecode == "i"
+    assert small.nbytes == 24
+    assert large.xs.typecode == "q"
+    assert large.ys.typecode == "i"
+    assert list(small) == [
+        QuantisedPoint(1, -4),
+        QuantisedPoint(2, 5),
+        QuantisedPoint(3, 6),
+    ]
+    assert small[1] == QuantisedPoint(2, 5)
+    with pytest.raises(ValueError):
+        QuantisedArray([1], [])
+
+
+def test__quantised_arrays_match_quantised_points():
+    """
+    Batches convert, move and rotate the same as each of their points.
+    """
+    points = [
+        Point(RANDOM.uniform(-180, 180), RANDOM.uniform(-90, 90))
+        for _ in range(500)
+    ]
+    quantised = GRID.quantise_many(PointArray.from_points(points))
+    single = [GRID.quantise(point) for point in points]
+    offset = QuantisedPoint(5, -5)
+
+    assert quantised == QuantisedArray.from_points(single)
+    assert GRID.quantise_many(points) == quantised
+    assert GRID.restore_many(quantised) == PointArray.from_points(
+        GRID.restore(point) for point in single
+    )
+    assert list(quantised + offset) == [point + offset for point in single]
+    assert list(quantised - offset) == [point - offset for point in single]
+    assert list(quantised.rotate(by=1, around=offset)) == [
+        point.rotate(by=1, around=offset) for point in single
+    ]
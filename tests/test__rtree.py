@@ -0,0 +1,187 @@
+"""
+Tests for the ``geometry/rtree.py`` module.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from geometry.kdtree import Neighbour
+from geometry.line import Line
+from geometry.point import Point
+from geometry.rtree import RTree
+
+
+def _random_geometry(rng: random.Random) -> Point | Line:
+    start = Point(rng.uniform(0, 100), rng.uniform(0, 100))
+    if rng.random() < 0.5:
+        return start
+
+    return Line(start, start + Point(rng.uniform(-5, 5), rng.uniform(-5, 5)))
+
+
+def _distance(geometry: Point | Line, point: Point) -> float:
+    if isinstance(geometry, Point):
+        return math.dist(geometry, point)
+
+    return geometry.distance_to(point)
+
+
+def _in_box(geometry: Point | Line, min_point: Point, max_point: Point) -> bool:
+    if isinstance(geometry, Point):
+        return (
+            min_point.x <= geometry.x <= max_point.x
+            and min_point.y <= geometry.y <= max_point.y
+        )
+
+    return geometry.crosses_box(min_point, max_point)
+
+
+def _assert_matches_a_scan(
+    tree: RTree,
+    expected: dict[int, Point | Line],
+    rng: random.Random,
+) -> None:
+    assert len(tree) == len(expected)
+    assert dict((i, tree[i]) for i in tree) == expected
+
+    for _ in range(10):
+        query = Point(rng.uniform(-10, 110), rng.uniform(-10, 110))
+        radius = rng.uniform(0, 20)
+        min_point = Point(rng.uniform(0, 80), rng.uniform(0, 80))
+        max_point = min_point + rng.uniform(0, 30)
+        distances = sorted(
+            (_distance(geometry, query), i) for i, geometry in expected.items()
+        )
+
+        assert [n.index for n in tree.nearest(query, k=3)] == [
+            i for _, i in distances[:3]
+        ]
+        assert sorted(tree.within_radius(query, radius)) == sorted(
+            i for d, i in distances if d <= radius
+        )
+        assert sorted(tree.within_box(min_point, max_point)) == sorted(
+            i
+            for i, geometry in expected.items()
+            if _in_box(geometry, min_point, max_point)
+        )
+
+
+def test__rtree_starts_empty():
+    """
+    A new tree has nothing in it.
+    """
+    tree = RTree()
+
+    assert len(tree) == 0
+    assert tree.nearest(Point(0, 0)) == []
+    assert tree.within_box(Point(0, 0), Point(1, 1)) == []
+    assert tree.within_radius(Point(0, 0), 1) == []
+
+
+def test__rtree_stores_points_and_lines_against_ids():
+    """
+    Points and lines can be inserted, looked up, and removed by id.
+    """
+    tree = RTree()
+    tree.insert("car", Point(1, 1))
+    tree.insert("road", Line(Point(0, 3), Point(4, 3)))
+
+    assert "car" in tree
+    assert tree["road"] == Line(Point(0, 3), Point(4, 3))
+    assert tree.nearest(Point(2, 4), k=2) == [
+        Neighbour("road", Point(2, 3), 1.0),
+        Neighbour("car", Point(1, 1), math.sqrt(10)),
+    ]
+    assert tree.remove("car") == Point(1, 1)
+    assert "car" not in tree
+    assert list(tree) == ["road"]
+
+
+def test__rtree_rejects_bad_ids_and_capacities():
+    """
+    Ids must be unique and present, and nodes must hold enough children.
+    """
+    tree = RTree()
+    tree.insert(1, Point(0, 0))
+
+    with pytest.raises(ValueError):
+        tree.insert(1, Point(1, 1))
+    with pytest.raises(KeyError):
+        tree.remove(2)
+    with pytest.raises(KeyError):
+        tree.update(2, Point(1, 1))
+    with pytest.raises(ValueError):
+        RTree.bulk_load([(1, Point(0, 0)), (1, Point(1, 1))])
+    with pytest.raises(ValueError):
+        RTree(max_entries=3)
+
+
+@pytest.mark.parametrize("max_entries", [4, 16])
+def test__rtree_matches_a_scan_under_churn(max_entries: int):
+    """
+    Queries match scanning every entry while entries are inserted, moved, and
+    removed.
+    """
+    rng = random.Random(max_entries)  # noqa: S311
+    tree = RTree(max_entries=max_entries)
+    expected: dict[int, Point | Line] = {}
+    next_id = 0
+
+    for _ in range(6):
+        for _ in range(150):
+            action = rng.random()
+            if action < 0.5 or not expected:
+                expected[next_id] = _random_geometry(rng)
+                tree.insert(next_id, expected[next_id])
+                next_id += 1
+            elif action < 0.8:
+                id_ = rng.choice(list(expected))
+                moved = expected[id_] + Point(rng.uniform(-2, 2), 0)
+                expected[id_] = moved
+                tree.update(id_, moved)
+            else:
+                id_ = rng.choice(list(expected))
+                assert tree.remove(id_) == expected.pop(id_)
+
+        _assert_matches_a_scan(tree, expected, rng)
+
+    for id_ in list(expected):
+        tree.remove(id_)
+        del expected[id_]
+    _assert_matches_a_scan(tree, expected, rng)
+
+
+def test__rtree_can_be_bulk_loaded():
+    """
+    A bulk-loaded tree answers queries and can change afterwards.
+    """
+    rng = random.Random(0)  # noqa: S311
+    expected = {i: _random_geometry(rng) for i in range(500)}
+    tree = RTree.bulk_load(expected.items(), max_entries=8)
+    _assert_matches_a_scan(tree, expected, rng)
+
+    for i in range(0, 500, 3):
+        tree.remove(i)
+        del expected[i]
+    tree.insert(500, Point(50, 50))
+    expected[500] = Point(50, 50)
+    _assert_matches_a_scan(tree, expected, rng)
+
+
+def test__rtree_can_be_bulk_loaded_with_nothing():
+    """
+    Bulk loading no items gives an empty tree that can be added to.
+    """
+    tree = RTree.bulk_load([])
+
+    assert len(tree) == 0
+    assert tree.nearest(Point(0, 0)) == []
+    assert tree.within_box(Point(0, 0), Point(1, 1)) == []
+
+    tree.insert("car", Point(1, 1))
+
+    assert tree.within_box(Point(0, 0), Point(1, 1)) == ["car"]
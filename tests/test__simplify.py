@@ -0,0 +1,172 @@
+"""
+Tests for the ``geometry/simplify.py`` module.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+from collections.abc import Iterator
+
+import pytest
+
+from geometry.line import Line
+from geometry.point import Point
+from geometry.simplify import (
+    douglas_peucker,
+    simplify_stream,
+    visvalingam_whyatt,
+)
+
+RANDOM = random.Random(17)  # noqa: S311
+TRACE = [
+    Point(i / 10, math.sin(i / 20) + RANDOM.uniform(-0.05, 0.05))
+    for i in range(2000)
+]
+ZIGZAG = [Point(0, 0), Point(1, 0.1), Point(2, 0), Point(3, 5), Point(4, 6)]
+
+
+def _within_tolerance(points, simplified, tolerance) -> bool:
+    """
+    Return whether every point is within a distance of the simplified path,
+    on the line between the kept points either side of it.
+    """
+    kept = [points.index(point) for point in simplified]
+    return all(
+        Line(points[first], points[last]).distance_to(points[i]) <= tolerance
+        for first, last in itertools.pairwise(kept)
+        for i in range(first, last)
+    )
+
+
+@pytest.mark.parametrize(
+    ("tolerance", "expected"),
+    [
+        (0, ZIGZAG),
+        (0.2, [Point(0, 0), Point(2, 0), Point(3, 5), Point(4, 6)]),
+        (10, [Point(0, 0), Point(4, 6)]),
+    ],
+)
+def test__douglas_peucker(tolerance, expected):
+    """
+    Points further than the tolerance from the simplified path are kept.
+    """
+    assert douglas_peucker(ZIGZAG, tolerance) == expected
+
+
+@pytest.mark.parametrize("tolerance", [0.01, 0.1, 0.5])
+def test__douglas_peucker_keeps_long_traces_within_tolerance(tolerance):
+    """
+    Long traces are simplified to within the tolerance without recursing.
+    """
+    simplified = douglas_peucker(iter(TRACE), tolerance)
+
+    assert simplified[0] == TRACE[0]
+    assert simplified[-1] == TRACE[-1]
+    assert len(simplified) < len(TRACE)
+    assert _within_tolerance(TRACE, simplified, tolerance)
+    assert douglas_peucker([Point(i, 0) for i in range(5000)], 1e-9) == [
+        Point(0, 0),
+        Point(4999, 0),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("tolerance", "expected"),
+    [
+        (0, ZIGZAG),
+        (0.15, [Point(0, 0), Point(2, 0), Point(3, 5), Point(4, 6)]),
+        (100, [Point(0, 0), Point(4, 6)]),
+    ],
+)
+def test__visvalingam_whyatt(tolerance, expected):
+    """
+    Points with smaller triangles than the tolerance are dropped.
+    """
+    assert visvalingam_whyatt(ZIGZAG, tolerance) == expected
+
+
+def test__visvalingam_whyatt_drops_the_smallest_areas_first():
+    """
+    Raising the tolerance only ever drops more points.
+    """
+    previous = TRACE
+    for tolerance in (0.001, 0.01, 0.1, 1):
+        simplified = visvalingam_whyatt(TRACE, tolerance)
+        assert set(simplified) <= set(previous)
+        previous = simplified
+
+    assert previous[0] == TRACE[0]
+    assert previous[-1] == TRACE[-1]
+
+
+@pytest.mark.parametrize("simplify", [douglas_peucker, visvalingam_whyatt])
+def test__short_paths_are_kept(simplify):
+    """
+    Paths of two points or fewer cannot be simplified.
+    """
+    assert simplify([], 1) == []
+    assert simplify([Point(0, 0)], 1) == [Point(0, 0)]
+    assert simplify([Point(0, 0), Point(1, 1)], 1) == [
+        Point(0, 0),
+        Point(1, 1),
+    ]
+    with pytest.raises(ValueError):
+        simplify(ZIGZAG, -1)
+
+
+@pytest.mark.parametrize("lookahead", [3, 10, 100, 5000])
+@pytest.mark.parametrize("tolerance", [0.05, 0.5])
+def test__simplify_stream_keeps_within_tolerance(lookahead, tolerance):
+    """
+    Simplifying a stream a window at a time keeps every point within the
+    tolerance.
+    """
+    simplified = list(
+        simplify_stream(iter(TRACE), tolerance, lookahead=lookahead)
+    )
+
+    assert simplified[0] == TRACE[0]
+    assert simplified[-1] == TRACE[-1]
+    assert len(simplified) < len(TRACE)
+    assert _within_tolerance(TRACE, simplified, tolerance)
+
+
+def test__simplify_stream_matches_douglas_peucker_for_short_paths():
+    """
+    A path that fits in one window is simplified as a whole.
+    """
+    assert list(simplify_stream(TRACE, 0.1, lookahead=len(TRACE) + 1)) == (
+        douglas_peucker(TRACE, 0.1)
+    )
+    assert list(simplify_stream([], 0.1)) == []
+
+
+def test__simplify_stream_reads_lazily():
+    """
+    Points are simplified without reading the whole stream.
+    """
+
+    def endless() -> Iterator[Point]:
+        for i in range(10**9):
+            yield Point(i, (i // 50) % 2)
+
+    stream = simplify_stream(endless(), 0.1, lookahead=64)
+
+    assert [next(stream) for _ in range(4)] == [
+        Point(0, 0),
+        Point(49, 0),
+        Point(50, 1),
+        Point(99, 1),
+    ]
+
+
+def test__simplify_stream_checks_its_arguments():
+    """
+    The tolerance cannot be negative and the lookahead must fit a triangle.
+    """
+    with pytest.raises(ValueError):
+        simplify_stream(TRACE, -1)
+    with pytest.raises(ValueError):
+        simplify_stream(TRACE, 1, lookahead=2)
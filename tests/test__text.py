@@ -0,0 +1,171 @@
+"""
+Tests for the ``geometry/text.py`` module.
+"""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from geometry.line import Line
+from geometry.line_array import LineArray
+from geometry.point import Point
+from geometry.point_array import PointArray
+from geometry.text import (
+    line_batches,
+    point_batches,
+    read_csv_lines,
+    read_csv_points,
+    read_wkt,
+    write_csv_lines,
+    write_csv_points,
+    write_wkt,
+)
+
+POINTS = [Point(0, 0), Point(1.5, -2), Point(0.1, 1e-300)]
+LINES = [
+    Line(Point(0, 0), Point(1, 1)),
+    Line(Point(-1.5, 2), Point(0.1, -4.25)),
+]
+
+
+def test__points_can_be_written_and_read_as_csv():
+    """
+    Points can be written as CSV and read back exactly.
+    """
+    target = io.StringIO()
+
+    assert write_csv_points(target, iter(POINTS)) == len(POINTS)
+    assert target.getvalue().splitlines()[0] == "x,y"
+    assert list(read_csv_points(io.StringIO(target.getvalue()))) == POINTS
+
+
+def test__lines_can_be_written_and_read_as_csv():
+    """
+    Lines can be written as CSV and read back exactly.
+    """
+    target = io.StringIO()
+
+    assert write_csv_lines(target, iter(LINES)) == len(LINES)
+    assert target.getvalue().splitlines()[0] == "start_x,start_y,end_x,end_y"
+    assert list(read_csv_lines(io.StringIO(target.getvalue()))) == LINES
+
+
+def test__csv_columns_can_be_chosen():
+    """
+    The coordinates can be read from any columns, in any order.
+    """
+    source = ["id,lat,lon\n", "a,1,2\n", "\n", "b,3,4\n"]
+
+    assert list(read_csv_points(source, columns=("lon", "lat"))) == [
+        Point(2, 1),
+        Point(4, 3),
+    ]
+    assert list(read_csv_points([])) == []
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        ["x,z\n", "1,2\n"],
+        ["x,y\n", "1,two\n"],
+        ["x,y\n", "1\n"],
+    ],
+)
+def test__invalid_csv_cannot_be_read(source):
+    """
+    CSV with a missing column or a value that is not a number cannot be read.
+    """
+    with pytest.raises(ValueError):
+        list(read_csv_points(source))
+
+
+def test__csv_is_read_lazily():
+    """
+    Rows are only read as the points are needed.
+    """
+    source = iter(["x,y\n", "1,2\n", "3,4\n", "not,valid\n"])
+    points = read_csv_points(source)
+
+    assert next(points) == Point(1, 2)
+    assert next(source) == "3,4\n"
+
+
+def test__points_and_lines_can_be_written_and_read_as_wkt():
+    """
+    Points and lines can be written as WKT and read back exactly.
+    """
+    geometries = [*POINTS, *LINES]
+    target = io.StringIO()
+
+    assert write_wkt(target, iter(geometries)) == len(geometries)
+    assert target.getvalue().splitlines()[:2] == [
+        "POINT (0 0)",
+        "POINT (1.5 -2)",
+    ]
+    assert list(read_wkt(io.StringIO(target.getvalue()))) == geometries
+
+
+def test__wkt_linestrings_are_read_as_segments():
+    """
+    A linestring through several points is read as a line per segment.
+    """
+    source = ["point(1 2)\n", "  \n", "LINESTRING (0 0, 1 0,1 1)\n"]
+
+    assert list(read_wkt(source)) == [
+        Point(1, 2),
+        Line(Point(0, 0), Point(1, 0)),
+        Line(Point(1, 0), Point(1, 1)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "POINT (1)",
+        "POINT (1 2, 3 4)",
+        "POINT (1 two)",
+        "POINT (1 2) extra",
+        "LINESTRING (1 2)",
+        "POLYGON ((0 0, 1 0, 1 1, 0 0))",
+        "POINT EMPTY",
+    ],
+)
+def test__invalid_wkt_cannot_be_read(text):
+    """
+    Text that is not a point or linestring cannot be read.
+    """
+    with pytest.raises(ValueError):
+        list(read_wkt([text]))
+
+
+def test__files_can_be_transformed_as_a_stream():
+    """
+    A reader can feed a writer directly.
+    """
+    source = io.StringIO("x,y\n1,2\n3,4\n")
+    target = io.StringIO()
+
+    write_csv_points(target, (point * 2 for point in read_csv_points(source)))
+
+    assert target.getvalue() == "x,y\n2.0,4.0\n6.0,8.0\n"
+
+
+def test__points_and_lines_can_be_batched():
+    """
+    Points and lines can be collected into arrays of a fixed size.
+    """
+    points = [Point(i, -i) for i in range(5)]
+    lines = [Line(point, 0) for point in points]
+
+    assert list(point_batches(iter(points), 2)) == [
+        PointArray.from_points(points[0:2]),
+        PointArray.from_points(points[2:4]),
+        PointArray.from_points(points[4:5]),
+    ]
+    assert list(line_batches(iter(lines), 3)) == [
+        LineArray.from_lines(lines[0:3]),
+        LineArray.from_lines(lines[3:5]),
+    ]
+    assert list(point_batches([])) == []